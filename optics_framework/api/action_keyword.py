@@ -1,13 +1,16 @@
 from functools import wraps
+from concurrent.futures import Future, ThreadPoolExecutor
+import atexit
 import collections
 import inspect
 import shlex
+import threading
 import time
 import json
 from typing import Callable, Optional, Any, Tuple, List, Dict
 from optics_framework.common.logging_config import internal_logger
 from optics_framework.common.optics_builder import OpticsBuilder
-from optics_framework.common.strategies import StrategyManager
+from optics_framework.common.strategies import LocateResult, StrategyManager
 from optics_framework.common.base_factory import InstanceFallback
 from optics_framework.common import utils
 from optics_framework.common.ai_self_heal import (
@@ -31,9 +34,72 @@ _DROPDOWN_LIST_CLASS_TOKENS = (
 _DROPDOWN_SWIPE_OVERLAP_FACTOR = 0.5
 
 # Per-check timeout for assert_visibility while polling for the option, matching the budget
-# scroll_until_element_appears/swipe_until_element_appears use for the same purpose.
+# scroll_until_element_appears/swipe_until_element_appears give their first presence check.
 _DROPDOWN_OPTION_CHECK_TIMEOUT = "3"
 
+# Presence-check budgets for swipe_until_element_appears/scroll_until_element_appears: the
+# first check gets the full window (the element may still be rendering), later checks run
+# right after a gesture that visibly changed the page, so one short pass is enough.
+_UNTIL_APPEARS_FIRST_CHECK_TIMEOUT = "3"
+_UNTIL_APPEARS_CHECK_TIMEOUT = "1"
+# Pause before re-swiping when the page source did not change (gesture still animating or
+# list at its end); the presence check is skipped since nothing new can be on screen.
+_UNTIL_APPEARS_UNCHANGED_BACKOFF_S = 0.25
+# Fixed settle delay used instead when no page source is available to compare.
+_UNTIL_APPEARS_SETTLE_S = 1.0
+# Text/image targets can be matched by OCR/template strategies on the screenshot, which may
+# change while the page source does not (canvas, WebView, video, static TV hierarchies), so
+# only this many consecutive checks are skipped on an unchanged page before checking anyway.
+_UNTIL_APPEARS_VISUAL_MAX_SKIPS = 1
+_UNTIL_APPEARS_VISUAL_TYPES = ("Text", "Image")
+
+# Default window (seconds) in which a keyword reuses the previous keyword's screenshot
+# instead of capturing again; overridden by the ``screenshot_cache_ttl`` config key.
+_SCREENSHOT_CACHE_TTL_S = 0.3
+
+
+class _ScreenshotWriter:
+    """Encodes and writes debug screenshots off the keyword hot path.
+
+    Saved frames are only read post-mortem, so the JPEG encode + disk write runs on a
+    small thread pool and the keyword returns as soon as the frame is captured. At most
+    ``max_pending`` writes are queued; on overflow the oldest not-yet-started write is
+    dropped so a slow disk never stalls the run. Queued writes are flushed at exit.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 16) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="optics-screenshot")
+        self._pending: "collections.deque[Future]" = collections.deque()
+        self._max_pending = max_pending
+        self._lock = threading.Lock()
+        atexit.register(self._pool.shutdown, wait=True)
+
+    def submit(self, img: Any, name: str, **kwargs: Any) -> None:
+        with self._lock:
+            while self._pending and self._pending[0].done():
+                self._pending.popleft()
+            if len(self._pending) >= self._max_pending and self._pending.popleft().cancel():
+                internal_logger.debug("Screenshot write queue full; dropped oldest pending write.")
+            future = self._pool.submit(utils.save_screenshot, img, name, **kwargs)
+            future.add_done_callback(self._log_failure)
+            self._pending.append(future)
+
+    def flush(self) -> None:
+        """Block until every queued write has finished."""
+        with self._lock:
+            pending, self._pending = list(self._pending), collections.deque()
+        for future in pending:
+            if not future.cancelled():
+                future.exception()
+
+    @staticmethod
+    def _log_failure(future: Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            internal_logger.debug(f"Background screenshot write failed: {future.exception()}")
+
+
+_screenshot_writer = _ScreenshotWriter()
+
 
 def _parse_aoi_param(param: Any, default_value: float) -> float:
     if param is None or str(param).strip() in ('', 'None', 'none'):
@@ -58,7 +124,7 @@ def _maybe_save_aoi_screenshot(
     func_name: str,
 ) -> None:
     annotated = utils.annotate_aoi_region(screenshot_np, aoi_x, aoi_y, aoi_width, aoi_height)
-    utils.save_screenshot(annotated, f"{func_name}_with_aoi", output_dir=execution_dir)
+    _screenshot_writer.submit(annotated, f"{func_name}_with_aoi", output_dir=execution_dir)
 
 
 def _locate_element(
@@ -73,6 +139,12 @@ def _locate_element(
     return strategy_manager.locate(element, index=index)
 
 
+def _prepend_memoized(memoized: LocateResult, locate: Callable[[], Any]):
+    """Yield the memoized result first; only run a fresh locate if the action rejects it."""
+    yield memoized
+    yield from locate()
+
+
 def _save_annotated_for_result(
     result: Any,
     screenshot_np: Any,
@@ -81,7 +153,7 @@ def _save_annotated_for_result(
 ) -> None:
     annotated = getattr(result, "annotated_frame", None)
     if annotated is not None:
-        utils.save_screenshot(
+        _screenshot_writer.submit(
             annotated,
             f"{func_name}_image_detection_result",
             output_dir=execution_dir,
@@ -102,7 +174,7 @@ def _save_annotated_for_result(
     # screenshot's pixel space before drawing (no-op when the two already match).
     bbox = utils.scale_bboxes_for_screenshot([bbox], element_source, screenshot_np)[0]
     framed = utils.annotate(screenshot_np.copy(), [bbox])
-    utils.save_screenshot(
+    _screenshot_writer.submit(
         framed,
         f"{func_name}_element_detection_result",
         output_dir=execution_dir,
@@ -125,17 +197,21 @@ def _try_results_until_success(
     result_count = 0
     locate_error: Optional[OpticsError] = None
 
-    try:
-        results_list = list(results)
-    except OpticsError as e:
-        # The locate generator raises when no strategy yields a result; treat that
-        # as "no results" so self-heal below gets a chance, but keep the original
-        # error as the cause instead of losing it.
-        internal_logger.debug(f"Locate generator raised for '{element}' in '{func_name}': {e}")
-        results_list = []
-        locate_error = e
-
-    for result in results_list:
+    # Consume the locate generator lazily: later (slower) strategies only run when the
+    # action failed on every earlier result.
+    results_iter = iter(results)
+    while True:
+        try:
+            result = next(results_iter)
+        except StopIteration:
+            break
+        except OpticsError as e:
+            # The locate generator raises when no strategy yields a result; treat that
+            # as "no more results" so self-heal below gets a chance, but keep the original
+            # error as the cause instead of losing it.
+            internal_logger.debug(f"Locate generator raised for '{element}' in '{func_name}': {e}")
+            locate_error = e
+            break
         result_count += 1
         _save_annotated_for_result(result, screenshot_np, execution_dir, func_name)
         try:
@@ -226,7 +302,10 @@ def with_self_healing(func: Callable) -> Callable:
     def wrapper(self, element, *args, **kwargs):
         # Skip self-healing if 'located' is already provided (avoids double healing)
         if kwargs.get('located') is not None:
-            return func(self, element, *args, **kwargs)
+            try:
+                return func(self, element, *args, **kwargs)
+            finally:
+                self._invalidate_screenshot_cache()
 
         screenshot_np = self._capture_screenshot_safe()
         aoi_x, aoi_y, aoi_width, aoi_height, index, is_aoi_used = _parse_aoi_from_kwargs(kwargs)
@@ -236,14 +315,31 @@ def with_self_healing(func: Callable) -> Callable:
                 self.execution_dir, func.__name__,
             )
         self._save_screenshot_if_available(screenshot_np, f"pre-{func.__name__}")
-        results = _locate_element(
-            self.strategy_manager, element,
-            aoi_x, aoi_y, aoi_width, aoi_height, index, is_aoi_used,
-        )
-        return _try_results_until_success(
-            results, func, self, element, args, kwargs,
-            screenshot_np, self.execution_dir, func.__name__,
-        )
+        def locate():
+            return _locate_element(
+                self.strategy_manager, element,
+                aoi_x, aoi_y, aoi_width, aoi_height, index, is_aoi_used,
+            )
+        memoized = None if is_aoi_used else self._memoized_locate(element, index)
+        results = _prepend_memoized(memoized, locate) if memoized is not None else locate()
+        try:
+            return _try_results_until_success(
+                results, func, self, element, args, kwargs,
+                screenshot_np, self.execution_dir, func.__name__,
+            )
+        finally:
+            self._invalidate_screenshot_cache()
+    return wrapper
+
+
+def invalidates_screenshot_cache(func: Callable) -> Callable:
+    """Drop the cached screenshot once a keyword that drives the device returns."""
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self._invalidate_screenshot_cache()
     return wrapper
 
 
@@ -297,6 +393,15 @@ class ActionKeyword:
             self.element_source, self.text_detection, self.image_detection
         )
         self.execution_dir = builder.session_config.execution_output_path
+        # Short-TTL screenshot cache: back-to-back keywords against the same UI state reuse
+        # one frame. Entry is (monotonic capture time, frame hash, frame); any driver action
+        # clears it so a post-action keyword never sees a stale screen.
+        ttl = getattr(builder.session_config, "screenshot_cache_ttl", _SCREENSHOT_CACHE_TTL_S)
+        self.screenshot_ttl: float = ttl if isinstance(ttl, (int, float)) else _SCREENSHOT_CACHE_TTL_S
+        self._last_shot: Optional[Tuple[float, str, Any]] = None
+        # Last successful locate, keyed on (element, index, frame hash): lets a keyword that
+        # already located an element on the current frame skip a second strategy sweep.
+        self._located_memo: Optional[Tuple[Tuple[str, int, str], LocateResult]] = None
         # AI self-heal (last-resort fallback). Inert unless explicitly toggled on AND an
         # llm_models entry is enabled. Fetching the LLM is guarded: a misconfiguration
         # (e.g. the optics-framework[llm] extra missing) must disable the feature, not
@@ -487,17 +592,61 @@ class ActionKeyword:
         return " ".join(parts)
 
     def _capture_screenshot_safe(self) -> Any:
-        """Capture a screenshot, returning None on failure (e.g. secure/protected pages)."""
+        """Capture a screenshot, returning None on failure (e.g. secure/protected pages).
+
+        Reuses the previous frame when it was captured less than ``screenshot_ttl`` seconds
+        ago and no driver action has run since.
+        """
+        if self._last_shot is not None:
+            captured_at, _, frame = self._last_shot
+            if time.monotonic() - captured_at < self.screenshot_ttl:
+                return frame
         try:
-            return self.strategy_manager.capture_screenshot()
+            frame = self.strategy_manager.capture_screenshot()
         except Exception as e:
             internal_logger.warning(f"Screenshot capture failed, continuing without it: {e}")
+            self._last_shot = None
+            return None
+        if frame is not None and self.screenshot_ttl > 0:
+            self._last_shot = (time.monotonic(), utils.compute_frame_hash(frame), frame)
+        return frame
+
+    def _invalidate_screenshot_cache(self) -> None:
+        """Forget the cached frame; called after every keyword that acts on the device."""
+        self._last_shot = None
+        self._located_memo = None
+        # Every configured driver, not just the active one: a fallback driver may be next.
+        for driver in self.driver.instances:
+            driver.invalidate_ui_cache()
+
+    def _memoized_locate(self, element: str, index: int = 0) -> Optional[LocateResult]:
+        """Return the memoized locate result if it was found on the current (cached) frame."""
+        if self._located_memo is None or self._last_shot is None:
             return None
+        key, result = self._located_memo
+        return result if key == (element, index, self._last_shot[1]) else None
+
+    def _locate_first(self, element: str, index: int = 0) -> Optional[LocateResult]:
+        """Locate ``element`` on the current frame, stopping at the first strategy that finds it.
+
+        The result is memoized against the frame hash so an immediately following
+        self-healing keyword on the same element reuses it instead of re-locating.
+        """
+        memoized = self._memoized_locate(element, index)
+        if memoized is not None:
+            return memoized
+        try:
+            result = next(iter(self.strategy_manager.locate(element, index=index)), None)
+        except OpticsError:
+            return None
+        if result is not None and self._last_shot is not None:
+            self._located_memo = ((element, index, self._last_shot[1]), result)
+        return result
 
     def _save_screenshot_if_available(self, screenshot_np: Any, name: str) -> None:
-        """Save a screenshot only if one was successfully captured."""
+        """Queue a background save of the screenshot, only if one was successfully captured."""
         if screenshot_np is not None:
-            utils.save_screenshot(screenshot_np, name, output_dir=self.execution_dir)
+            _screenshot_writer.submit(screenshot_np, name, output_dir=self.execution_dir)
 
     # Click actions
     @with_self_healing
@@ -522,14 +671,15 @@ class ActionKeyword:
         """
         if isinstance(located, tuple):
             x, y = located
+            x, y = x + int(offset_x), y + int(offset_y)
             internal_logger.info(
-                f"Pressing at coordinates ({x + int(offset_x)}, {y + int(offset_y)}) with offset ({offset_x}, {offset_y})")
-            self.driver.press_coordinates(
-                x + int(offset_x), y + int(offset_y), event_name)
+                f"Pressing at coordinates ({x}, {y}) with offset ({offset_x}, {offset_y})")
+            self.driver.press_coordinates(x, y, event_name)
         else:
             internal_logger.info(f"Pressing element '{element}'")
             self.driver.press_element(located, int(repeat), event_name)
 
+    @invalidates_screenshot_cache
     def press_by_percentage(self, percent_x: str, percent_y: str, repeat: str = "1", event_name: Optional[str] = None) -> None:
         """
         Press an element by percentage coordinates.
@@ -545,6 +695,7 @@ class ActionKeyword:
             float(percent_x), float(percent_y), int(repeat), event_name
         )
 
+    @invalidates_screenshot_cache
     def press_by_coordinates(self, coor_x: str, coor_y: str, repeat: str = "1", event_name: Optional[str] = None) -> None:
         """
         Press an element by absolute coordinates.
@@ -559,6 +710,41 @@ class ActionKeyword:
         internal_logger.info(f'Pressing by coordinates: ({coor_x}, {coor_y})')
         self.driver.press_coordinates(int(coor_x), int(coor_y), event_name)
 
+    @invalidates_screenshot_cache
+    def press_elements(self, elements: str, event_name: Optional[str] = None) -> None:
+        """
+        Press several elements that are all on the current screen, in order.
+
+        Every element is located before anything is pressed, against one shared frame, so
+        the screenshot (and the OCR / feature pass) is paid once rather than per element.
+        Use it for elements on a static screen (form fields, checkboxes); if any element
+        is missing, nothing is pressed.
+
+        :param elements: Elements to press, separated by ``|`` (text, xpath or image).
+        :param event_name: The event triggering the presses, captured on the first press.
+        """
+        element_list = [el.strip() for el in elements.split('|') if el.strip()]
+        screenshot_np = self._capture_screenshot_safe()
+        self._save_screenshot_if_available(screenshot_np, "press_elements")
+        located = []
+        with self.strategy_manager.shared_capture():
+            for element in element_list:
+                result = self._locate_first(element)
+                if result is None:
+                    raise OpticsError(
+                        Code.E0201, message=f"Element '{element}' not found; none of {element_list} were pressed."
+                    )
+                located.append((element, result))
+        for i, (element, result) in enumerate(located):
+            press_event = event_name if i == 0 else None
+            if result.is_coordinates:
+                x, y = result.value
+                internal_logger.info(f"Pressing '{element}' at coordinates ({x}, {y})")
+                self.driver.press_coordinates(x, y, press_event)
+            else:
+                internal_logger.info(f"Pressing element '{element}'")
+                self.driver.press_element(result.value, 1, press_event)
+
 
     def detect_and_press(self, element: str, timeout: str = "30", event_name: Optional[str] = None) -> None:
         """
@@ -568,12 +754,18 @@ class ActionKeyword:
         :param timeout: Timeout for the detection operation.
         :param event_name: The event triggering the press.
         """
-        try:
-            result = self.verifier.validate_screen(
-                element, timeout, rule="any")
-        except Exception as e:
-            internal_logger.error(f"Error in detect_and_press: {e}")
-            result = False
+        # Probe the current frame first: when the element is already on screen the located
+        # value is memoized and press_element reuses it instead of running detection and
+        # then a second full locate sweep.
+        self._capture_screenshot_safe()
+        result = self._locate_first(element) is not None
+        if not result:
+            try:
+                result = self.verifier.validate_screen(
+                    element, timeout, rule="any")
+            except Exception as e:
+                internal_logger.error(f"Error in detect_and_press: {e}")
+                result = False
         if result:
             internal_logger.info(f'Element {element} detected. Performing Press ... ')
             self.press_element(element, event_name=event_name)
@@ -691,10 +883,10 @@ class ActionKeyword:
 
     def _safe_pagesource_hash(self) -> Optional[str]:
         """
-        indirect helper for `select_dropdown_option()`
+        indirect helper for `select_dropdown_option()` and the `*_until_element_appears` loops
 
         returns `None` instead of raising when page source isn't available, so the scroll
-        loop's "list stopped changing" check can't itself crash `select_dropdown_option`.
+        loop's "list stopped changing" check can't itself crash the calling keyword.
         """
         try:
             page_source, _ = self.strategy_manager.capture_pagesource()
@@ -726,13 +918,13 @@ class ActionKeyword:
         swipe_length = max(1, int(height * _DROPDOWN_SWIPE_OVERLAP_FACTOR))
 
         previous_hash = self._safe_pagesource_hash()
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
             self.driver.swipe(center_x, center_y, "up", swipe_length, event_name)
             time.sleep(1)
 
             current_hash = self._safe_pagesource_hash()
-            remaining = timeout - (time.time() - start_time)
+            remaining = deadline - time.monotonic()
             check_timeout = max(1, min(int(_DROPDOWN_OPTION_CHECK_TIMEOUT), int(remaining)))
             if self._find_option_element(option, timeout_str=str(check_timeout)):
                 self.press_element(option, event_name=event_name)
@@ -743,7 +935,59 @@ class ActionKeyword:
 
         _raise_option_not_found(dropdown_element, option, self._safe_get_interactive_elements() or [])
 
+    def _gesture_until_element_appears(
+        self, element: str, timeout: int, gesture: Callable[[], None],
+        raise_on_strategy_errors: bool = False,
+    ) -> bool:
+        """
+        indirect helper for `swipe_until_element_appears()` / `scroll_until_element_appears()`
+
+        Alternates presence checks with `gesture` until `element` is found or `timeout`
+        expires. Instead of sleeping a fixed interval after every gesture, the page source
+        is hashed: if it changed, one short presence check runs immediately; if it did not,
+        the check is skipped and the gesture retried after a brief backoff. Skipping is only
+        unconditional for page-source-only locators; text/image targets are still checked
+        after at most `_UNTIL_APPEARS_VISUAL_MAX_SKIPS` skipped gestures.
+        """
+        deadline = time.monotonic() + timeout
+        check_timeout: Optional[str] = _UNTIL_APPEARS_FIRST_CHECK_TIMEOUT
+        previous_hash = None
+        visual_target = utils.determine_element_type(element) in _UNTIL_APPEARS_VISUAL_TYPES
+        skipped = 0
+        while time.monotonic() < deadline:
+            if check_timeout is not None:
+                try:
+                    if self.verifier.assert_presence(element, timeout_str=check_timeout, rule="any"):
+                        return True
+                except OpticsError as e:
+                    if e.code != Code.E0201:
+                        raise
+                    # Don't hide configuration/strategy issues; scrolling won't fix these.
+                    if raise_on_strategy_errors and (
+                        "No strategies found" in e.message or "No valid strategies found" in e.message
+                    ):
+                        raise
+            gesture()
+            current_hash = self._safe_pagesource_hash()
+            if current_hash is None:
+                time.sleep(_UNTIL_APPEARS_SETTLE_S)
+                check_timeout = _UNTIL_APPEARS_CHECK_TIMEOUT
+            elif current_hash == previous_hash:
+                time.sleep(_UNTIL_APPEARS_UNCHANGED_BACKOFF_S)
+                if visual_target and skipped >= _UNTIL_APPEARS_VISUAL_MAX_SKIPS:
+                    check_timeout = _UNTIL_APPEARS_CHECK_TIMEOUT
+                    skipped = 0
+                else:
+                    check_timeout = None
+                    skipped += 1
+            else:
+                skipped = 0
+                check_timeout = _UNTIL_APPEARS_CHECK_TIMEOUT
+            previous_hash = current_hash
+        return False
+
     # Swipe and Scroll actions
+    @invalidates_screenshot_cache
     def swipe(self, coor_x: str, coor_y: str, direction: str = 'right', swipe_length: str = "50", event_name: Optional[str] = None) -> None:
         """
         Perform a swipe action in a specified direction.
@@ -759,6 +1003,7 @@ class ActionKeyword:
         internal_logger.info(f'Swiping from ({coor_x}, {coor_y}) to the {direction} with length {swipe_length}')
         self.driver.swipe(int(coor_x), int(coor_y), direction, int(swipe_length), event_name)
 
+    @invalidates_screenshot_cache
     def swipe_by_percentage(self, percent_x: str, percent_y: str, direction: str = 'right', swipe_length: str = "50", event_name: Optional[str] = None) -> None:
         """
         Perform a swipe action in a specified direction by percentage.
@@ -775,6 +1020,7 @@ class ActionKeyword:
         self.driver.swipe_percentage(int(percent_x), int(percent_y), direction, int(swipe_length), event_name)
 
     @DeprecationWarning
+    @invalidates_screenshot_cache
     def swipe_seekbar_to_right_android(self, element: str, event_name: Optional[str] = None) -> None:
         """
         Swipe a seekbar to the right.
@@ -786,7 +1032,9 @@ class ActionKeyword:
         internal_logger.info(f'Swiping seekbar element: {element} to the right')
         self.driver.swipe_element(element, 'right', 50, event_name)
 
-    def swipe_until_element_appears(self, element: str, direction: str, timeout: str, event_name: Optional[str] = None) -> None:
+    @invalidates_screenshot_cache
+    def swipe_until_element_appears(self, element: str, direction: str, timeout: str, event_name: Optional[str] = None,
+                                    batch_swipes: str = "1") -> None:
         """
         Swipe in a specified direction until an element appears.
 
@@ -794,23 +1042,21 @@ class ActionKeyword:
         :param direction: The swipe direction (up, down, left, right).
         :param timeout: Timeout until element search is performed.
         :param event_name: The event triggering the swipe.
+        :param batch_swipes: Swipes sent per gesture before the next presence check. Values
+            above 1 let drivers that support it (Appium) send them as one W3C Actions request,
+            at the cost of possibly swiping past the element. Default: 1.
         """
         screenshot_np = self._capture_screenshot_safe()
         self._save_screenshot_if_available(screenshot_np, "swipe_until_element_appears")
-        start_time = time.time()
-        found = False
-        while time.time() - start_time < int(timeout):
-            try:
-                result = self.verifier.assert_presence(
-                    element, timeout_str="3", rule="any")
-                if result:
-                    found = True
-                    break
-            except OpticsError as e:
-                if e.code != Code.E0201:
-                    raise
-            self.driver.swipe_percentage(10, 50, direction, 25, event_name)
-            time.sleep(3)
+        batch = max(1, int(batch_swipes))
+
+        def gesture() -> None:
+            if batch == 1:
+                self.driver.swipe_percentage(10, 50, direction, 25, event_name)
+            else:
+                self.driver.swipe_percentage_batch(10, 50, direction, 25, batch, event_name)
+
+        found = self._gesture_until_element_appears(element, int(timeout), gesture)
         if not found:
             raise OpticsError(Code.E0201, message=f"Element '{element}' did not appear after swiping {direction} for {timeout}s.")
 
@@ -838,6 +1084,7 @@ class ActionKeyword:
             self.driver.swipe_element(
                 located, direction, int(swipe_length), event_name)
 
+    @invalidates_screenshot_cache
     def scroll(self, direction: str, event_name: Optional[str] = None) -> None:
         """
         Perform a scroll action in a specified direction.
@@ -850,6 +1097,7 @@ class ActionKeyword:
         internal_logger.info(f"Scrolling {direction} with event {event_name}")
         self.driver.scroll(direction, 1000, event_name)
 
+    @invalidates_screenshot_cache
     def scroll_until_element_appears(self, element: str, direction: str, timeout: str, event_name: Optional[str] = None) -> None:
         """
         Scroll in a specified direction until an element appears.
@@ -861,23 +1109,11 @@ class ActionKeyword:
         """
         screenshot_np = self._capture_screenshot_safe()
         self._save_screenshot_if_available(screenshot_np, "scroll_until_element_appears")
-        start_time = time.time()
-        found = False
-        while time.time() - start_time < int(timeout):
-            try:
-                result = self.verifier.assert_presence(
-                    element, timeout_str="3", rule="any")
-                if result:
-                    found = True
-                    break
-            except OpticsError as e:
-                if e.code != Code.E0201:
-                    raise
-                # Don't hide configuration/strategy issues; scrolling won't fix these.
-                if "No strategies found" in e.message or "No valid strategies found" in e.message:
-                    raise
-            self.driver.scroll(direction, 1000, event_name)
-            time.sleep(3)
+        found = self._gesture_until_element_appears(
+            element, int(timeout),
+            lambda: self.driver.scroll(direction, 1000, event_name),
+            raise_on_strategy_errors=True,
+        )
         if not found:
             raise OpticsError(Code.E0201, message=f"Element '{element}' did not appear after scrolling {direction} for {timeout}s.")
 
@@ -934,6 +1170,7 @@ class ActionKeyword:
             internal_logger.debug(f"Entering text '{text}' into element '{element}'")
             self.driver.enter_text_element(located, text, event_name)
 
+    @invalidates_screenshot_cache
     def enter_text_direct(self, text: str, event_name: Optional[str] = None) -> None:
         """
         Enter text using the keyboard.
@@ -941,14 +1178,12 @@ class ActionKeyword:
         :param text: The text to be entered.
         :param event_name: The event triggering the input.
         """
-        try:
-            screenshot_np = self.strategy_manager.capture_screenshot()
-            utils.save_screenshot(screenshot_np, "enter_text_keyboard", output_dir=self.execution_dir)
-        except Exception as e:
-            internal_logger.error(f"Error capturing screenshot: {e}")
+        screenshot_np = self._capture_screenshot_safe()
+        self._save_screenshot_if_available(screenshot_np, "enter_text_keyboard")
         internal_logger.info(f'Entering text directly: {text}')
         self.driver.enter_text(text, event_name)
 
+    @invalidates_screenshot_cache
     def enter_text_using_keyboard(self, text_input: str, event_name: Optional[str] = None) -> None:
         """
         Enter text or press a special key using the keyboard.
@@ -963,11 +1198,8 @@ class ActionKeyword:
         parsed = utils.parse_special_key(text_input)
         if parsed is not None:
             text_input = parsed
-        try:
-            screenshot_np = self.strategy_manager.capture_screenshot()
-            utils.save_screenshot(screenshot_np, "enter_text_using_keyboard", output_dir=self.execution_dir)
-        except Exception as e:
-            internal_logger.error(f"Error capturing screenshot: {e}")
+        screenshot_np = self._capture_screenshot_safe()
+        self._save_screenshot_if_available(screenshot_np, "enter_text_using_keyboard")
         internal_logger.info(f'Entering text using keyboard: {text_input}')
         self.driver.enter_text_using_keyboard(text_input, event_name)
 
@@ -994,6 +1226,7 @@ class ActionKeyword:
             internal_logger.debug(f"Entering number '{number}' into element '{element}'")
             self.driver.enter_text_element(located, str(number), event_name)
 
+    @invalidates_screenshot_cache
     def press_keycode(self, keycode: str, event_name: Optional[str] = None) -> None:
         """
         Press a specified keycode.
@@ -1001,11 +1234,8 @@ class ActionKeyword:
         :param keycode: The keycode to be pressed.
         :param event_name: The event triggering the press.
         """
-        try:
-            screenshot_np = self.strategy_manager.capture_screenshot()
-            utils.save_screenshot(screenshot_np, "press_keycode", output_dir=self.execution_dir)
-        except Exception as e:
-            internal_logger.error(f"Error capturing screenshot: {e}")
+        screenshot_np = self._capture_screenshot_safe()
+        self._save_screenshot_if_available(screenshot_np, "press_keycode")
 
         internal_logger.info(f"Pressing keycode: {keycode}")
         self.driver.press_keycode(keycode, event_name)
@@ -1095,6 +1325,7 @@ class ActionKeyword:
 
         return script, args
 
+    @invalidates_screenshot_cache
     def execute_script(self, script_or_json: str, event_name: Optional[str] = None) -> Any:
         """
         Execute JavaScript/script in the current context.
@@ -1111,11 +1342,8 @@ class ActionKeyword:
         :return: The result of the script execution.
         :rtype: Any
         """
-        try:
-            screenshot_np = self.strategy_manager.capture_screenshot()
-            utils.save_screenshot(screenshot_np, "execute_script", output_dir=self.execution_dir)
-        except Exception as e:
-            internal_logger.error(f"Error capturing screenshot: {e}")
+        screenshot_np = self._capture_screenshot_safe()
+        self._save_screenshot_if_available(screenshot_np, "execute_script")
 
         script, args = self._parse_script_and_args(script_or_json)
 
@@ -17,6 +17,7 @@ from optics_framework.common.session_manager import Session
 from optics_framework.common.models import ApiData, ElementData
 from optics_framework.common.error import OpticsError, Code
 from optics_framework.common import utils
+from optics_framework.common.runner.keyword_register import keyword_slug
 
 
 NO_SESSION_PRESENT = "Session is None after ensure_session call."
@@ -115,7 +116,7 @@ class FlowControl:
         self, module_name: str, keyword: str, params: List[Any]
     ) -> Any:
         """Execute one keyword: either as a mapped method or as a nested module."""
-        func_name = "_".join(keyword.split()).lower()
+        func_name = keyword_slug(keyword)
         method = self.keyword_map.get(func_name)
         if method is not None:
             return self._execute_keyword_method(method, keyword, params)
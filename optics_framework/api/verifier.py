@@ -171,11 +171,12 @@ class Verifier:
 
     def _group_elements_by_type(self, elements_list: list) -> dict:
         """Group elements by their type (Text, XPath, Image)."""
-        return {
-            'Text': [el for el in elements_list if utils.determine_element_type(el) == 'Text'],
-            'XPath': [el for el in elements_list if utils.determine_element_type(el) == 'XPath'],
-            'Image': [el for el in elements_list if utils.determine_element_type(el) == 'Image']
-        }
+        grouped: dict = {'Text': [], 'XPath': [], 'Image': []}
+        for el in elements_list:
+            group = grouped.get(utils.determine_element_type(el))
+            if group is not None:
+                group.append(el)
+        return grouped
 
     def _process_element_groups(self, grouped_elements: dict, timeout: int, rule: str, method_name: str = "assert_presence") -> tuple:
         """Process each group of elements and collect results."""
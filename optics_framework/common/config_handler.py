@@ -40,6 +40,7 @@ class Config(BaseModel):
     event_attributes_json: Optional[str] = None
     halt_duration: float = 0.1
     max_attempts: int = 3
+    screenshot_cache_ttl: float = 0.3
     ai_self_heal: bool = False
 
     def __init__(self, **data):
@@ -55,6 +56,7 @@ class Config(BaseModel):
                 {"appium_find_element": DependencyConfig(enabled=False, url=None, capabilities={})},
                 {"appium_page_source": DependencyConfig(enabled=False, url=None, capabilities={})},
                 {"appium_screenshot": DependencyConfig(enabled=False, url=None, capabilities={})},
+                {"adb_screencap": DependencyConfig(enabled=False, url=None, capabilities={})},
                 {"camera_screenshot": DependencyConfig(enabled=False, url=None, capabilities={})},
                 {"selenium_find_element": DependencyConfig(enabled=False, url=None, capabilities={})},
                 {"selenium_screenshot": DependencyConfig(enabled=False, url=None, capabilities={})},
@@ -63,6 +65,7 @@ class Config(BaseModel):
             self.text_detection = [
                 {"easyocr": DependencyConfig(enabled=False, url=None, capabilities={})},
                 {"pytesseract": DependencyConfig(enabled=False, url=None, capabilities={})},
+                {"tesserocr": DependencyConfig(enabled=False, url=None, capabilities={})},
                 {"google_vision": DependencyConfig(enabled=False, url=None, capabilities={})},
                 {"remote_ocr": DependencyConfig(enabled=False, url=None, capabilities={})},
             ]
@@ -0,0 +1,100 @@
+"""Persistent, content-addressed cache for vision results (OCR boxes, match results).
+
+Replaying a known flow re-captures the same screens run after run; keying results by a
+hash of the frame lets a backend skip recognition entirely for frames it has seen before,
+even across processes. Backed by a single SQLite file so it needs no extra dependency.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from optics_framework.common.logging_config import internal_logger
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".optics_cache")
+DEFAULT_SIZE_LIMIT = 2 * 1024 ** 3
+
+
+class CVCache:
+    """SQLite-backed key/value store for JSON-serialisable vision results.
+
+    Entries are evicted least-recently-used first once the stored payload exceeds
+    ``size_limit`` bytes. Safe to share between threads; failures to read or write the
+    cache are logged and treated as misses so they never fail a keyword.
+    """
+
+    def __init__(self, path: Optional[str] = None, size_limit: int = DEFAULT_SIZE_LIMIT):
+        self.path = path or os.path.join(DEFAULT_CACHE_DIR, "cv_cache.sqlite3")
+        self.size_limit = size_limit
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cv_cache ("
+                "key TEXT PRIMARY KEY, payload TEXT NOT NULL, "
+                "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the payload stored under ``key``, or ``None`` on a miss."""
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT payload FROM cv_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                self._conn.execute(
+                    "UPDATE cv_cache SET accessed = ? WHERE key = ?", (time.time(), key)
+                )
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            internal_logger.debug(f"CV cache read failed for {key}: {e}")
+            return None
+
+    def put(self, key: str, payload: Any) -> None:
+        """Store ``payload`` under ``key`` and evict old entries past the size limit."""
+        try:
+            data = json.dumps(payload)
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cv_cache (key, payload, size, accessed) VALUES (?, ?, ?, ?)",
+                    (key, data, len(data), time.time()),
+                )
+                self._evict()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            internal_logger.debug(f"CV cache write failed for {key}: {e}")
+
+    def _evict(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM cv_cache").fetchone()[0]
+        if total <= self.size_limit:
+            return
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM cv_cache ORDER BY accessed"
+        ).fetchall():
+            self._conn.execute("DELETE FROM cv_cache WHERE key = ?", (key,))
+            total -= size
+            if total <= self.size_limit:
+                break
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_shared_caches: dict = {}
+_shared_lock = threading.Lock()
+
+
+def get_cv_cache(path: Optional[str] = None) -> CVCache:
+    """Return the process-wide cache for ``path`` (default ``~/.optics_cache``), opening it once."""
+    resolved = os.path.abspath(path or os.path.join(DEFAULT_CACHE_DIR, "cv_cache.sqlite3"))
+    with _shared_lock:
+        cache = _shared_caches.get(resolved)
+        if cache is None:
+            cache = CVCache(resolved)
+            _shared_caches[resolved] = cache
+        return cache
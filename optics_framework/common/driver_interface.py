@@ -194,6 +194,37 @@ class DriverInterface(ABC):
         """
         pass
 
+    def swipe_percentage_batch(self, x_percentage: int, y_percentage: int, direction: str, swipe_length_percentage: int, count: int, event_name: Optional[str] = None) -> None:
+        """
+        Perform ``count`` identical percentage swipes back to back.
+
+        Drivers that can queue several gestures in one request (e.g. W3C Actions) override
+        this; the default simply calls :meth:`swipe_percentage` ``count`` times.
+        :param x_percentage: The starting x coordinate of each swipe as a percentage of the screen width (0-100).
+        :param y_percentage: The starting y coordinate of each swipe as a percentage of the screen height (0-100).
+        :param direction: The direction of the swipes.
+        :param swipe_length_percentage: The percentage of the screen covered by each swipe (0-100).
+        :param count: Number of swipes to perform.
+        :param event_name: The event triggering the swipes, captured once for the batch.
+        :return: None
+        :rtype: None
+        """
+        for i in range(count):
+            self.swipe_percentage(
+                x_percentage, y_percentage, direction, swipe_length_percentage, event_name if i == 0 else None
+            )
+
+    def invalidate_ui_cache(self) -> None:
+        """
+        Forget any UI state (e.g. page source) the driver reuses between lookups.
+
+        Called after every keyword that acts on the device. The default is a no-op for
+        drivers that do not cache.
+        :return: None
+        :rtype: None
+        """
+        return None
+
     @abstractmethod
     def swipe_element(self, element: str, direction: str, swipe_length: int, event_name: Optional[str] = None) -> None:
         """
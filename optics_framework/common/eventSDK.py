@@ -17,6 +17,8 @@ class EventSDK:
         self.event_attributes_data = self._load_event_attributes_json()
         self.all_events = []
         self.real_time = False
+        # Batches go to the same event endpoint; keep its connection alive between them.
+        self._http = requests.Session()
 
     def _load_event_attributes_json(self):
         """Load and parse the event attributes JSON file once during initialization"""
@@ -156,7 +158,7 @@ class EventSDK:
             }
             payload = json.dumps(event_data)
             execution_logger.debug(f"Sending event to {url}: {payload}")
-            response = requests.post(url, headers=headers, data=payload, timeout=10)
+            response = self._http.post(url, headers=headers, data=payload, timeout=10)
             response.raise_for_status()  # Raises HTTPError for bad responses
             execution_logger.info(f"Event API response: {response.text}")
             return True
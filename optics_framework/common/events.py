@@ -97,22 +97,20 @@ class EventManager:
         internal_logger.debug("EventManager stopped")
 
     async def _process_events(self):
-        """Background task to process events and notify subscribers."""
+        """Background task to process events and notify subscribers.
+
+        Each wake-up drains every event already queued and dispatches them in order, so a burst
+        of events from the runner costs one scheduler round-trip instead of one per event.
+        """
         internal_logger.debug("Starting event processing loop")
         while self._running:
             try:
-                event = await self.event_queue.get()
-                internal_logger.debug(
-                    f"Processing event: {event.model_dump()}")
-                for subscriber_id, subscriber in self.subscribers.items():
-                    internal_logger.debug(
-                        f"Dispatching to subscriber {subscriber_id}: {subscriber}")
-                    try:
-                        await subscriber.on_event(event)
-                    except Exception as e:
-                        internal_logger.error(
-                            f"Error in subscriber {subscriber_id}: {e}")
-                self.event_queue.task_done()
+                batch = [await self.event_queue.get()]
+                while not self.event_queue.empty():
+                    batch.append(self.event_queue.get_nowait())
+                for event in batch:
+                    await self._dispatch(event)
+                    self.event_queue.task_done()
             except asyncio.CancelledError:
                 internal_logger.debug("Event processing loop cancelled")
                 raise
@@ -120,10 +118,25 @@ class EventManager:
                 internal_logger.error(f"Error processing event: {e}")
         internal_logger.debug("Event processing loop stopped")
 
+    async def _dispatch(self, event: Event) -> None:
+        if internal_logger.isEnabledFor(logging.DEBUG):
+            internal_logger.debug(f"Processing event: {event.model_dump()}")
+        for subscriber_id, subscriber in self.subscribers.items():
+            internal_logger.debug("Dispatching to subscriber %s: %s", subscriber_id, subscriber)
+            try:
+                await subscriber.on_event(event)
+            except Exception as e:
+                internal_logger.error(
+                    f"Error in subscriber {subscriber_id}: {e}")
+
     async def publish_event(self, event: Event):
-        """Publish an event to the queue."""
-        internal_logger.debug(f"Publishing event: {event.model_dump()}")
-        await self.event_queue.put(event)
+        """Publish an event to the queue.
+
+        The queue is unbounded, so the event is enqueued without yielding to the scheduler.
+        """
+        if internal_logger.isEnabledFor(logging.DEBUG):
+            internal_logger.debug(f"Publishing event: {event.model_dump()}")
+        self.event_queue.put_nowait(event)
 
     async def publish_command(self, command: CommandType, entity_id: str, params: Optional[List[str]] = None, parent_id: Optional[str] = None):
         """Publish a command to the queue."""
@@ -5,9 +5,9 @@ import json
 import inspect
 from abc import ABC, abstractmethod
 from typing import Optional, List, Any, Callable
-from pydantic import BaseModel, Field, ConfigDict
+from dataclasses import dataclass, field
 from optics_framework.common.session_manager import SessionManager, Session
-from optics_framework.common.runner.keyword_register import KeywordRegistry
+from optics_framework.common.runner.keyword_register import KeywordRegistry, keyword_slug
 from optics_framework.common.runner.printers import TreeResultPrinter, TerminalWidthProvider, NullResultPrinter
 from optics_framework.common.runner.test_runnner import TestRunner, PytestRunner, Runner, KeywordRunner
 from optics_framework.common.logging_config import LoggerContext, internal_logger
@@ -19,13 +19,17 @@ from optics_framework.common.events import Event, EventManager, EventStatus, get
 
 NO_TEST_CASES_LOADED = "No test cases loaded"
 
-class ExecutionParams(BaseModel):
-    """Execution parameters with Pydantic validation."""
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-    session_id: str = Field(default_factory=lambda: str(uuid4()))
+@dataclass(slots=True, kw_only=True)
+class ExecutionParams:
+    """Execution parameters.
+
+    A plain slotted dataclass: built internally once per execution (the REST layer validates
+    its own request models), so it skips Pydantic validation on this path.
+    """
+    session_id: str = field(default_factory=lambda: str(uuid4()))
     mode: str
     keyword: Optional[str] = None
-    params: List[str] = Field(default_factory=list)
+    params: List[str] = field(default_factory=list)
     # test_cases, modules, elements, apis are now part of Session
     runner_type: str = "test_runner"
     use_printer: bool = True
@@ -64,9 +68,8 @@ class BatchExecutor(Executor):
             status = EventStatus.NOT_RUN
             message = "No test case to execute"
             if self.test_case:
-                await runner.run_all()
-                all_passed = all(
-                    tc.status == "PASS" for tc in runner.result_printer.test_state.values())
+                _, not_passed = await runner.run_all()
+                all_passed = not_passed == 0
                 status = EventStatus.PASS if all_passed else EventStatus.FAIL
                 message = "All test cases completed" if all_passed else "Some test cases failed"
             await event_manager.publish_event(Event(
@@ -114,10 +117,8 @@ class DryRunExecutor(Executor):
             raise OpticsError(Code.E0702, message=NO_TEST_CASES_LOADED)
 
         if self.test_case:
-            await runner.dry_run_all()
-            all_passed = all(
-                tc.status == "PASS" for tc in runner.result_printer.test_state.values())
-            status = EventStatus.PASS if all_passed else EventStatus.FAIL
+            _, not_passed = await runner.dry_run_all()
+            status = EventStatus.PASS if not_passed == 0 else EventStatus.FAIL
             message = "All test cases dry run completed"
         await event_manager.publish_event(Event(
             entity_type="execution",
@@ -165,6 +166,7 @@ class KeywordExecutor(Executor):
 
     def __init__(self, keyword: str, params: List[str], event_manager: EventManager):
         self.keyword = keyword
+        self.func_name = keyword_slug(keyword)
         self.params = params
         self.event_manager = event_manager
 
@@ -180,7 +182,7 @@ class KeywordExecutor(Executor):
         since this lower layer shouldn't import the HTTP module.
         """
         event_manager = self.event_manager
-        method = runner.keyword_map.get("_".join(self.keyword.split()).lower())
+        method = runner.keyword_map.get(self.func_name)
         result = None
         if method:
             try:
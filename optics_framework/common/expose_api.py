@@ -12,6 +12,7 @@ import pkgutil
 import asyncio
 import warnings
 import hashlib
+from functools import lru_cache
 from itertools import product
 from typing import Annotated, Optional, Dict, Any, List, Union, cast, Callable, Tuple, NamedTuple
 from fastapi import FastAPI, HTTPException, Query, Body
@@ -28,7 +29,7 @@ from optics_framework.common.execution import (
 from optics_framework.common.logging_config import internal_logger, reconfigure_logging
 from optics_framework.common.error import OpticsError, Code
 from optics_framework.common.config_handler import Config, DependencyConfig
-from optics_framework.common.runner.keyword_register import KeywordRegistry
+from optics_framework.common.runner.keyword_register import KeywordRegistry, keyword_slug
 from optics_framework.common.utils import _is_list_type, encode_numpy_to_base64
 from optics_framework.api import ActionKeyword, AppManagement, FlowControl, Verifier
 from optics_framework.helper.execute import discover_templates
@@ -382,6 +383,12 @@ def discover_keywords() -> List[KeywordInfo]:
     Discover all public methods in optics_framework.api.* classes that are likely to be used as keywords.
     Returns a list of KeywordInfo objects.
     """
+    return list(_keyword_catalog())
+
+
+@lru_cache(maxsize=1)
+def _keyword_catalog() -> Tuple[KeywordInfo, ...]:
+    """Introspect the API package once; the keyword set is fixed for the process lifetime."""
     api_pkg = PKG_OPTICS_API
     keywords = []
     api_path = __import__(api_pkg, fromlist=[""]).__path__[0]
@@ -390,7 +397,11 @@ def discover_keywords() -> List[KeywordInfo]:
             continue
         module = importlib.import_module(f"{api_pkg}.{modname}")
         keywords.extend(_extract_keywords_from_module(module))
-    return keywords
+    return tuple(keywords)
+
+# Health probes can arrive several times a second; the payload never changes.
+_HEALTH_RESPONSE = HealthCheckResponse(status=HEALTH_STATUS_RUNNING, version=VERSION)
+
 
 @app.get("/", response_model=HealthCheckResponse, status_code=status.HTTP_200_OK)
 @app.get("/health", response_model=HealthCheckResponse, status_code=status.HTTP_200_OK)
@@ -399,7 +410,7 @@ async def health_check():
     Health check endpoint for Optics Framework API.
     Returns API status and version.
     """
-    return HealthCheckResponse(status=HEALTH_STATUS_RUNNING, version=VERSION)
+    return _HEALTH_RESPONSE
 
 _TRUE_STRINGS = frozenset({"1", "true", "yes", "on"})
 ENV_AI_SELF_HEAL = "OPTICS_AI_SELF_HEAL"
@@ -858,7 +869,7 @@ async def _handle_execution_failure(
     e: Exception, session: Session, execution_id: str, keyword: str
 ) -> None:
     """Put FAIL event and raise HTTPException. Never returns."""
-    await session.event_queue.put(ExecutionEvent(
+    session.event_queue.put_nowait(ExecutionEvent(
         execution_id=execution_id,
         status=STATUS_FAIL,
         message=f"Keyword {keyword} failed: {str(e)}"
@@ -895,7 +906,7 @@ async def execute_keyword(session_id: str, request: ExecuteRequest):
     request_temp_dirs = await _setup_request_template_overrides(session, request.template_images)
 
     try:
-        await session.event_queue.put(ExecutionEvent(
+        session.event_queue.put_nowait(ExecutionEvent(
             execution_id=execution_id,
             status=STATUS_RUNNING,
             message=f"Starting keyword: {request.keyword}"
@@ -910,8 +921,8 @@ async def execute_keyword(session_id: str, request: ExecuteRequest):
         registry.register(verifier)
         registry.register(FlowControl(session=session, keyword_map=registry.keyword_map))
 
-        keyword_slug = "_".join(request.keyword.split()).lower()
-        method = registry.keyword_map.get(keyword_slug)
+        func_name = keyword_slug(request.keyword)
+        method = registry.keyword_map.get(func_name)
 
         if not method:
             raise OpticsError(Code.E0402, message=f"Keyword {request.keyword} not found")
@@ -920,7 +931,7 @@ async def execute_keyword(session_id: str, request: ExecuteRequest):
             engine, session_id, request.keyword, request.params, method, session
         )
 
-        await session.event_queue.put(ExecutionEvent(
+        session.event_queue.put_nowait(ExecutionEvent(
             execution_id=execution_id,
             status=STATUS_SUCCESS,
             message=f"Keyword {request.keyword} executed successfully"
@@ -110,6 +110,10 @@ class LoggingManager:
         self.execution_listener = None
         self.junit_handler = None
 
+
+_SENSITIVE_VALUE_RE = re.compile(r"@:([^\s,\)\]]+)")
+
+
 class SensitiveDataFormatter(logging.Formatter):
     def format(self, record):
         if isinstance(record.msg, str):
@@ -119,8 +123,10 @@ class SensitiveDataFormatter(logging.Formatter):
         return super().format(record)
 
     def _sanitize(self, message: str) -> str:
-        # Remove duplicate characters in regex character class
-        return re.sub(r"@:([^\s,\)\]]+)", "****", message)
+        # Runs for every record; most carry no secrets, so skip the regex then.
+        if "@:" not in message:
+            return message
+        return _SENSITIVE_VALUE_RE.sub("****", message)
 
 
 logging_manager = LoggingManager()
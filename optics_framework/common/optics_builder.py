@@ -36,6 +36,9 @@ class OpticsBuilder:
     def __init__(self, session) -> None:
         self.config: OpticsConfig = OpticsConfig()
         self._instances: Dict[str, Any] = {}
+        # API classes built for this session, keyed by class: runners and API requests build
+        # ActionKeyword/AppManagement/Verifier repeatedly, and each build wires a StrategyManager.
+        self._built: Dict[type, Any] = {}
         self.session = session
         self.event_sdk = session.event_sdk
         self.session_config = session.config
@@ -137,6 +140,7 @@ class OpticsBuilder:
 
     def instantiate_image_detection(self) -> Optional[InstanceFallback[ImageInterface]]:
         if not self.config.image_config:
+            self._instances["image_detection"] = None
             return None
         normalized_config = self.normalise_config(self.config.image_config)
         image_detection: InstanceFallback[ImageInterface] = ImageFactory.get_driver(
@@ -147,6 +151,7 @@ class OpticsBuilder:
 
     def instantiate_text_detection(self) -> Optional[InstanceFallback[TextInterface]]:
         if not self.config.text_config:
+            self._instances["text_detection"] = None
             return None
         normalized_config = self.normalise_config(self.config.text_config)
         text_detection: InstanceFallback[TextInterface] = TextFactory.get_driver(
@@ -157,6 +162,7 @@ class OpticsBuilder:
 
     def instantiate_llm(self) -> Optional[InstanceFallback[LLMInterface]]:
         if not self.config.llm_config:
+            self._instances["llm"] = None
             return None
         normalized_config = self.normalise_config(self.config.llm_config)
         llm: InstanceFallback[LLMInterface] = LLMFactory.get_driver(normalized_config)
@@ -197,5 +203,8 @@ class OpticsBuilder:
         :return: An instance of the specified class.
         :raises OpticsError: If required configurations are missing for the specified class.
         """
-        instance: T = cls(self)  # type: ignore
+        instance = self._built.get(cls)
+        if instance is None:
+            instance = cls(self)  # type: ignore
+            self._built[cls] = instance
         return instance
@@ -1,7 +1,17 @@
+import functools
 from typing import Callable, Dict, Optional
 from optics_framework.common.logging_config import internal_logger
 
 
+@functools.lru_cache(maxsize=1024)
+def keyword_slug(keyword: str) -> str:
+    """Map a display keyword ("Press Element") to its registered method name ("press_element").
+
+    Memoized: a suite dispatches the same few dozen keywords over and over.
+    """
+    return "_".join(keyword.split()).lower()
+
+
 class KeywordRegistry:
     """
     Manages a mapping of keyword function names to their methods.
@@ -1,4 +1,5 @@
 import abc
+from collections import Counter
 from typing import Dict, List, Optional
 import shutil
 import json
@@ -203,16 +204,12 @@ class TreeResultPrinter(IResultPrinter):
                     module_node.add(self.create_label(
                         keyword.resolved_name, keyword.elapsed, keyword.status, 2))
 
-        completed = sum(1 for tc in self.test_state.values()
-                        if tc.status in ["PASS", "FAIL"])
+        # One pass over the suite: this runs on every live refresh, i.e. every status update.
+        status_counts = Counter(tc.status for tc in self.test_state.values())
+        total, passed, failed = len(self.test_state), status_counts["PASS"], status_counts["FAIL"]
         if self.task_id is not None:
-            self.progress.update(self.task_id, completed=completed)
+            self.progress.update(self.task_id, completed=passed + failed)
 
-        total, passed, failed = (
-            len(self.test_state),
-            sum(1 for tc in self.test_state.values() if tc.status == "PASS"),
-            sum(1 for tc in self.test_state.values() if tc.status == "FAIL"),
-        )
         summary_text = f"Total Test Cases: {total} | Passed: {passed} | Failed: {failed}"
         summary_panel = Panel(
             summary_text, style="green" if failed == 0 else "red")
@@ -8,7 +8,7 @@ import shutil
 import sys
 import logging
 from itertools import product
-from typing import Callable, Dict, List, Optional, Union, Any
+from typing import Callable, Dict, List, Optional, Tuple, Union, Any
 import pytest
 from optics_framework.common.session_manager import Session
 from optics_framework.common.error import OpticsError, Code
@@ -42,6 +42,7 @@ from optics_framework.common.events import (
     Event,
 )
 from optics_framework.common.runner.data_reader import DataReader
+from optics_framework.common.runner.keyword_register import keyword_slug
 from optics_framework.common.strategies import StrategyManager
 from optics_framework.common import utils
 from optics_framework.common.Junit_eventhandler import get_junit_handler_registry
@@ -63,31 +64,35 @@ class Runner:
         Subclasses must provide concrete logic for executing test cases."""
         pass
 
-    async def run_all(self) -> None:
+    async def run_all(self) -> Tuple[int, int]:
         """Empty implementation to satisfy the interface contract.
-        Subclasses must implement logic to run all test cases."""
-        pass
+        Subclasses must implement logic to run all test cases and
+        return their ``(passed, not_passed)`` counts."""
+        return 0, 0
 
     async def dry_run_test_case(self, test_case: str) -> Optional[TestCaseResult]:
         """Empty implementation to satisfy the interface contract.
         Subclasses must provide logic for dry-running test cases."""
         pass
 
-    async def dry_run_all(self) -> None:
+    async def dry_run_all(self) -> Tuple[int, int]:
         """Empty implementation to satisfy the interface contract.
-        Subclasses must implement logic to dry-run all test cases."""
-        pass
+        Subclasses must implement logic to dry-run all test cases and
+        return their ``(passed, not_passed)`` counts."""
+        return 0, 0
 
 
 async def queue_event(event: Event, event_manager) -> None:
     """Queue an event for async processing."""
-    internal_logger.debug(f"Queueing event: {event.model_dump()}")
+    if internal_logger.isEnabledFor(logging.DEBUG):
+        internal_logger.debug(f"Queueing event: {event.model_dump()}")
     await event_manager.publish_event(event)
 
 
 def queue_event_sync(event: Event, event_manager) -> None:
     """Queue an event synchronously for pytest."""
-    internal_logger.debug(f"Queueing event (sync): {event.model_dump()}")
+    if internal_logger.isEnabledFor(logging.DEBUG):
+        internal_logger.debug(f"Queueing event (sync): {event.model_dump()}")
     for _, subscriber in event_manager.subscribers.items():
         try:
             asyncio.run(subscriber.on_event(event))
@@ -347,7 +352,7 @@ class TestRunner(Runner):
                 keyword_result, "RUNNING", time.time() - start_time, test_case_result.name
             )
 
-            func_name = "_".join(keyword_node.name.split()).lower()
+            func_name = keyword_slug(keyword_node.name)
             method = self.keyword_map.get(func_name)
             if not method:
                 await self._handle_keyword_not_found(keyword_node, module_node, keyword_result, start_time, test_case_result)
@@ -433,7 +438,8 @@ class TestRunner(Runner):
                 break
             try:
                 resolved_positional_params, resolved_kw_params = self._resolve_candidate_params(candidate_args)
-                method(*resolved_positional_params, **resolved_kw_params)
+                # Keywords block on the device; run them off the event loop so queued events keep flowing.
+                await asyncio.to_thread(method, *resolved_positional_params, **resolved_kw_params)
                 keyword_node.state = State.COMPLETED_PASSED
                 await self._send_event(
                     "keyword",
@@ -759,7 +765,7 @@ class TestRunner(Runner):
                         if resolved_params
                         else keyword_current.name
                     )
-                func_name = "_".join(keyword_current.name.split()).lower()
+                func_name = keyword_slug(keyword_current.name)
                 if func_name not in self.keyword_map:
                     raise ValueError("Keyword not found")
             except ValueError as e:
@@ -804,24 +810,36 @@ class TestRunner(Runner):
     async def dry_run_test_case(self, test_case: str) -> TestCaseResult:
         return await self._process_test_case(test_case, dry_run=True)
 
-    async def run_all(self) -> None:
+    async def run_all(self) -> Tuple[int, int]:
         current = self.test_cases
+        passed = not_passed = 0
         self.result_printer.start_run(len(self.result_printer.test_state))
         self.result_printer.start_live()
         while current:
-            await self.execute_test_case(current.name)
+            result = await self.execute_test_case(current.name)
+            if result.status == "PASS":
+                passed += 1
+            else:
+                not_passed += 1
             current = current.next
         self.result_printer.stop_live()
         self._capture_end_of_run_artifacts()
+        return passed, not_passed
 
-    async def dry_run_all(self) -> None:
+    async def dry_run_all(self) -> Tuple[int, int]:
         current = self.test_cases
+        passed = not_passed = 0
         self.result_printer.start_run(len(self.result_printer.test_state))
         self.result_printer.start_live()
         while current:
-            await self.dry_run_test_case(current.name)
+            result = await self.dry_run_test_case(current.name)
+            if result.status == "PASS":
+                passed += 1
+            else:
+                not_passed += 1
             current = current.next
         self.result_printer.stop_live()
+        return passed, not_passed
 
     def _resolve_candidate_params(self, candidate_args):
         kw_params = DataReader.get_keyword_params(list(candidate_args))
@@ -877,7 +895,7 @@ class PytestRunner(Runner):
         testcase_id: str = "unknown",
     ) -> bool:
         keyword_id = str(uuid.uuid4())
-        func_name = "_".join(keyword.split()).lower()
+        func_name = keyword_slug(keyword)
 
         if dry_run:
             return self._execute_keyword_dry_run(keyword, func_name, keyword_id, module_id)
@@ -1190,17 +1208,19 @@ class PytestRunner(Runner):
     async def dry_run_test_case(self, test_case: str) -> TestCaseResult:
         return self.execute_test_case_sync(test_case, dry_run=True)
 
-    async def run_all(self) -> None:
+    async def run_all(self) -> Tuple[int, int]:
         test_cases = [node.name for node in self._iter_test_cases()]
         result = self._run_pytest(test_cases, dry_run=False)
         if not result:
             raise RuntimeError("Pytest execution failed")
+        return len(test_cases), 0
 
-    async def dry_run_all(self) -> None:
+    async def dry_run_all(self) -> Tuple[int, int]:
         test_cases = [node.name for node in self._iter_test_cases()]
         result = self._run_pytest(test_cases, dry_run=True)
         if not result:
             raise RuntimeError("Pytest execution failed")
+        return len(test_cases), 0
 
     def _iter_test_cases(self):
         current = self.test_cases
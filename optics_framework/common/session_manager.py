@@ -1,5 +1,6 @@
 import shutil
 import tempfile
+import threading
 import uuid
 import asyncio
 from abc import ABC, abstractmethod
@@ -150,6 +151,10 @@ class SessionManager(SessionHandler):
 
     def __init__(self):
         self.sessions: Dict[str, Session] = {}
+        # Mutations of ``sessions`` are serialized by ``_lock``; reads stay lock-free (single dict
+        # operations are atomic in CPython). Teardown runs outside the lock, so tearing one
+        # session down never blocks create/get/terminate on the others.
+        self._lock = threading.Lock()
 
     def create_session(self, config: Config,
                        test_cases: Optional[TestCaseNode],
@@ -160,7 +165,10 @@ class SessionManager(SessionHandler):
                        error_definitions: Optional[ErrorDefinitions] = None) -> str:
         """Creates a new session with a unique ID."""
         session_id = str(uuid.uuid4())
-        self.sessions[session_id] = Session(session_id, config, test_cases, modules, elements, apis, templates, error_definitions)
+        # Session construction starts drivers and can be slow; keep it outside the manager lock.
+        session = Session(session_id, config, test_cases, modules, elements, apis, templates, error_definitions)
+        with self._lock:
+            self.sessions[session_id] = session
         return session_id
 
     def get_session(self, session_id: str) -> Optional[Session]:
@@ -168,9 +176,10 @@ class SessionManager(SessionHandler):
         return self.sessions.get(session_id)
 
     def terminate_session(self, session_id: str) -> None:
-        """Terminates a session and cleans up resources."""
-        session: Session | None = self.sessions.pop(session_id, None)
-        if session:
+        """Terminates a session and cleans up resources. Unknown or already terminated IDs are a no-op."""
+        with self._lock:
+            session: Session | None = self.sessions.pop(session_id, None)
+        if session is not None:
             if session.driver:
                 session.driver.terminate()
             session.inline_templates.clear()
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 import inspect
 import time
 import math
-from typing import List, NamedTuple, Union, Tuple, Generator, Set, Optional, Any
+from typing import Dict, Iterator, List, NamedTuple, Union, Tuple, Generator, Set, Optional, Any
 import numpy as np
 from optics_framework.common.base_factory import InstanceFallback
 from optics_framework.common.elementsource_interface import ElementSourceInterface
@@ -129,7 +130,7 @@ class LocatorStrategy(ABC):
                 try:
                     frame = strategy_manager.capture_screenshot()
                 except Exception as e:
-                    internal_logger.exception("Failed to capture screenshot for %s: %s", method_name, e)
+                    internal_logger.debug("Failed to capture screenshot for %s: %r", method_name, e)
                     frame = None
             bboxes = []
             if hasattr(self.element_source, 'get_element_bboxes'):
@@ -225,7 +226,7 @@ class TextDetectionStrategy(LocatorStrategy):
     def locate(self, element: str, index: int = 0) -> Optional[LocateValueWithFrame]:
         if self.text_detection is None:
             raise OpticsError(Code.E0201, message=TEXT_DETECTION_NOT_AVAILABLE_MSG)
-        screenshot = self.element_source.capture()
+        screenshot = self.strategy_manager.capture_for_locate(self.element_source)
         found = self.text_detection.find_element(screenshot, element, index=index)
         if found is None:
             return None
@@ -253,7 +254,7 @@ class TextDetectionStrategy(LocatorStrategy):
         if self.text_detection is None:
             raise OpticsError(Code.E0201, message=TEXT_DETECTION_NOT_AVAILABLE_MSG)
         # Capture full screenshot
-        full_screenshot = self.element_source.capture()
+        full_screenshot = self.strategy_manager.capture_for_locate(self.element_source)
 
         # Crop screenshot to AOI
         try:
@@ -294,22 +295,21 @@ class TextDetectionStrategy(LocatorStrategy):
     ) -> Tuple[bool, Optional[str], Optional[Any]]:
         if self.text_detection is None:
             raise OpticsError(Code.E0201, message=TEXT_DETECTION_NOT_AVAILABLE_MSG)
-        end_time = time.time() + timeout
+        end_time = time.monotonic() + timeout
         found_status = dict.fromkeys(elements, False)
         result = False
         annotated_frame = None
         timestamp = None
         ss_stream = self.strategy_manager.capture_screenshot_stream(timeout=timeout)
         try:
-            while time.time() < end_time:
+            while time.monotonic() < end_time:
                 time.sleep(self.screenshot_timeout)  # Allow some time for screenshots to be captured
                 frames = ss_stream.get_all_available_screenshots(wait_time=1)
                 if not frames:
                     time.sleep(self.screenshot_timeout)
                     continue
-                for frame, ts in frames:
-                    current_frame = frame.copy()
-                    _ , ocr_results = self.text_detection.detect_text(current_frame)
+                for current_frame, ts, detection in self._detect_text_in_frames(frames):
+                    _ , ocr_results = detection
                     annotated_frame = match_and_annotate(ocr_results, elements, found_status, current_frame)
 
                     if (rule == "any" and any(found_status.values())) or (rule == "all" and all(found_status.values())):
@@ -325,6 +325,28 @@ class TextDetectionStrategy(LocatorStrategy):
             ss_stream.stop_capture()
         return result, timestamp, annotated_frame
 
+    def _detect_text_in_frames(self, frames: List[Tuple[Any, Any]]) -> Iterator[Tuple[Any, Any, Any]]:
+        """Yield ``(frame_copy, timestamp, detection)`` for each captured frame.
+
+        Engines that batch inference get every frame of the polling tick in one call, as
+        long as the frames share a shape (a rotation mid-tick breaks that); otherwise frames
+        are OCR'd lazily so the caller can stop at the first match.
+        """
+        engine = getattr(self.text_detection, "active_instance", self.text_detection)
+        if (
+            len(frames) > 1
+            and getattr(engine, "supports_batched_detection", False) is True
+            and len({frame.shape for frame, _ in frames}) == 1
+        ):
+            copies = [frame.copy() for frame, _ in frames]
+            detections = self.text_detection.detect_text_batch(copies)
+            for current_frame, (_, ts), detection in zip(copies, frames, detections):
+                yield current_frame, ts, detection
+            return
+        for frame, ts in frames:
+            current_frame = frame.copy()
+            yield current_frame, ts, self.text_detection.detect_text(current_frame)
+
     @staticmethod
     def supports(element_type: str, element_source: ElementSourceInterface) -> bool:
         return element_type == "Text" and LocatorStrategy._is_method_implemented(element_source, "capture")
@@ -344,7 +366,7 @@ class ImageDetectionStrategy(LocatorStrategy):
         return self._element_source
 
     def locate(self, element: str, index: int = 0) -> Optional[LocateValueWithFrame]:
-        screenshot = self.element_source.capture()
+        screenshot = self.strategy_manager.capture_for_locate(self.element_source)
         found = self.image_detection.find_element(screenshot, element, index)
         if found is None:
             return None
@@ -369,7 +391,7 @@ class ImageDetectionStrategy(LocatorStrategy):
         :return: Coordinates relative to the full screenshot, or (coords, annotated_frame)
         """
         # Capture full screenshot
-        full_screenshot = self.element_source.capture()
+        full_screenshot = self.strategy_manager.capture_for_locate(self.element_source)
 
         # Crop screenshot to AOI
         try:
@@ -406,13 +428,13 @@ class ImageDetectionStrategy(LocatorStrategy):
     def assert_elements(
         self, elements: list, timeout: int = 30, rule: str = 'any'
     ) -> Tuple[bool, Optional[str], Optional[Any]]:
-        end_time = time.time() + timeout
+        end_time = time.monotonic() + timeout
         result = False
         ss_stream = self.strategy_manager.capture_screenshot_stream(timeout=timeout)
         annotated_frame = None
         timestamp = None
         try:
-            while time.time() < end_time:
+            while time.monotonic() < end_time:
                 time.sleep(self.screenshot_timeout)  # Allow some time for screenshots to be captured
                 frames = ss_stream.get_all_available_screenshots(wait_time=1)
                 if not frames:
@@ -563,6 +585,32 @@ class StrategyManager:
         self.screenshot_strategies = self._build_screenshot_strategies()
         self.pagesource_strategies = self._build_pagesource_strategies()
         self.screenshot_stream = None
+        # Per-source frames reused by vision locates inside shared_capture(); None outside it.
+        self._shared_frames: Optional[Dict[int, Any]] = None
+
+    @contextmanager
+    def shared_capture(self) -> Iterator[None]:
+        """Within the block, vision locates capture each element source at most once.
+
+        Lets a caller locate several elements against one frame (one screenshot, and one
+        OCR/feature pass thanks to the detectors' per-frame caches) instead of capturing
+        per element. Only valid while the screen is not being acted on.
+        """
+        self._shared_frames = {}
+        try:
+            yield
+        finally:
+            self._shared_frames = None
+
+    def capture_for_locate(self, element_source: ElementSourceInterface) -> Any:
+        """Capture ``element_source`` for a vision locate, reusing the shared frame if any."""
+        frames = self._shared_frames
+        if frames is None:
+            return element_source.capture()
+        key = id(element_source)
+        if key not in frames:
+            frames[key] = element_source.capture()
+        return frames[key]
 
     def _build_locator_strategies(self) -> List[LocatorStrategy]:
         strategies = []
@@ -587,16 +635,16 @@ class StrategyManager:
         aoi_width: Optional[float], aoi_height: Optional[float]
     ) -> bool:
         """Validate AOI params; if any is set, all must be set. Return True if using AOI."""
-        aoi_params = [aoi_x, aoi_y, aoi_width, aoi_height]
-        use_aoi = any(p is not None for p in aoi_params)
-        if use_aoi and not all(p is not None for p in aoi_params):
+        missing = (aoi_x, aoi_y, aoi_width, aoi_height).count(None)
+        if missing == 4:
+            return False
+        if missing:
             raise OpticsError(
                 Code.E0205,
                 message="All AOI parameters (aoi_x, aoi_y, aoi_width, aoi_height) must be provided together",
             )
-        if use_aoi:
-            execution_logger.info(f"Using AOI: x={aoi_x}%, y={aoi_y}%, width={aoi_width}%, height={aoi_height}%")
-        return use_aoi
+        execution_logger.info(f"Using AOI: x={aoi_x}%, y={aoi_y}%, width={aoi_width}%, height={aoi_height}%")
+        return True
 
     def _within_aoi(
         self, strategy: "LocatorStrategy", value: Any,
@@ -684,7 +732,7 @@ class StrategyManager:
 
         yielded = False
         for strategy in self.locator_strategies:
-            if text_only and type(strategy).__name__ == "TextElementStrategy":
+            if text_only and isinstance(strategy, TextElementStrategy):
                 continue
             execution_logger.debug(f"Trying strategy: {type(strategy).__name__} for element: {effective_element}")
             locate_result = self._try_strategy_locate(
@@ -700,7 +748,7 @@ class StrategyManager:
         self, deadline: float, idx: int, applicable_strategies: List[Any]
     ) -> Optional[Tuple[int, float, int]]:
         """Compute seconds to allocate for this strategy. Returns (alloc, remaining_total, remaining_strategies) or None to break."""
-        remaining_total = max(0.0, deadline - time.time())
+        remaining_total = max(0.0, deadline - time.monotonic())
         remaining_strategies = len(applicable_strategies) - idx
         if remaining_total <= 0:
             internal_logger.debug("No remaining time left to try further strategies.")
@@ -730,8 +778,7 @@ class StrategyManager:
         effective_elements = [utils.parse_text_only_prefix(el)[0] for el in elements]
         has_text_only = any(utils.parse_text_only_prefix(el)[1] for el in elements)
 
-        deadline = time.time() + timeout
-        last_exception = None
+        deadline = time.monotonic() + timeout
         applicable_strategies = [
             s for s in self.locator_strategies
             if self._can_strategy_assert_elements(s, element_type, method_name)
@@ -739,7 +786,7 @@ class StrategyManager:
         if has_text_only:
             applicable_strategies = [
                 s for s in applicable_strategies
-                if type(s).__name__ != "TextElementStrategy"
+                if not isinstance(s, TextElementStrategy)
             ]
         if not applicable_strategies:
             raise OpticsError(Code.E0201, message=f"No strategies found for elements: {elements} with rule '{rule}'.")
@@ -754,17 +801,14 @@ class StrategyManager:
                 f"Allocating {alloc}s to strategy {type(strategy).__name__} "
                 f"(remaining_total={remaining_total}s, remaining_strategies={remaining_strategies})"
             )
-            try:
-                result, timestamp, annotated_frame = self._try_assert_with_strategy(
-                    strategy, effective_elements, alloc, rule, method_name
-                )
-                if result:
-                    return result, timestamp, annotated_frame
-            except Exception as e:
-                last_exception = e
+            # _try_assert_with_strategy reports failures as (False, None, None), so the loop
+            # branches on the value instead of unwinding an exception per strategy.
+            result, timestamp, annotated_frame = self._try_assert_with_strategy(
+                strategy, effective_elements, alloc, rule, method_name
+            )
+            if result:
+                return result, timestamp, annotated_frame
 
-        if last_exception:
-            internal_logger.debug(f"{method_name} ended with last exception: {last_exception}")
         raise OpticsError(Code.E0201, message=f"{elements} not found based on rule '{rule}'.")
 
     def _validate_rule(self, rule: str):
@@ -789,7 +833,8 @@ class StrategyManager:
     def _try_assert_with_strategy(self, strategy, elements: list, timeout: int, rule: str, method_name: str = "assert_elements"):
         """Try to assert elements using a specific strategy.
 
-        Strategies are required to return (result, timestamp, annotated_frame).
+        Strategies are required to return (result, timestamp, annotated_frame). Never raises:
+        a strategy error is traced and reported as ``(False, None, None)``.
         """
         try:
             result, timestamp, annotated_frame = getattr(strategy, method_name)(elements, timeout, rule)
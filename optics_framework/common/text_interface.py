@@ -14,6 +14,10 @@ class TextInterface(ABC):
     and reference data as needed.
     """
 
+    #: True when :meth:`detect_text_batch` runs all frames through one batched
+    #: inference call rather than looping over :meth:`detect_text`.
+    supports_batched_detection: bool = False
+
     @abstractmethod
     def element_exist(
         self, input_data: Any, reference_data: Any
@@ -66,3 +70,17 @@ class TextInterface(ABC):
         :type input_data: Any
         """
         pass
+
+    def detect_text_batch(
+        self, frames: List[Any]
+    ) -> List[Optional[Tuple[str, List[Tuple[List[Tuple[int, int]], str, float]]]]]:
+        """
+        Detect text in several frames, returning one :meth:`detect_text` result per frame.
+
+        The default runs :meth:`detect_text` on each frame in turn; engines that can
+        batch inference override this and set ``supports_batched_detection``.
+
+        :param frames: Frames of equal size (e.g. from one screenshot stream).
+        :type frames: List[Any]
+        """
+        return [self.detect_text(frame) for frame in frames]
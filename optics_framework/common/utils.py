@@ -1,4 +1,5 @@
 from datetime import datetime
+import functools
 import hashlib
 from fuzzywuzzy import fuzz
 import re
@@ -7,6 +8,7 @@ import cv2
 import json
 import base64
 import time
+import threading
 import numpy as np
 from enum import Enum
 from datetime import timezone, timedelta
@@ -163,11 +165,26 @@ def escape_csv_value(s: str) -> str:
     return s.replace("\\", "\\\\").replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t")
 
 
+# Per CSS spec, a valid #id must start with a letter, underscore, or hyphen after #.
+# Strings that begin with a digit after # are not valid CSS selectors and fall through to Text. E.g. #91
+_CSS_ID_RE = re.compile(r"#(?:[^\W\d]|-)")
+# Tag-qualified selectors such as input[...], button#id, div.cls
+_CSS_TAG_RE = re.compile(
+    r"(?:input|button|div|span|a|img|select|textarea|form|label|p|h[1-6])[\[#.]"
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def determine_element_type(element):
+    """Classify a locator string as Text, Image, CSS, XPath, ID or Class.
+
+    Memoized: test suites resolve the same handful of locators on every step, so repeat
+    lookups are a dict hit instead of a chain of prefix/suffix checks.
+    """
     element = element.strip()
     el = element.lower()
 
-    if el.startswith(TEXT_ONLY_PREFIX) or el.startswith("text="):
+    if el.startswith((TEXT_ONLY_PREFIX, "text=")):
         return "Text"
     if el.endswith((".jpg", ".jpeg", ".png", ".bmp")):
         return "Image"
@@ -179,14 +196,8 @@ def determine_element_type(element):
         return "ID"
     if el.startswith(("android.", "xcui")):
         return "Class"
-
-    # Per CSS spec, a valid #id must start with a letter, underscore, or hyphen after #.
-    # Strings that begin with a digit after # are not valid CSS selectors and fall through to Text. E.g. #91
-    _css_tags = {"input", "button", "div", "span", "a", "img", "select", "textarea",
-                 "form", "label", "p", "h1", "h2", "h3", "h4", "h5", "h6"}
-    is_css_id  = element.startswith("#") and len(element) > 1 and (element[1].isalpha() or element[1] in "_-")
-    is_css_tag = any(el.startswith(tag + c) for tag in _css_tags for c in ("[", "#", "."))
-    if ("[" in element and "]" in element) or element.startswith(".") or is_css_id or is_css_tag:
+    if ("[" in element and "]" in element) or element.startswith(".") \
+            or _CSS_ID_RE.match(element) or _CSS_TAG_RE.match(el):
         return "CSS"
 
     return "Text"
@@ -274,10 +285,53 @@ def capture_base64_screenshot_bytes(get_base64: Callable[[], str], backend_name:
     raise RuntimeError(f"Error capturing {backend_name} screenshot bytes: {last_exc}") from last_exc
 
 
+# Backoff between polls of the element sources' assert_elements loops: each poll is a driver
+# round-trip (page_source / find_element), so start short and double up to a cap instead of
+# re-querying in a tight spin.
+POLL_BACKOFF_START_S = 0.05
+POLL_BACKOFF_MAX_S = 0.5
+
+
+def sleep_before_next_poll(delay: float, deadline: float) -> float:
+    """Sleep ``delay`` seconds (never past the monotonic ``deadline``) and return the next delay."""
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(min(delay, remaining))
+    return min(delay * 2, POLL_BACKOFF_MAX_S)
+
+
+# Appium hierarchies carry everything in attributes, so the whitespace-only text nodes and the
+# xml:id table the default parser builds are never read. lxml parsers must not be shared across
+# threads, hence one per thread. Entity resolution stays off since huge_tree lifts the size limits.
+_xml_parser_local = threading.local()
+
+
+def parse_page_source_xml(data: bytes) -> Any:
+    """Parse UTF-8 page-source bytes into an lxml root element with the lean page-source parser."""
+    from lxml import etree  # type: ignore[import-untyped]
+    parser = getattr(_xml_parser_local, "parser", None)
+    if parser is None:
+        parser = etree.XMLParser(
+            remove_blank_text=True, remove_comments=True, collect_ids=False,
+            huge_tree=True, resolve_entities=False,
+        )
+        _xml_parser_local.parser = parser
+    return etree.fromstring(data, parser)
+
+
 def compute_hash(xml_string):
     """Computes the SHA-256 hash of the XML string."""
     return hashlib.sha256(xml_string.encode('utf-8')).hexdigest()
 
+
+def compute_frame_hash(frame: np.ndarray) -> str:
+    """Cheap content hash of a screenshot frame (8-byte BLAKE2b over the raw pixels).
+
+    The array's buffer is hashed in place; going through ``tobytes()`` would copy the
+    whole frame (~8 MB for a 1080x2400 screen) on every cache lookup.
+    """
+    return hashlib.blake2b(np.ascontiguousarray(frame), digest_size=8).hexdigest()
+
 def detect_change(frame1, frame2, threshold=0.95):
     """
     Returns True if the 2 frames have differences above threshold.
@@ -296,9 +350,16 @@ def compare_text(given_text, target_text):
     Returns True if the texts match closely enough, otherwise False.
     """
     # Normalize both texts (case insensitive, strip whitespace)
-    given_text = given_text.strip().lower()
-    target_text = target_text.strip().lower()
+    return compare_normalized_text(given_text.strip().lower(), target_text.strip().lower())
+
 
+def compare_normalized_text(given_text, target_text):
+    """
+    :func:`compare_text` for values already stripped and lower-cased.
+
+    Callers matching one target against many values normalize each side once and call this
+    in the loop instead of re-normalizing both strings per pair.
+    """
     # Check if either of the strings is empty and return False if so
     if not given_text or not target_text:
         internal_logger.debug(f"One or both texts are empty: given_text='{given_text}', target_text='{target_text}'")
@@ -307,27 +368,23 @@ def compare_text(given_text, target_text):
     # 1. Exact Match (return immediately)
     if given_text == target_text:
         internal_logger.debug(f"Exact match found: '{given_text}' == '{target_text}'")
-        internal_logger.debug(f'Exact match found for text: {given_text}')
         return True
 
     # 2. Partial Match (substring, return immediately)
     if target_text in given_text:
         internal_logger.debug(f"Partial match found: '{target_text}' in '{given_text}'")
-        internal_logger.debug(f'Partial match found for text: {target_text}')
         return True
 
     # 3. Fuzzy Match (only if exact and partial checks fail)
     fuzzy_match_score = fuzz.ratio(given_text, target_text)
-    internal_logger.debug(f"Fuzzy match score for '{given_text}' and '{target_text}': {fuzzy_match_score}")
     if fuzzy_match_score >= 80:  # Threshold for "close enough"
-        internal_logger.debug(f"Fuzzy match found: score {fuzzy_match_score}")
-        internal_logger.debug(f"Fuzzy match found for text: {given_text}, matched text '{target_text}' with fuzzy score {fuzzy_match_score} ")
+        internal_logger.debug(f"Fuzzy match found for text: {given_text}, matched text '{target_text}' with fuzzy score {fuzzy_match_score}")
         return True
 
     # If no matches found, return False
-    internal_logger.debug(f"No match found for '{given_text}' and '{target_text}' using all matching algorithms.")
     return False
 
+
 def save_screenshot(img, name, output_dir, time_stamp=None):
     """
     Save the screenshot with a timestamp and keyword in the filename.
@@ -876,7 +933,7 @@ def bbox_from_appium_attribute_fallback(element: Any) -> Optional[Tuple[Tuple[in
 
 def bbox_from_webelement_like(obj: Any) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
     """
-    Return bounding box for a single WebElement-like object with .location/.size or .rect.
+    Return bounding box for a single WebElement-like object with .rect or .location/.size.
 
     Works for both Android (UIAutomator2) and iOS (XCUITest); both expose W3C-compatible
     location, size, and rect on the WebElement.
@@ -886,6 +943,18 @@ def bbox_from_webelement_like(obj: Any) -> Optional[Tuple[Tuple[int, int], Tuple
     """
     if obj is None:
         return None
+    # Selenium 4 serves .location and .size from separate GET rect calls; .rect is one
+    # round-trip for the same data, so try it first.
+    try:
+        rect = getattr(obj, "rect", None)
+        if rect is not None and isinstance(rect, dict):
+            x1 = int(rect.get("x", 0))
+            y1 = int(rect.get("y", 0))
+            w = int(rect.get("width", 0))
+            h = int(rect.get("height", 0))
+            return ((x1, y1), (x1 + w, y1 + h))
+    except (TypeError, ValueError, AttributeError):
+        pass
     try:
         loc = getattr(obj, "location", None)
         sz = getattr(obj, "size", None)
@@ -897,16 +966,6 @@ def bbox_from_webelement_like(obj: Any) -> Optional[Tuple[Tuple[int, int], Tuple
             return ((x1, y1), (x2, y2))
     except (TypeError, ValueError, AttributeError):
         pass
-    try:
-        rect = getattr(obj, "rect", None)
-        if rect is not None and isinstance(rect, dict):
-            x1 = int(rect.get("x", 0))
-            y1 = int(rect.get("y", 0))
-            w = int(rect.get("width", 0))
-            h = int(rect.get("height", 0))
-            return ((x1, y1), (x1 + w, y1 + h))
-    except (TypeError, ValueError, AttributeError):
-        pass
     return None
 
 
@@ -1,5 +1,6 @@
 import subprocess  # nosec
-from typing import Any, Dict, List, Optional, Union
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 from appium import webdriver
 from appium.webdriver.webdriver import WebDriver
 from appium.webdriver.client_config import AppiumClientConfig
@@ -28,6 +29,16 @@ from optics_framework.engines.drivers.appium_platforms import (
 )
 from optics_framework.common.error import OpticsError, Code
 
+# Unit (dx, dy) per swipe direction, in screen coordinates.
+_SWIPE_VECTORS = {"up": (0, -1), "down": (0, 1), "left": (-1, 0), "right": (1, 0)}
+# Drag duration of each swipe in a batched W3C sequence (matches driver.swipe's 1000ms on Android).
+_BATCH_SWIPE_MOVE_MS = 1000
+# Pause between swipes in a batch so each fling registers as a separate gesture.
+_BATCH_SWIPE_GAP_S = 0.3
+# How long a fetched window size is trusted. Apps can rotate on their own (video players,
+# landscape-only screens) without a new session, so the size is re-read periodically.
+_WINDOW_SIZE_TTL_S = 2.0
+
 
 class Appium(DriverInterface):
     DEPENDENCY_TYPE = "driver_sources"
@@ -110,6 +121,8 @@ class Appium(DriverInterface):
         # UI Tree handling
         self.ui_helper: Optional[UIHelper] = None
         self.initialized: bool = True
+        # (session_id, window size, fetched at) -- see _window_size().
+        self._window_size_cache: Optional[tuple[str, Dict[str, int], float]] = None
 
     def _require_driver(self) -> WebDriver:
         """Helper to ensure self.driver is initialized, else raise error."""
@@ -118,6 +131,36 @@ class Appium(DriverInterface):
             raise OpticsError(Code.E0101, message=self.NOT_INITIALIZED)
         return self.driver
 
+    def _window_size(self, frame_shape: Optional[Tuple[int, ...]] = None) -> Dict[str, int]:
+        """Window size of the current session, cached briefly to skip repeat round-trips.
+
+        Percentage-based gestures and coordinate scaling all need it; caching it saves an
+        Appium round-trip per press/swipe/scroll in a burst of gestures. The cache is keyed
+        on the session id, so a new or re-attached session always re-resolves it, and
+        expires after ``_WINDOW_SIZE_TTL_S`` so a rotation is picked up. When the caller
+        has a screenshot, ``frame_shape`` lets a rotation be detected immediately: a
+        landscape frame against a cached portrait size (or vice versa) forces a re-fetch.
+        """
+        driver = self._require_driver()
+        now = time.monotonic()
+        cached = self._window_size_cache
+        if (
+            cached is None
+            or cached[0] != driver.session_id
+            or now - cached[2] > _WINDOW_SIZE_TTL_S
+            or (frame_shape is not None and self._orientation_differs(cached[1], frame_shape))
+        ):
+            cached = (driver.session_id, driver.get_window_size(), now)
+            self._window_size_cache = cached
+        return cached[1]
+
+    @staticmethod
+    def _orientation_differs(size: Dict[str, int], frame_shape: Tuple[int, ...]) -> bool:
+        frame_height, frame_width = frame_shape[:2]
+        if frame_width == frame_height or size["width"] == size["height"]:
+            return False
+        return (frame_width > frame_height) != (size["width"] > size["height"])
+
     def _active_platform(self) -> str:
         """Normalized platformName from live or configured capabilities."""
         caps: Dict[str, Any] = {}
@@ -744,6 +787,11 @@ class Appium(DriverInterface):
         return self.driver
 
     # APPIUM api wrappers
+    def invalidate_ui_cache(self) -> None:
+        # Called after every device keyword on every platform; must stay unguarded.
+        if self.ui_helper is not None:
+            self.ui_helper.invalidate_page_source()
+
     @supported_on(*MOBILE)
     def click_element(self, element: Any, event_name: Optional[str] = None) -> None:
         """
@@ -851,21 +899,75 @@ class Appium(DriverInterface):
         swipe_length_percentage: int,
         event_name: Optional[str] = None
     ) -> None:
-        driver = self._require_driver()
-        window_size = driver.get_window_size()
+        geometry = self._percentage_swipe_geometry(x_percentage, y_percentage, direction, swipe_length_percentage)
+        if geometry is None:
+            return
+        start_x, start_y, swipe_length = geometry
+        self.swipe(start_x, start_y, direction, swipe_length, event_name)
+
+    def _percentage_swipe_geometry(
+        self, x_percentage: int, y_percentage: int, direction: str, swipe_length_percentage: int
+    ) -> Optional[Tuple[int, int, int]]:
+        """Convert a percentage swipe into pixel (start_x, start_y, length); None for an unknown direction."""
+        window_size = self._window_size()
         width = window_size["width"]
         height = window_size["height"]
         start_x = int(width * x_percentage / 100)
         start_y = int(height * y_percentage / 100)
-        swipe_length: int
         if direction in ("up", "down"):
-            swipe_length = int(height * swipe_length_percentage / 100)
-        elif direction in ("left", "right"):
-            swipe_length = int(width * swipe_length_percentage / 100)
-        else:
-            internal_logger.error(f"Unknown swipe direction: {direction}")
+            return start_x, start_y, int(height * swipe_length_percentage / 100)
+        if direction in ("left", "right"):
+            return start_x, start_y, int(width * swipe_length_percentage / 100)
+        internal_logger.error(f"Unknown swipe direction: {direction}")
+        return None
+
+    @supported_on(*MOBILE)
+    def swipe_percentage_batch(
+        self,
+        x_percentage: int,
+        y_percentage: int,
+        direction: str,
+        swipe_length_percentage: int,
+        count: int,
+        event_name: Optional[str] = None
+    ) -> None:
+        """
+        Queue ``count`` swipes into a single W3C Actions sequence and send it in one request,
+        instead of one ``/touch/perform`` round-trip per swipe.
+        """
+        driver = self._require_driver()
+        geometry = self._percentage_swipe_geometry(x_percentage, y_percentage, direction, swipe_length_percentage)
+        if geometry is None:
             return
-        self.swipe(start_x, start_y, direction, swipe_length, event_name)
+        start_x, start_y, swipe_length = geometry
+        dx, dy = _SWIPE_VECTORS[direction]
+        end_x, end_y = start_x + dx * swipe_length, start_y + dy * swipe_length
+
+        actions = ActionBuilder(
+            driver,
+            mouse=PointerInput(interaction.POINTER_TOUCH, "touch"),
+            duration=_BATCH_SWIPE_MOVE_MS,
+        )
+        for _ in range(count):
+            actions.pointer_action.move_to_location(start_x, start_y)
+            actions.pointer_action.pointer_down()
+            actions.pointer_action.pause(0.4)   # Same pre-move pause as the iOS swipe; avoids taps being read as long-press
+            actions.pointer_action.move_to_location(end_x, end_y)
+            actions.pointer_action.pointer_up()
+            actions.pointer_action.pause(_BATCH_SWIPE_GAP_S)
+
+        timestamp = self.event_sdk.get_current_time_for_events()
+        try:
+            internal_logger.debug(
+                f"Batched {count} swipes (W3C) from ({start_x},{start_y}) to ({end_x},{end_y})"
+            )
+            actions.perform()
+            if event_name:
+                self.event_sdk.capture_event_with_time_input(event_name, timestamp)
+        except Exception as e:
+            internal_logger.debug(
+                f"Failed batched swipe from ({start_x},{start_y}) to ({end_x},{end_y}): {e}"
+            )
 
     @supported_on(*MOBILE)
     def swipe_element(
@@ -876,9 +978,9 @@ class Appium(DriverInterface):
         event_name: Optional[str] = None
     ) -> None:
         driver = self._require_driver()
-        location = element.location
+        # One GET rect round-trip; .location and .size would each fetch it.
+        location = size = element.rect
         swipe_length = int(swipe_length)
-        size = element.size
         start_x: int = location["x"]
         start_y: int = location["y"]
         end_x: int
@@ -933,7 +1035,7 @@ class Appium(DriverInterface):
         event_name: Optional[str] = None
     ) -> None:
         driver = self._require_driver()
-        window_size = driver.get_window_size()
+        window_size = self._window_size()
         width = window_size["width"]
         height = window_size["height"]
         start_x: int
@@ -1168,10 +1270,9 @@ class Appium(DriverInterface):
 
     # helper functions
     def pixel_2_appium(self, x: int, y: int, screenshot: Any) -> Optional[tuple[int, int]]:
-        driver = self._require_driver()
         if not x or not y:
             return None
-        window_size = driver.get_window_size()
+        window_size = self._window_size(screenshot.shape)
         screen_width = window_size["width"]
         screen_height = window_size["height"]
         internal_logger.debug(f"Appium Window Size: {screen_width, screen_height}")
@@ -1221,8 +1322,7 @@ class Appium(DriverInterface):
         event_name: Optional[str] = None
     ) -> None:
         percentage_x, percentage_y = int(percentage_x), int(percentage_y)
-        driver = self._require_driver()
-        window_size = driver.get_window_size()
+        window_size = self._window_size()
         x = int(window_size["width"] * percentage_x / 100)
         y = int(window_size["height"] * percentage_y / 100)
         for _ in range(repeat):
@@ -1,4 +1,5 @@
 import re
+import time
 from typing import Any, List, Dict, Tuple, Optional, Union, cast
 from fuzzywuzzy import fuzz
 from lxml import etree
@@ -13,6 +14,16 @@ XPATH_UNIQUE_ATTRIBUTES = [
 ]
 XPATH_MAYBE_UNIQUE_ATTRIBUTES = ["label", "text", "value"]
 
+# Locator attributes scanned by get_locator_and_strategy_using_index, with their
+# "//*[@attr]" XPath compiled once rather than re-parsed on every lookup.
+_LOCATOR_ATTRIBUTES = ["resource-id", "text", "content-desc", "name", "value", "label"]
+_LOCATOR_ATTRIBUTE_XPATHS = {attrib: etree.XPath(f"//*[@{attrib}]") for attrib in _LOCATOR_ATTRIBUTES}
+
+# How long a fetched page source is reused. A single keyword resolves a locator through
+# several helpers (get_locator_and_strategy, get_view_locator, find_xpath, ...), each of which
+# used to make its own page_source round-trip; device actions invalidate the snapshot early.
+_PAGE_SOURCE_TTL_S = 0.2
+
 
 class UIHelper:
     def __init__(self, appium_driver):
@@ -23,19 +34,35 @@ class UIHelper:
         self.tree = None
         self.root = None
         self.prev_hash = None
+        self.page_source_ttl: float = _PAGE_SOURCE_TTL_S
+        # (monotonic fetch time, page source, timestamp) of the last fetch backing self.tree.
+        self._snapshot: Optional[Tuple[float, str, str]] = None
 
     def get_page_source(self):
         """
         Fetch the current UI tree (page source) from the Appium driver.
+
+        A snapshot younger than ``page_source_ttl`` seconds is reused unless
+        :meth:`invalidate_page_source` was called since.
         """
+        if self._snapshot is not None:
+            fetched_at, page_source, time_stamp = self._snapshot
+            if time.monotonic() - fetched_at < self.page_source_ttl:
+                return page_source, time_stamp
         time_stamp = utils.get_timestamp()
         page_source = self.driver.driver.page_source
-        self.tree = etree.ElementTree(etree.fromstring(page_source.encode("utf-8")))
-        self.root = self.tree.getroot()
+        self.root = utils.parse_page_source_xml(page_source.encode("utf-8"))
+        self.tree = self.root.getroottree()
         internal_logger.debug(f"Page source fetched at: {time_stamp}")
         utils.save_page_source(page_source, time_stamp, self.driver.event_sdk.config_handler.config.execution_output_path)
+        if self.page_source_ttl > 0:
+            self._snapshot = (time.monotonic(), page_source, time_stamp)
         return page_source, time_stamp
 
+    def invalidate_page_source(self) -> None:
+        """Drop the reused page source; the next lookup fetches a fresh one."""
+        self._snapshot = None
+
     # fetching page source and handling UI tree
     def get_distinct_page_source(self):
         """
@@ -53,8 +80,9 @@ class UIHelper:
             return None, time_stamp
 
         self.prev_hash = new_hash
-        self.tree = etree.ElementTree(etree.fromstring(page_source.encode("utf-8")))
-        self.root = self.tree.getroot()
+        self.root = utils.parse_page_source_xml(page_source.encode("utf-8"))
+        self.tree = self.root.getroottree()
+        self._snapshot = None
         internal_logger.debug(f"Page source fetched at: {time_stamp}")
         return page_source, time_stamp
 
@@ -401,11 +429,11 @@ class UIHelper:
         return attributes
 
     def _find_exact_or_suffix_match(
-        self, element: str, strategies: List[Tuple[str, str, str]], time_stamp: str
+        self, element: str, strategies: List[Tuple[str, etree.XPath, str]], time_stamp: str
     ) -> Optional[Dict]:
         """First pass: return match dict for exact or suffix match, or None."""
         for strategy_name, xpath_query, attrib in strategies:
-            elements = self.tree.xpath(xpath_query)
+            elements = xpath_query(self.tree)
             for elem in elements:
                 value = elem.attrib.get(attrib, "").strip()
                 if not value:
@@ -438,12 +466,8 @@ class UIHelper:
         tree = self.tree
 
         strategies = [
-            ("text", "//*[@text]", "text"),
-            ("resource-id", "//*[@resource-id]", "resource-id"),
-            ("content-desc", "//*[@content-desc]", "content-desc"),
-            ("name", "//*[@name]", "name"),
-            ("value", "//*[@value]", "value"),
-            ("label", "//*[@label]", "label"),
+            (attrib, _LOCATOR_ATTRIBUTE_XPATHS[attrib], attrib)
+            for attrib in ("text", "resource-id", "content-desc", "name", "value", "label")
         ]
 
         exact = self._find_exact_or_suffix_match(element, strategies, time_stamp)
@@ -454,7 +478,7 @@ class UIHelper:
         best_candidate = None
         best_score = 0
         for strategy_name, xpath_query, attrib in strategies:
-            elements = tree.xpath(xpath_query)
+            elements = xpath_query(tree)
             for elem in elements:
                 value = elem.attrib.get(attrib, "").strip()
                 if not value:
@@ -586,14 +610,7 @@ class UIHelper:
         tree = self.tree
 
         # Collect all elements in positional order
-        all_strategies = [
-            "resource-id",
-            "text",
-            "content-desc",
-            "name",
-            "value",
-            "label",
-        ]  # Supported attributes
+        all_strategies = _LOCATOR_ATTRIBUTES  # Supported attributes
         all_elements = []
 
         strategies = [strategy] if strategy else all_strategies
@@ -605,7 +622,8 @@ class UIHelper:
             )
 
         for strategy in strategies:
-            elements = tree.xpath(f"//*[@{strategy}]")
+            compiled = _LOCATOR_ATTRIBUTE_XPATHS.get(strategy)
+            elements = compiled(tree) if compiled is not None else tree.xpath(f"//*[@{strategy}]")
             for elem in elements:
                 attr_value = elem.attrib.get(strategy, "").strip()
                 bounds = elem.attrib.get("bounds", "")  # Parse bounds if available
@@ -618,6 +636,7 @@ class UIHelper:
         # Prefer exact matches (or suffix after '/') before falling back to fuzzy compare
         exact_matches = []
         fuzzy_matches = []
+        normalized_element = element.strip().lower()
         for idx, elem in enumerate(all_elements):
             val = elem.get("value", "")
             # exact full-string match
@@ -645,7 +664,7 @@ class UIHelper:
                 continue
 
             # fallback to fuzzy/partial compare
-            if utils.compare_text(val, element):
+            if utils.compare_normalized_text(val.strip().lower(), normalized_element):
                 fuzzy_matches.append(
                     {
                         "index": idx,
@@ -818,11 +837,9 @@ class UIHelper:
                 - "text": Only text elements
                 Can be combined: ["buttons", "inputs"]
         """
-        page_source, _ = self.get_page_source()
-        root = etree.ElementTree(
-            etree.fromstring(page_source.encode("utf-8"))
-        ).getroot()
-        elements = root.xpath(".//*")
+        # get_page_source already parsed this snapshot into self.root; don't encode and parse it again.
+        self.get_page_source()
+        elements = self.root.xpath(".//*")
         results = []
 
         for node in elements:
@@ -236,12 +236,25 @@ class SeleniumDriver(DriverInterface):
             raise
 
     def press_percentage_coordinates(self, percentage_x: float, percentage_y: float, repeat: int = 1, event_name: str | None = None) -> None:
-        """Click based on screen percentage coordinates."""
+        """Click based on viewport percentage coordinates.
+
+        The percentages are resolved against ``window.innerWidth/innerHeight`` inside the
+        click script, so each press is one round-trip and lands in the same CSS-pixel space
+        ``document.elementFromPoint`` uses (``get_window_size`` includes browser chrome).
+        """
+        script = """
+        var element = document.elementFromPoint(
+            window.innerWidth * arguments[0] / 100, window.innerHeight * arguments[1] / 100);
+        if (element) element.click();
+        """
         try:
-            size = self.driver.get_window_size()
-            abs_x = int(size['width'] * percentage_x / 100)
-            abs_y = int(size['height'] * percentage_y / 100)
-            self.press_coordinates(abs_x, abs_y, event_name)
+            timestamp = self.event_sdk.get_current_time_for_events()
+            for _ in range(repeat):
+                self.driver.execute_script(script, float(percentage_x), float(percentage_y))
+            if event_name:
+                self.event_sdk.capture_event_with_time_input(event_name, timestamp)
+            internal_logger.debug(
+                f"Clicked at percentage coordinates ({percentage_x}%, {percentage_y}%) with event: {event_name}")
         except Exception as e:
             internal_logger.error(f"Failed to click using percentage coordinates: {e}")
             raise
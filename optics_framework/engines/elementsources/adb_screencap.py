@@ -0,0 +1,79 @@
+import subprocess  # nosec B404 - used only to run adb screencap against the session's device
+from typing import Optional
+from optics_framework.common.logging_config import internal_logger
+from optics_framework.engines.elementsources import appium_screenshot
+
+# PNG files start with this 8-byte signature; anything else from screencap is an error text.
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_SCREENCAP_TIMEOUT_S = 10
+# Consecutive failed captures (non-zero exit / non-PNG output) after which adb is no longer
+# tried for this session. A timeout disables it immediately: it already cost a full timeout.
+_MAX_CONSECUTIVE_FAILURES = 2
+
+
+class AdbScreencap(appium_screenshot.AppiumScreenshot):
+    """
+    Capture Android screenshots with ``adb exec-out screencap -p``.
+
+    The PNG is streamed straight off the device over the adb channel, skipping Appium's
+    ``/screenshot`` HTTP round-trip and base64 encode/decode. Needs an ``adb`` binary on
+    PATH that can reach the session's device; when it cannot (remote grids, iOS, adb
+    missing), capture falls back to the regular Appium screenshot endpoint.
+    """
+
+    def __init__(self, driver=None):
+        super().__init__(driver)
+        self._adb_unavailable = False
+        self._consecutive_failures = 0
+
+    def _device_serial(self) -> Optional[str]:
+        get_serial = getattr(self.driver, "_get_android_device_serial", None)
+        if callable(get_serial):
+            try:
+                return get_serial()
+            except Exception as e:
+                internal_logger.debug(f"Could not resolve device serial for adb screencap: {e}")
+        return None
+
+    def _screencap(self) -> Optional[bytes]:
+        if self._adb_unavailable:
+            return None
+        cmd = ["adb"]
+        serial = self._device_serial()
+        if serial:
+            cmd.extend(["-s", serial])
+        cmd.extend(["exec-out", "screencap", "-p"])
+        try:
+            result = subprocess.run(  # nosec B603 B607 - fixed argv, no shell; serial sourced from session caps
+                cmd, capture_output=True, timeout=_SCREENCAP_TIMEOUT_S, check=False
+            )
+        except FileNotFoundError:
+            self._disable("adb not found on PATH")
+            return None
+        except subprocess.TimeoutExpired:
+            self._disable(f"adb screencap timed out after {_SCREENCAP_TIMEOUT_S}s")
+            return None
+        if result.returncode != 0 or not result.stdout.startswith(_PNG_SIGNATURE):
+            internal_logger.debug(
+                f"adb screencap failed (rc={result.returncode}): {result.stderr[:200]!r}"
+            )
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= _MAX_CONSECUTIVE_FAILURES:
+                self._disable(f"adb screencap failed {self._consecutive_failures} times in a row")
+            return None
+        self._consecutive_failures = 0
+        return result.stdout
+
+    def _disable(self, reason: str) -> None:
+        """Stop trying adb for the rest of the session; every capture goes through Appium."""
+        internal_logger.warning(f"{reason}; adb_screencap is using Appium screenshots.")
+        self._adb_unavailable = True
+
+    def capture_screenshot_bytes(self) -> bytes:
+        """
+        Return the device screen as PNG bytes, via adb when reachable, else via Appium.
+        """
+        png = self._screencap()
+        if png is not None:
+            return png
+        return super().capture_screenshot_bytes()
@@ -3,7 +3,6 @@ from typing import Optional, Any, List, Tuple, Callable
 from appium.webdriver.webdriver import WebDriver
 from appium.webdriver.common.appiumby import AppiumBy
 from selenium.common.exceptions import WebDriverException
-from lxml import etree # type: ignore
 from selenium.common.exceptions import NoSuchElementException
 from optics_framework.common.logging_config import internal_logger
 from optics_framework.common.error import OpticsError, Code
@@ -61,11 +60,8 @@ class AppiumFindElement(ElementSourceInterface):
         driver = self._require_driver()
         page_source = driver.page_source
         timestamp = utils.get_timestamp()
-        self.tree = etree.ElementTree(etree.fromstring(page_source.encode('utf-8')))
-        if self.tree is not None:
-            self.root = self.tree.getroot()
-        else:
-            self.root = None
+        self.root = utils.parse_page_source_xml(page_source.encode('utf-8'))
+        self.tree = self.root.getroottree()
         return str(page_source), str(timestamp)
 
     def get_interactive_elements(self, filter_config: Optional[List[str]] = None) -> List[Any]:
@@ -108,7 +104,7 @@ class AppiumFindElement(ElementSourceInterface):
                     return None
                 return found_element
             except (AttributeError, TypeError) as e:
-                internal_logger.error('Error finding element: %s', element, exc_info=True)
+                internal_logger.debug('Error finding element %s: %r', element, e)
                 raise OpticsError(Code.E0201, message=f"Element of type {element_type} not found using: {element}", cause=e) from e
         elif element_type == 'Text':
             locator = element[len("text="):] if element.lower().startswith("text=") else element
@@ -125,6 +121,11 @@ class AppiumFindElement(ElementSourceInterface):
                 raise
             except NoSuchElementException as e:
                 raise OpticsError(Code.E0201, message=f"Element of type {element_type} not found using: {element}", cause=e) from e
+            except WebDriverException as e:
+                # Expected on flaky sessions (stale/timeout/server errors); keep it cheap, the
+                # traceback stays reachable through the raised error's cause.
+                internal_logger.debug("Driver error finding element %s: %r", element, e)
+                raise OpticsError(Code.E0201, message=f"Element of type {element_type} not found using: {element}", cause=e) from e
             except Exception as e:
                 internal_logger.exception(f"Unexpected error finding element {element}: {e}")
                 raise OpticsError(Code.E0201, message=f"Element of type {element_type} not found using: {element}", cause=e) from e
@@ -145,6 +146,11 @@ class AppiumFindElement(ElementSourceInterface):
                 raise
             except NoSuchElementException as e:
                 raise OpticsError(Code.E0201, message=f"Element of type {element_type} not found using: {element}", cause=e) from e
+            except WebDriverException as e:
+                # Expected on flaky sessions (stale/timeout/server errors); keep it cheap, the
+                # traceback stays reachable through the raised error's cause.
+                internal_logger.debug("Driver error finding class element %s: %r", element, e)
+                raise OpticsError(Code.E0201, message=f"Element of type {element_type} not found using: {element}", cause=e) from e
             except Exception as e:
                 internal_logger.exception(f"Unexpected error finding class element {element}: {e}")
                 raise OpticsError(Code.E0201, message=f"Element of type {element_type} not found using: {element}", cause=e) from e
@@ -197,16 +203,18 @@ class AppiumFindElement(ElementSourceInterface):
         if rule not in ["any", "all"]:
             raise OpticsError(Code.E0403, message="Invalid rule. Use 'any' or 'all'.")
 
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
         found = dict.fromkeys(elements, False)
+        delay = utils.POLL_BACKOFF_START_S
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             try:
                 result = self._assert_elements_one_pass(elements, found, rule, check_fn)
                 if result is not None:
                     return result
             except Exception as e:
                 raise OpticsError(Code.E0401, message=f"Error during {error_desc}: {e}") from e
+            delay = utils.sleep_before_next_poll(delay, deadline)
         internal_logger.warning(f"Timeout reached. Rule: {rule}, Elements: {elements}")
         raise TimeoutError(
             f"Timeout reached: {not_found_desc} based on rule '{rule}': {elements}"
@@ -1,15 +1,22 @@
+import hashlib
 import time
+from collections import OrderedDict
 from typing import Optional, Any, Tuple, List
 from lxml import etree  # type: ignore
 from appium.webdriver.webdriver import WebDriver
 from appium.webdriver.common.appiumby import AppiumBy
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
 from optics_framework.common.logging_config import internal_logger, execution_logger
 from optics_framework.common import utils
 from optics_framework.common.elementsource_interface import ElementSourceInterface
 from optics_framework.common.error import OpticsError, Code
 
 APPIUM_NOT_INITIALISED_MSG = "Appium driver is not initialized for AppiumPageSource."
+# Parsed trees kept per instance, keyed by a digest of the XML. assert_elements re-polls the
+# page source in a tight loop and an idle screen returns the same blob each time.
+_PARSE_CACHE_ENTRIES = 4
+# Attributes ui_text_search matches texts against.
+_TEXT_ATTRIBUTES = ("text", "resource-id", "content-desc", "name", "value", "label")
 
 class AppiumPageSource(ElementSourceInterface):
     REQUIRED_DRIVER_TYPE = "appium"
@@ -30,6 +37,7 @@ class AppiumPageSource(ElementSourceInterface):
         self.driver = driver
         self.tree = None
         self.root = None
+        self._parse_cache: "OrderedDict[bytes, Any]" = OrderedDict()
 
     def _require_webdriver(self) -> WebDriver:
         # If self.driver is None, raise error first
@@ -65,14 +73,25 @@ class AppiumPageSource(ElementSourceInterface):
 
         driver = self._require_webdriver()
         page_source = driver.page_source
-        self.tree = etree.ElementTree(etree.fromstring(page_source.encode('utf-8')))
-        if self.tree is not None:
-            self.root = self.tree.getroot()
-        else:
-            self.root = None
+        self.root = self._parse_page_source(page_source)
+        self.tree = self.root.getroottree()
         internal_logger.debug('Page source fetched at: %s', time_stamp)
         return str(page_source), str(time_stamp)
 
+    def _parse_page_source(self, page_source: str) -> Any:
+        """Parse the XML into its root element, reusing the root of an identical recent snapshot."""
+        data = page_source.encode('utf-8')
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        root = self._parse_cache.get(digest)
+        if root is not None:
+            self._parse_cache.move_to_end(digest)
+            return root
+        root = utils.parse_page_source_xml(data)
+        self._parse_cache[digest] = root
+        if len(self._parse_cache) > _PARSE_CACHE_ENTRIES:
+            self._parse_cache.popitem(last=False)
+        return root
+
     def get_interactive_elements(self, filter_config: Optional[List[str]] = None):
         if self.driver is not None and hasattr(self.driver, "ui_helper"):
             return self.driver.ui_helper.get_interactive_elements(filter_config)
@@ -91,6 +110,10 @@ class AppiumPageSource(ElementSourceInterface):
             return element_obj
         except NoSuchElementException as e:
             raise OpticsError(Code.E0201, message=f"Element of type {element_type} not found using: {element}", cause=e) from e
+        except WebDriverException as e:
+            # Expected on flaky sessions; skip the traceback, it stays on the raised error's cause.
+            internal_logger.debug("Driver error finding element by text: %s: %r", xpath, e)
+            raise RuntimeError("Error finding element by text.") from e
         except Exception as e:
             internal_logger.exception("Error finding element by text: %s: %s", xpath, e)
             raise RuntimeError("Error finding element by text.") from e
@@ -103,6 +126,9 @@ class AppiumPageSource(ElementSourceInterface):
                 return element_obj
             except NoSuchElementException as e:
                 raise OpticsError(Code.E0201, message=f"Element of type {element_type} not found using: {element}", cause=e) from e
+            except WebDriverException as e:
+                internal_logger.debug("Driver error finding element by xpath: %s: %r", xpath, e)
+                raise RuntimeError("Error finding element by xpath.") from e
             except Exception as e:
                 internal_logger.exception("Error finding element by xpath: %s: %s", xpath, e)
                 raise RuntimeError("Error finding element by xpath.") from e
@@ -177,6 +203,9 @@ class AppiumPageSource(ElementSourceInterface):
                     element_obj = self._require_webdriver().find_element(AppiumBy.XPATH, xpath)
                 except NoSuchElementException:
                     return None
+                except WebDriverException as e:
+                    internal_logger.debug("Driver error finding element by index: %s: %r", xpath, e)
+                    return None
                 except Exception as e:
                     internal_logger.exception("Error finding element by index: %s: %s", xpath, e)
                     return None
@@ -204,29 +233,37 @@ class AppiumPageSource(ElementSourceInterface):
             Exception: If elements are not found based on the rule within the timeout.
         """
         self._validate_rule(rule)
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            texts = [el for el in elements if utils.determine_element_type(el) == 'Text']
-            xpaths = [el for el in elements if utils.determine_element_type(el) == 'XPath']
-
+        deadline = time.monotonic() + timeout
+        delay = utils.POLL_BACKOFF_START_S
+        # Classification does not change between polls; partition once.
+        texts, xpaths = [], []
+        for el in elements:
+            element_type = utils.determine_element_type(el)
+            if element_type == 'Text':
+                texts.append(el)
+            elif element_type == 'XPath':
+                xpaths.append(el)
+        compiled_xpaths = {xpath: self._compile_xpath(xpath) for xpath in xpaths}
+        ui_helper = getattr(self.driver, "ui_helper", None) if self.driver is not None else None
+
+        while time.monotonic() < deadline:
             self.get_page_source()  # Refresh page source
 
             # Check text-based elements
             text_found = self.ui_text_search(texts, rule) if texts else (rule == "all")
 
-            # Check XPath-based elements
-            if self.driver is not None and hasattr(self.driver, "ui_helper") and self.driver.ui_helper is not None and xpaths:
-                xpath_results = [self.driver.ui_helper.find_xpath(xpath)[0] for xpath in xpaths]
+            # Check XPath-based elements; the generator lets all()/any() stop at the first decisive one
+            if ui_helper is not None and xpaths:
+                checks = (self._xpath_present(ui_helper, xpath, compiled_xpaths[xpath]) for xpath in xpaths)
+                xpath_found = all(checks) if rule == "all" else any(checks)
             else:
-                xpath_results = [rule == "all"]
-            xpath_found = (all(xpath_results) if rule == "all" else any(xpath_results))
+                xpath_found = rule == "all"
 
             # Rule evaluation
             if (rule == "any" and (text_found or xpath_found)) or (rule == "all" and text_found and xpath_found):
                 return True, utils.get_timestamp()
 
-            # Optional: time.sleep(0.3)  # Delay to reduce busy looping
+            delay = utils.sleep_before_next_poll(delay, deadline)
 
         # Timeout reached
         internal_logger.warning(f"Timeout reached. Rule: {rule}, Elements: {elements}")
@@ -234,6 +271,23 @@ class AppiumPageSource(ElementSourceInterface):
             f"Timeout reached: Elements not found based on rule '{rule}': {elements}"
         )
 
+    @staticmethod
+    def _compile_xpath(xpath: str) -> Optional[Any]:
+        try:
+            return etree.XPath(xpath)
+        except etree.XPathSyntaxError:
+            return None
+
+    def _xpath_present(self, ui_helper: Any, xpath: str, compiled: Optional[Any]) -> bool:
+        """Exact match against the tree fetched for this poll; fuzzy UIHelper matching only on a miss."""
+        if compiled is not None and self.root is not None:
+            try:
+                if compiled(self.root):
+                    return True
+            except etree.XPathEvalError:
+                pass
+        return bool(ui_helper.find_xpath(xpath)[0])
+
     def _validate_rule(self, rule):
         if rule not in ["any", "all"]:
             raise ValueError("Invalid rule. Use 'any' or 'all'.")
@@ -276,30 +330,37 @@ class AppiumPageSource(ElementSourceInterface):
 
     def _validate_tree(self):
         """Validates that the element tree is initialized."""
-        if self.tree is None:
+        if self.root is None:
             internal_logger.error("Element tree is not initialized. Cannot perform xpath search.")
             raise RuntimeError("Element tree is not initialized.")
 
-    def _search_text_in_attribute(self, text, attrib):
-        """Searches for text in a specific attribute across all elements."""
-        matching_elements = self.tree.xpath(f"//*[@{attrib}]")
-
-        for elem in matching_elements:
-            attrib_value = elem.attrib.get(attrib, '').strip()
-            if attrib_value and utils.compare_text(attrib_value, text):
-                internal_logger.debug(f"Match found using {attrib} for '{text}'")
-                return True
-        return False
-
-    def _search_single_text(self, text):
-        """Searches for a single text across all strategies."""
-        strategies = ["text", "resource-id", "content-desc", "name", "value", "label"]
-        internal_logger.debug(f'Searching for text: {text}')
-
-        for attrib in strategies:
-            if self._search_text_in_attribute(text, attrib):
-                return True
-        return False
+    def _attribute_values(self):
+        """Distinct normalized values of the text attributes, gathered in one tree walk."""
+        values = {}
+        for elem in self.root.iter(etree.Element):
+            attrib = elem.attrib
+            for name in _TEXT_ATTRIBUTES:
+                value = attrib.get(name)
+                if value:
+                    value = value.strip().lower()
+                    if value:
+                        values[value] = None
+        return list(values)
+
+    @staticmethod
+    def _text_matches(text, values, value_set):
+        """True if ``text`` matches any attribute value (exact via set lookup, else compare_text).
+
+        ``values`` are already stripped and lower-cased, so the target is normalized once here
+        rather than both sides on every comparison.
+        """
+        target = text.strip().lower()
+        if not target:
+            return False
+        if target in value_set:
+            internal_logger.debug("Exact match found for '%s'", text)
+            return True
+        return any(utils.compare_normalized_text(value, target) for value in values)
 
     def ui_text_search(self, texts, rule='any'):
         """
@@ -313,12 +374,18 @@ class AppiumPageSource(ElementSourceInterface):
             bool: True if the condition is met, otherwise False.
         """
         self._validate_tree()
+        # Walk the tree once and test every text against the collected values, rather than
+        # one XPath scan per text and attribute.
+        values = self._attribute_values()
+        value_set = set(values)
         found_texts = set()
 
         for text in texts:
-            if self._search_single_text(text):
+            if self._text_matches(text, values, value_set):
                 found_texts.add(text)
                 if rule == 'any':
                     return True
+            elif rule == 'all':
+                return False
 
         return len(found_texts) == len(texts) if rule == 'all' else False
@@ -236,10 +236,10 @@ class PlaywrightFindElement(ElementSourceInterface):
         # Ensure driver is initialized before entering the loop (OpticsError propagates if not)
         self._require_page()
 
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
         found = dict.fromkeys(elements, False)
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             try:
                 for el in elements:
                     if self._check_element_found(el, found) and rule == "any":
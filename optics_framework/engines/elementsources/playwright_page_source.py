@@ -1022,14 +1022,14 @@ class PlaywrightPageSource(ElementSourceInterface):
         # Ensure driver is initialized before entering the loop (OpticsError propagates if not)
         page = self._require_page()
 
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
 
         internal_logger.info(
             "[PlaywrightPageSource] Asserting elements=%s rule=%s timeout=%ss",
             elements, rule, timeout
         )
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             should_return, _ = self._check_elements_batch(page, elements, rule)
             if should_return:
                 return True, utils.get_timestamp()
@@ -160,9 +160,9 @@ class SeleniumFindElement(ElementSourceInterface):
             internal_logger.error(msg)
             raise RuntimeError(msg)
 
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             results = [check_fn(element) for element in elements]
 
             if (rule == "all" and all(results)) or (rule == "any" and any(results)):
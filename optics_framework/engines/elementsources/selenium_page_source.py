@@ -182,9 +182,9 @@ class SeleniumPageSource(ElementSourceInterface):
         if rule not in ["any", "all"]:
             raise ValueError("Invalid rule. Use 'any' or 'all'.")
 
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             found_elements = [self.locate(element) is not None for element in elements]
 
             if (rule == "all" and all(found_elements)) or (rule == "any" and any(found_elements)):
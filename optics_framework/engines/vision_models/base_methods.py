@@ -47,13 +47,15 @@ def match_and_annotate(
     :rtype: np.ndarray
     """
     annotated_frame = frame.copy()
+    # Lowercase each target once rather than once per OCR result
+    lowered_targets = [(target, target.lower()) for target in target_texts]
     for (bbox, detected_text, _) in ocr_results:
         clean_text = detected_text.strip().lower()
-        for target in target_texts:
+        for target, lowered in lowered_targets:
             if found_status[target]:
                 continue
 
-            if target.lower() in clean_text:
+            if lowered in clean_text:
                 top_left = tuple(map(int, bbox[0]))
                 bottom_right = tuple(map(int, bbox[2]))
                 center_x = (top_left[0] + bottom_right[0]) // 2
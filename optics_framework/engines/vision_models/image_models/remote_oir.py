@@ -27,6 +27,8 @@ class RemoteImageDetection(ImageInterface):
         self.capabilities: Dict[str, Any] = config.get("capabilities", {})
         self.timeout: int = self.capabilities.get("timeout", 30)
         self.method: str = self.capabilities.get("method", "template_matching")
+        # One pooled HTTP session: keeps the connection to the detection service alive across calls
+        self._http = requests.Session()
 
     def detect_images(self, image_base64: str, template_base64: str, detection_method: str) -> List[Dict[str, Any]]:
         """
@@ -50,7 +52,7 @@ class RemoteImageDetection(ImageInterface):
                 "image": image_base64,
                 "template": template_base64
             }
-            response = requests.post(
+            response = self._http.post(
                 f"{self.detection_url}/detect-image",
                 json=payload,
                 timeout=self.timeout
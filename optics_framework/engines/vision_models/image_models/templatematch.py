@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from typing import Literal
 import cv2
 import numpy as np
@@ -6,6 +7,10 @@ from optics_framework.common.logging_config import internal_logger
 from optics_framework.engines.vision_models.base_methods import load_template
 from optics_framework.common import utils
 
+# Number of recent frames whose SIFT keypoints/descriptors are kept, so looking up several
+# templates (or several indices of one template) on the same screenshot describes it once.
+_FRAME_FEATURE_CACHE_FRAMES = 4
+
 class TemplateMatchingHelper(ImageInterface):
     """
     Template matching helper that detects a reference image inside an input image.
@@ -26,6 +31,34 @@ class TemplateMatchingHelper(ImageInterface):
         self.project_path = self.config.get("project_path", "")
         self.templates = self.config.get("templates", None)
         self.execution_output_dir = self.config.get("execution_output_path", "")
+        # Template path -> (image, keypoints, descriptors); templates are static files, so
+        # they are decoded and described once per session instead of on every lookup.
+        self._template_features = {}
+        self._frame_features = OrderedDict()
+
+    def _load_template_features(self, element, sift):
+        template_path = self.templates.get_template_path(element) if self.templates is not None else None
+        cached = self._template_features.get(template_path) if template_path else None
+        if cached is None:
+            template = load_template(element, self.templates)
+            template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
+            kp_template, des_template = sift.detectAndCompute(template_gray, None)
+            cached = (template, kp_template, des_template)
+            self._template_features[template_path] = cached
+        return cached
+
+    def _load_frame_features(self, input_data, sift):
+        frame_key = utils.compute_frame_hash(input_data)
+        cached = self._frame_features.get(frame_key)
+        if cached is not None:
+            self._frame_features.move_to_end(frame_key)
+            return cached
+        frame_gray = cv2.cvtColor(input_data, cv2.COLOR_BGR2GRAY)
+        cached = sift.detectAndCompute(frame_gray, None)
+        self._frame_features[frame_key] = cached
+        if len(self._frame_features) > _FRAME_FEATURE_CACHE_FRAMES:
+            self._frame_features.popitem(last=False)
+        return cached
 
     def find_element(
         self, input_data, image, index=None, confidence_level=0.85, min_inliers=10
@@ -34,8 +67,8 @@ class TemplateMatchingHelper(ImageInterface):
         Match a template image within a single frame image using SIFT and FLANN-based matching.
         Returns the location of a specific match by index.
         """
-        image = load_template(image, self.templates)
         sift = cv2.SIFT_create()
+        image, kp_template, des_template = self._load_template_features(image, sift)
         FLANN_INDEX_KDTREE = 1
         index_params = {"algorithm": FLANN_INDEX_KDTREE, "trees": 5}
         search_params = {"checks": 50}
@@ -44,11 +77,7 @@ class TemplateMatchingHelper(ImageInterface):
         if image is None or input_data is None:
             raise ValueError("Input data or template image is None.")
 
-        frame_gray = cv2.cvtColor(input_data, cv2.COLOR_BGR2GRAY)
-        template_gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-
-        kp_frame, des_frame = sift.detectAndCompute(frame_gray, None)
-        kp_template, des_template = sift.detectAndCompute(template_gray, None)
+        kp_frame, des_frame = self._load_frame_features(input_data, sift)
 
         if des_template is None or des_frame is None:
             raise RuntimeError("SIFT feature detection failed.")
@@ -81,35 +110,18 @@ class TemplateMatchingHelper(ImageInterface):
         if inliers < min_inliers:
             raise RuntimeError("Not enough inliers found.")
 
+        # A single homography maps the template into the frame, so every inlier projects
+        # to the same center/bbox: transform once. `index` is still bounded by the inlier count.
         h, w = image.shape[:2]
-        centers = []
-        bboxes = []
-        for i in range(len(good_matches)):
-            if matches_mask[i]:
-                center_template = np.float32([[w / 2, h / 2]]).reshape(-1, 1, 2)
-                center_frame = cv2.perspectiveTransform(center_template, M)
-                center_x, center_y = (
-                    int(center_frame[0][0][0]),
-                    int(center_frame[0][0][1]),
-                )
-                centers.append((center_x, center_y))
-
-                # Bounding box
-                pts = np.float32([[0, 0], [w, 0], [w, h], [0, h]]).reshape(-1, 1, 2)
-                dst = cv2.perspectiveTransform(pts, M)
-                bbox = (tuple(np.int32(dst[0][0])), tuple(np.int32(dst[2][0])))
-                bboxes.append(bbox)
-
-        if not centers or not bboxes:
-            raise RuntimeError("No valid centers or bounding boxes found.")
-
-        if index is not None:
-            if 0 <= index < len(centers):
-                return True, centers[index], bboxes[index]
-            else:
-                raise IndexError("Index out of bounds for detected centers.")
-
-        return True, centers[0], bboxes[0]
+        pts = np.float32([[w / 2, h / 2], [0, 0], [w, 0], [w, h], [0, h]]).reshape(-1, 1, 2)
+        dst = cv2.perspectiveTransform(pts, M)
+        center = (int(dst[0][0][0]), int(dst[0][0][1]))
+        bbox = (tuple(np.int32(dst[1][0])), tuple(np.int32(dst[3][0])))
+
+        if index is not None and not 0 <= index < inliers:
+            raise IndexError("Index out of bounds for detected centers.")
+
+        return True, center, bbox
 
     def assert_elements(self, input_data, elements, rule="any"):
         """
@@ -1,11 +1,53 @@
+import logging
+from functools import lru_cache
 from typing import List, Tuple, Optional
 import easyocr
 import cv2
+import numpy as np
 from optics_framework.common.text_interface import TextInterface
 from optics_framework.common import utils
 from optics_framework.common.logging_config import internal_logger
 
 
+# Side of the blank frame used to warm up a freshly loaded reader.
+_WARMUP_SIZE = 640
+
+
+@lru_cache(maxsize=4)
+def _get_reader(languages: Tuple[str, ...]) -> easyocr.Reader:
+    """Return the process-wide EasyOCR reader for ``languages``.
+
+    Building a reader loads the detector and recognizer weights, so helpers
+    configured with the same languages share one instance. Each reader is warmed
+    up once here so the first real keyword does not pay the cold-start cost.
+    """
+    reader = easyocr.Reader(list(languages), cudnn_benchmark=True)
+    _warm_up(reader)
+    return reader
+
+
+def _warm_up(reader: easyocr.Reader) -> None:
+    """Run throwaway inferences so weights and CUDA kernels are ready before use."""
+    blank = np.zeros((_WARMUP_SIZE, _WARMUP_SIZE, 3), np.uint8)
+    try:
+        reader.readtext(blank)
+        if getattr(reader, "device", "cpu") != "cpu":
+            # Batched inference selects its own kernels; prime them as well
+            reader.readtext_batched(
+                [blank] * EasyOCRHelper.batch_size, batch_size=EasyOCRHelper.batch_size
+            )
+    except Exception as e:
+        internal_logger.debug(f"EasyOCR warm-up failed: {e}")
+
+
+def clear_reader_cache() -> None:
+    """Drop the shared EasyOCR readers and release any cached GPU memory."""
+    _get_reader.cache_clear()
+    import torch  # local: only needed to free CUDA memory, installed with easyocr
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
 class EasyOCRHelper(TextInterface):
     """
     Helper class for Optical Character Recognition (OCR) using EasyOCR.
@@ -14,6 +56,10 @@ class EasyOCRHelper(TextInterface):
     specific reference text.
     """
 
+    supports_batched_detection = True
+    # Frames per detector forward pass in detect_text_batch.
+    batch_size = 16
+
     def __init__(self, config=None):
         """
         Initializes the EasyOCR reader.
@@ -28,7 +74,8 @@ class EasyOCRHelper(TextInterface):
         self.execution_output_dir = config.get("execution_output_path", "") if config else ""
 
         try:
-            self.reader = easyocr.Reader([language])
+            languages = (language,) if isinstance(language, str) else tuple(sorted(language))
+            self.reader = _get_reader(languages)
             # internal_logger.debug(f"EasyOCR initialized with language: {language}")
         except Exception as e:
             internal_logger.error(f"Failed to initialize EasyOCR: {e}")
@@ -57,51 +104,42 @@ class EasyOCRHelper(TextInterface):
         else:
             _, ocr_results = detect_result
 
-        detected_texts = []
-
-        # Iterate over each detected text
-        if ocr_results is not None:
-            for bbox, detected_text, confidence in ocr_results:
-                detected_text = detected_text.strip()
-                if text in detected_text:
-                    top_left_ocr = bbox[0]  # (x1, y1)
-                    bottom_right_ocr = bbox[2]  # (x3, y3)
-
-                    x_top_left, y_top_left = int(top_left_ocr[0]), int(top_left_ocr[1])
-                    x_bottom_right, y_bottom_right = (
-                        int(bottom_right_ocr[0]),
-                        int(bottom_right_ocr[1]),
-                    )
-
-                    # Create the (x,y) tuples for cv2.rectangle
-                    pt1 = (x_top_left, y_top_left)
-                    pt2 = (x_bottom_right, y_bottom_right)
-
-                    w = x_bottom_right - x_top_left
-                    h = y_bottom_right - y_top_left
-
-                    # Calculate the center coordinates
-                    center_x = x_top_left + w // 2
-                    center_y = y_top_left + h // 2
-
-                    detected_texts.append((True, (center_x, center_y), (pt1, pt2)))
-
-                    # Draw bounding box around the detected text
-                    cv2.rectangle(input_data, pt1, pt2, (0, 255, 0), 2)
-                    cv2.circle(input_data, (center_x, center_y), 5, (0, 0, 255), -1)
-
-        if not detected_texts:
+        if ocr_results is None:
             return None
-        if index is not None:
-            # Return the requested index
-            if 0 <= index < len(detected_texts):
-                return detected_texts[index]
+        target = 0 if index is None else index
+        if target < 0:
             return None
 
+        # Stop scanning once the requested occurrence is found
+        matches_seen = 0
+        selected = None
+        for bbox, detected_text, _ in ocr_results:
+            if text not in detected_text.strip():
+                continue
+            if matches_seen < target:
+                matches_seen += 1
+                continue
+            top_left_ocr = bbox[0]  # (x1, y1)
+            bottom_right_ocr = bbox[2]  # (x3, y3)
+            pt1 = (int(top_left_ocr[0]), int(top_left_ocr[1]))
+            pt2 = (int(bottom_right_ocr[0]), int(bottom_right_ocr[1]))
+            center = (pt1[0] + (pt2[0] - pt1[0]) // 2, pt1[1] + (pt2[1] - pt1[1]) // 2)
+            selected = (True, center, (pt1, pt2))
+            break
+
+        # The user-visible annotation is drawn by the locate strategies; this one is debug-only
+        if selected is not None and index is None and internal_logger.isEnabledFor(logging.DEBUG):
+            self._debug_annotate(input_data, selected)
+        return selected
+
+    def _debug_annotate(self, input_data, selected) -> None:
+        """Save the frame with the selected match drawn on a copy."""
+        _, center, (pt1, pt2) = selected
+        annotated = input_data.copy()
+        cv2.rectangle(annotated, pt1, pt2, (0, 255, 0), 2)
+        cv2.circle(annotated, center, 5, (0, 0, 255), -1)
         utils.save_screenshot(
-            input_data, "text_location_annotation", output_dir=self.execution_output_dir)
-
-        return detected_texts[0]
+            annotated, "text_location_annotation", output_dir=self.execution_output_dir)
 
     def detect_text(self, input_data) -> Optional[Tuple[str, List[Tuple[List[List[int]], str, float]]]]:
         """
@@ -110,8 +148,27 @@ class EasyOCRHelper(TextInterface):
         :param input_data: Image data (numpy array).
         :return: List of tuples (bounding box, text, confidence) or None.
         """
-        gray_image = cv2.cvtColor(input_data, cv2.COLOR_BGR2GRAY)
-        raw_results = self.reader.readtext(gray_image)
+        # EasyOCR derives its own grayscale copy for recognition and detects on the colour frame.
+        return self._parse_results(self.reader.readtext(input_data))
+
+    def detect_text_batch(self, frames) -> List[Optional[Tuple[str, List[Tuple[List[List[int]], str, float]]]]]:
+        """
+        Detects text in several equally sized frames with one batched EasyOCR call.
+
+        :param frames: List of image data (numpy arrays) of the same shape.
+        :return: One ``detect_text`` result per frame, in order; a frame with no text yields
+            ``("", [])`` rather than failing the whole batch.
+        """
+        raw_batches = self.reader.readtext_batched(
+            frames, batch_size=min(len(frames), self.batch_size)
+        )
+        return [
+            self._parse_results(raw_results) if raw_results else ("", [])
+            for raw_results in raw_batches
+        ]
+
+    @staticmethod
+    def _parse_results(raw_results) -> Tuple[str, List[Tuple[List[List[int]], str, float]]]:
         if not raw_results:
             raise ValueError("No text detected")
         # Ensure results are List[Tuple[List[List[int]], str, float]]
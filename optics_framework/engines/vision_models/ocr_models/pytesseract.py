@@ -1,9 +1,15 @@
+from collections import OrderedDict
 from optics_framework.common.text_interface import TextInterface
 from optics_framework.common import utils
+from optics_framework.common.cv_cache import get_cv_cache
 from optics_framework.common.logging_config import internal_logger
 import pytesseract
 import cv2
 
+# Number of recent frames whose OCR output is kept; locating several labels on the same
+# screen (or re-checking one) reuses the Tesseract pass instead of running it again.
+_OCR_CACHE_FRAMES = 4
+
 
 class PytesseractHelper(TextInterface):
     """
@@ -26,6 +32,13 @@ class PytesseractHelper(TextInterface):
         self.execution_output_dir = config.get("execution_output_path", "") if config else ""
 
         self.pytesseract_config = "--oem 3 --psm 6"
+        self._ocr_cache = OrderedDict()
+        capabilities = (config.get("capabilities", {}) or {}) if config else {}
+        # Opt-in cross-run cache of OCR results keyed by frame content
+        self._disk_cache = (
+            get_cv_cache(capabilities.get("cache_path"))
+            if capabilities.get("persistent_cache") else None
+        )
         # internal_logger.debug(f"Pytesseract initialized with config: {self.pytesseract_config}")
 
 
@@ -47,9 +60,10 @@ class PytesseractHelper(TextInterface):
 
         # internal_logger.debug("Text Detection Results:", ocr_results)
 
+        target = text.lower()
         matches = []
         for bbox, detected_text, _ in ocr_results:
-            if detected_text.strip().lower() == text.lower():
+            if detected_text.strip().lower() == target:
                 top_left = tuple(map(int, bbox[0]))
                 bottom_right = tuple(map(int, bbox[2]))
                 center_x = (top_left[0] + bottom_right[0]) // 2
@@ -67,7 +81,9 @@ class PytesseractHelper(TextInterface):
         else:
             selected_center, selected_bbox = matches[0]
 
-        # Save the annotated frame
+        # Save the annotated frame; drawn on a copy so the caller's frame (and its OCR cache
+        # key) stays untouched
+        frame = frame.copy()
         cv2.rectangle(frame, selected_bbox[0], selected_bbox[1], (0, 255, 0), 2)
         cv2.circle(frame, selected_center, 5, (0, 0, 255), -1)
         utils.save_screenshot(frame, name='annotated_frame', output_dir=self.execution_output_dir)
@@ -75,8 +91,20 @@ class PytesseractHelper(TextInterface):
         return True, selected_center, selected_bbox
 
     def detect_text(self, image):
+        frame_key = utils.compute_frame_hash(image)
+        cached = self._ocr_cache.get(frame_key)
+        if cached is not None:
+            self._ocr_cache.move_to_end(frame_key)
+            return cached
+
         image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         _, binary_image = cv2.threshold(image, 150, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        disk_key = f"pytesseract:{self.pytesseract_config}:{frame_key}"
+        if self._disk_cache is not None:
+            stored = self._disk_cache.get(disk_key)
+            if stored is not None:
+                detected_texts = [([tuple(pt) for pt in bbox], text, conf) for bbox, text, conf in stored]
+                return self._remember(frame_key, binary_image, detected_texts)
         data = pytesseract.image_to_data(binary_image, config=self.pytesseract_config, output_type=pytesseract.Output.DICT)
         detected_texts = []
         for i in range(len(data["text"])):
@@ -98,6 +126,14 @@ class PytesseractHelper(TextInterface):
                 detected_texts.append((bbox, text, conf))
 
         internal_logger.debug(f"Pytesseract detected texts: {detected_texts}")
+        if self._disk_cache is not None:
+            self._disk_cache.put(disk_key, detected_texts)
+        return self._remember(frame_key, binary_image, detected_texts)
+
+    def _remember(self, frame_key, binary_image, detected_texts):
+        self._ocr_cache[frame_key] = (binary_image, detected_texts)
+        if len(self._ocr_cache) > _OCR_CACHE_FRAMES:
+            self._ocr_cache.popitem(last=False)
         return binary_image, detected_texts
 
     def element_exist(self, input_data, reference_data):
@@ -37,6 +37,8 @@ class RemoteOCR(TextInterface):
         self.timeout: int = int(self.capabilities.get("timeout", 30))
         self.method: str = str(self.capabilities.get("method", "easyocr"))
         self.language: str = str(self.capabilities.get("language", "en"))
+        # One pooled HTTP session: keeps the connection to the OCR service alive across calls
+        self._http = requests.Session()
 
     def detect_text(self, input_data: Union[str, "np.ndarray"]) -> Optional[Tuple[str, List[Tuple[List[Tuple[int, int]], str, float]]]]:
         """
@@ -55,7 +57,7 @@ class RemoteOCR(TextInterface):
                 "image": image_b64,
                 "language": self.language
             }
-            response = requests.post(
+            response = self._http.post(
                 f"{self.ocr_url}/detect-text",
                 json=payload,
                 timeout=self.timeout
@@ -165,9 +167,10 @@ class RemoteOCR(TextInterface):
 
     def _find_matching_elements(self, detections: List[Tuple[List[Tuple[int, int]], str, float]], text: str) -> List[Tuple[bool, Tuple[int, int], Tuple[Tuple[int, int], Tuple[int, int]]]]:
         """Find all matching elements for the given text."""
+        target = text.lower()
         matching_elements = []
         for bbox, detected_text, _ in detections:
-            if text.lower() in detected_text.lower() and len(bbox) >= 4:
+            if target in detected_text.lower() and len(bbox) >= 4:
                 top_left = (int(bbox[0][0]), int(bbox[0][1]))
                 bottom_right = (int(bbox[2][0]), int(bbox[2][1]))
                 center_x = (top_left[0] + bottom_right[0]) // 2
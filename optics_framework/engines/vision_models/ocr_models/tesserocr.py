@@ -0,0 +1,142 @@
+import threading
+import weakref
+from collections import OrderedDict
+from optics_framework.common.text_interface import TextInterface
+from optics_framework.common import utils
+from optics_framework.common.cv_cache import get_cv_cache
+from optics_framework.common.logging_config import internal_logger
+import tesserocr
+import cv2
+
+# Number of recent frames whose OCR output is kept (same policy as the pytesseract backend).
+_OCR_CACHE_FRAMES = 4
+
+
+class TesserocrHelper(TextInterface):
+    """
+    Helper class for Optical Character Recognition (OCR) using tesserocr.
+
+    Same recognition settings and results as the pytesseract backend, but talks to the
+    Tesseract C API through one long-lived ``PyTessBaseAPI`` handle instead of spawning
+    the ``tesseract`` binary per call, so language data is loaded once per session and no
+    temp image files are written.
+    """
+
+    def __init__(self, config=None):
+        """
+        Initializes the tesserocr API handle.
+
+        :param config: Configuration dict containing language and execution_output_path.
+        :type config: dict
+
+        :raises RuntimeError: If Tesseract fails to initialize.
+        """
+        self.execution_output_dir = config.get("execution_output_path", "") if config else ""
+        self.language = config.get("language", "eng") if config else "eng"
+
+        try:
+            # PSM 6 / default OEM, matching pytesseract's "--oem 3 --psm 6".
+            self._api = tesserocr.PyTessBaseAPI(lang=self.language, psm=tesserocr.PSM.SINGLE_BLOCK)
+        except RuntimeError as e:
+            internal_logger.error(f"Failed to initialize tesserocr: {e}")
+            raise RuntimeError("tesserocr initialization failed.") from e
+        # The handle is not thread-safe; recognition calls are serialized through this lock.
+        self._api_lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, self._api.End)
+        self._ocr_cache = OrderedDict()
+        capabilities = (config.get("capabilities", {}) or {}) if config else {}
+        # Opt-in cross-run cache of OCR results keyed by frame content
+        self._disk_cache = (
+            get_cv_cache(capabilities.get("cache_path"))
+            if capabilities.get("persistent_cache") else None
+        )
+
+    def find_element(self, frame, text, index=None):
+        """
+        Locate a specific occurrence of a text in the given frame using OCR and return the center coordinates.
+
+        Parameters:
+            - frame (np.array): Image data of the frame.
+            - text (str): The text to locate in the frame.
+            - index (int): The occurrence index (0-based) to select if multiple matches exist.
+
+        Returns:
+            - bool: True if the text is found, False otherwise.
+            - tuple: (x, y) coordinates of the center of the selected text in the frame or (None, None) if not found.
+            - tuple: Bounding box coordinates of the detected text.
+        """
+        _, ocr_results = self.detect_text(frame)
+
+        target = text.lower()
+        matches = []
+        for bbox, detected_text, _ in ocr_results:
+            if detected_text.strip().lower() == target:
+                top_left = tuple(map(int, bbox[0]))
+                bottom_right = tuple(map(int, bbox[2]))
+                center_x = (top_left[0] + bottom_right[0]) // 2
+                center_y = (top_left[1] + bottom_right[1]) // 2
+                matches.append(((center_x, center_y), (top_left, bottom_right)))
+
+        if not matches:
+            return False, (None, None), None
+
+        if index is not None:
+            if 0 <= index < len(matches):
+                selected_center, selected_bbox = matches[index]
+            else:
+                return False, (None, None), None
+        else:
+            selected_center, selected_bbox = matches[0]
+
+        frame = frame.copy()
+        cv2.rectangle(frame, selected_bbox[0], selected_bbox[1], (0, 255, 0), 2)
+        cv2.circle(frame, selected_center, 5, (0, 0, 255), -1)
+        utils.save_screenshot(frame, name='annotated_frame', output_dir=self.execution_output_dir)
+
+        return True, selected_center, selected_bbox
+
+    def detect_text(self, image):
+        frame_key = utils.compute_frame_hash(image)
+        cached = self._ocr_cache.get(frame_key)
+        if cached is not None:
+            self._ocr_cache.move_to_end(frame_key)
+            return cached
+
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        _, binary_image = cv2.threshold(image, 150, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        disk_key = f"tesserocr:{self.language}:psm6:{frame_key}"
+        if self._disk_cache is not None:
+            stored = self._disk_cache.get(disk_key)
+            if stored is not None:
+                detected_texts = [([tuple(pt) for pt in bbox], text, conf) for bbox, text, conf in stored]
+                return self._remember(frame_key, binary_image, detected_texts)
+        height, width = binary_image.shape[:2]
+
+        detected_texts = []
+        with self._api_lock:
+            self._api.SetImageBytes(binary_image.tobytes(), width, height, 1, width)
+            self._api.Recognize()
+            level = tesserocr.RIL.WORD
+            for word in tesserocr.iterate_level(self._api.GetIterator(), level):
+                text = (word.GetUTF8Text(level) or "").strip()
+                box = word.BoundingBox(level)
+                if not text or box is None:
+                    continue
+                x1, y1, x2, y2 = box
+                bbox = [(x1, y1), (x2, y1), (x2, y2), (x1, y2)]
+                detected_texts.append((bbox, text, float(word.Confidence(level))))
+
+        internal_logger.debug(f"tesserocr detected texts: {detected_texts}")
+        if self._disk_cache is not None:
+            self._disk_cache.put(disk_key, detected_texts)
+        return self._remember(frame_key, binary_image, detected_texts)
+
+    def _remember(self, frame_key, binary_image, detected_texts):
+        self._ocr_cache[frame_key] = (binary_image, detected_texts)
+        if len(self._ocr_cache) > _OCR_CACHE_FRAMES:
+            self._ocr_cache.popitem(last=False)
+        return binary_image, detected_texts
+
+    def element_exist(self, input_data, reference_data):
+        # dummy implementation
+        return super().element_exist(input_data, reference_data)
@@ -140,6 +140,7 @@ class YAMLDataReader(DataReader):
             "Close and Terminate App",
             "Get App Version",
             "Press Element",
+            "Press Elements",
             "Press By Percentage",
             "Press By Coordinates",
             "Press Element With Index",
@@ -204,6 +205,7 @@ class TestFrameworkGenerator(ABC):
             "Close and Terminate App": "close_and_terminate_app",
             "Get App Version": "get_app_version",
             "Press Element": "press_element",
+            "Press Elements": "press_elements",
             "Press By Percentage": "press_by_percentage",
             "Press By Coordinates": "press_by_coordinates",
             "Press Element With Index": "press_element_with_index",
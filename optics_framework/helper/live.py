@@ -40,7 +40,7 @@ from optics_framework.common.logging_config import (
 )
 from optics_framework.common.models import ModuleData, ElementData, ApiData, TemplateData
 from optics_framework.common.session_manager import SessionManager, Session
-from optics_framework.common.runner.keyword_register import KeywordRegistry
+from optics_framework.common.runner.keyword_register import KeywordRegistry, keyword_slug
 from optics_framework.common.runner.data_reader import (
     CSVDataReader,
     YAMLDataReader,
@@ -545,7 +545,7 @@ class LiveController:
             return ActionResult(raw=raw, status=ActionStatus.FAIL, message="Empty command")
 
         keyword_token, params = tokens[0], tokens[1:]
-        func_name = "_".join(keyword_token.split()).lower()
+        func_name = keyword_slug(keyword_token)
         method = self.keyword_map.get(func_name)
         if method is None:
             return ActionResult(
@@ -734,6 +734,21 @@ class Optics:
             event_name=event_name,
         )
 
+    @keyword("Press Elements")
+    @fallback_params
+    def press_elements(
+        self,
+        elements: fallback_str,
+        event_name: Optional[fallback_str] = None,
+    ) -> None:
+        """Press several `|`-separated elements on the current screen, locating all on one frame."""
+        if not self.action_keyword:
+            raise ValueError(INVALID_SETUP)
+        self.action_keyword.press_elements(
+            cast(str, elements),
+            cast(Optional[str], event_name),
+        )
+
     @keyword("Press By Percentage")
     @fallback_params
     def press_by_percentage(
@@ -850,6 +865,7 @@ class Optics:
         direction: fallback_str = "down",
         timeout: fallback_str = "30",
         event_name: Optional[fallback_str] = None,
+        batch_swipes: fallback_str = "1",
     ) -> None:
         """Swipe until an element appears."""
         if not self.action_keyword:
@@ -859,6 +875,7 @@ class Optics:
             cast(str, direction),
             cast(str, timeout),
             cast(Optional[str], event_name),
+            cast(str, batch_swipes),
         )
 
     @keyword("Swipe From Element")
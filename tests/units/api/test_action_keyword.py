@@ -2,11 +2,13 @@ import json
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
-import tempfile
+import threading
 import numpy as np
 from optics_framework.common.error import OpticsError, Code
 
-from optics_framework.api.action_keyword import ActionKeyword, _find_dropdown_container
+from optics_framework.api.action_keyword import (
+    ActionKeyword, _ScreenshotWriter, _find_dropdown_container, _screenshot_writer,
+)
 from optics_framework.common.optics_builder import OpticsBuilder
 from optics_framework.common.strategies import LocateResult
 
@@ -15,12 +17,13 @@ FIXTURES_DIR = Path(__file__).parent / "fixtures"
 class MockOpticsBuilder(OpticsBuilder):
     """Mock builder for ActionKeyword testing."""
 
-    def __init__(self, mock_driver, mock_element_source, mock_text_detection=None, mock_image_detection=None):
+    def __init__(self, mock_driver, mock_element_source, mock_text_detection=None, mock_image_detection=None,
+                 output_dir=""):
         self.mock_driver = mock_driver
         self.mock_element_source = mock_element_source
         self.mock_text_detection = mock_text_detection
         self.mock_image_detection = mock_image_detection
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = str(output_dir)
 
         # Mock session config
         self.session_config = MagicMock()
@@ -53,6 +56,12 @@ def dropdown_pagesource():
     return json.loads((FIXTURES_DIR / "dropdown_pagesource.json").read_text())
 
 
+@pytest.fixture(scope="module")
+def builder_output_dir(tmp_path_factory):
+    """One execution output dir shared by every builder in this module."""
+    return tmp_path_factory.mktemp("mock_builder")
+
+
 @pytest.fixture
 def mock_dependencies():
     """Fixture providing all mocked dependencies for ActionKeyword."""
@@ -73,13 +82,14 @@ def mock_dependencies():
 
 
 @pytest.fixture
-def action_keyword(mock_dependencies):
+def action_keyword(mock_dependencies, builder_output_dir):
     """Fixture providing ActionKeyword instance with mocked dependencies."""
     builder = MockOpticsBuilder(
         mock_dependencies['driver'],
         mock_dependencies['element_source'],
         mock_dependencies['text_detection'],
-        mock_dependencies['image_detection']
+        mock_dependencies['image_detection'],
+        output_dir=builder_output_dir,
     )
     action_kw = ActionKeyword(builder)
 
@@ -158,7 +168,11 @@ class TestPressElementWithIndex:
 class TestScreenshotFailureFallback:
     """Tests for behavior when screenshot capture fails (e.g. secure/protected pages)."""
 
-    @patch('optics_framework.common.utils.save_screenshot')
+    @pytest.fixture(autouse=True)
+    def mock_save_screenshot(self):
+        with patch('optics_framework.common.utils.save_screenshot') as mock_save:
+            yield mock_save
+
     def test_with_self_healing_proceeds_when_screenshot_raises(
         self, mock_save_screenshot, action_keyword, mock_dependencies
     ):
@@ -174,7 +188,6 @@ class TestScreenshotFailureFallback:
 
         mock_dependencies['driver'].press_coordinates.assert_called_once_with(100, 150, None)
 
-    @patch('optics_framework.common.utils.save_screenshot')
     def test_with_self_healing_skips_save_when_screenshot_raises(
         self, mock_save_screenshot, action_keyword, mock_dependencies
     ):
@@ -191,9 +204,8 @@ class TestScreenshotFailureFallback:
         mock_save_screenshot.assert_not_called()
 
     @patch('optics_framework.common.utils.annotate_aoi_region')
-    @patch('optics_framework.common.utils.save_screenshot')
     def test_with_self_healing_skips_aoi_save_when_screenshot_raises(
-        self, mock_save_screenshot, mock_annotate_aoi, action_keyword, mock_dependencies
+        self, mock_annotate_aoi, mock_save_screenshot, action_keyword, mock_dependencies
     ):
         """AOI annotation and save are skipped when capture_screenshot raises."""
         mock_locate_result = LocateResult((100, 150), MagicMock())
@@ -210,7 +222,6 @@ class TestScreenshotFailureFallback:
         mock_annotate_aoi.assert_not_called()
         mock_save_screenshot.assert_not_called()
 
-    @patch('optics_framework.common.utils.save_screenshot')
     def test_direct_method_proceeds_when_screenshot_raises(
         self, mock_save_screenshot, action_keyword, mock_dependencies
     ):
@@ -225,6 +236,172 @@ class TestScreenshotFailureFallback:
         mock_save_screenshot.assert_not_called()
 
 
+class TestScreenshotCache:
+    """Back-to-back keywords reuse one frame until a driver action invalidates it."""
+
+    @pytest.fixture(autouse=True)
+    def _no_disk_writes(self):
+        with patch('optics_framework.common.utils.save_screenshot'):
+            yield
+
+    def test_frame_reused_within_ttl(self, action_keyword):
+        action_keyword._capture_screenshot_safe()
+        action_keyword._capture_screenshot_safe()
+        assert action_keyword.strategy_manager.capture_screenshot.call_count == 1
+
+    def test_driver_action_invalidates_cached_frame(self, action_keyword):
+        action_keyword._capture_screenshot_safe()
+        action_keyword.press_by_coordinates("10", "20")
+        assert action_keyword._last_shot is None
+        action_keyword._capture_screenshot_safe()
+        assert action_keyword.strategy_manager.capture_screenshot.call_count == 2
+
+    def test_self_healing_keyword_invalidates_cached_frame(self, action_keyword):
+        with patch.object(
+            action_keyword.strategy_manager, 'locate', return_value=[LocateResult((1, 2), MagicMock())]
+        ):
+            action_keyword.press_element("button")
+        assert action_keyword._last_shot is None
+
+    def test_driver_action_invalidates_driver_ui_caches(self, action_keyword, mock_dependencies):
+        fallback_driver = MagicMock()
+        mock_dependencies['driver'].instances = [mock_dependencies['driver'], fallback_driver]
+        action_keyword.press_by_coordinates("10", "20")
+        mock_dependencies['driver'].invalidate_ui_cache.assert_called_once()
+        fallback_driver.invalidate_ui_cache.assert_called_once()
+
+    def test_zero_ttl_disables_cache(self, action_keyword):
+        action_keyword.screenshot_ttl = 0
+        action_keyword._capture_screenshot_safe()
+        action_keyword._capture_screenshot_safe()
+        assert action_keyword.strategy_manager.capture_screenshot.call_count == 2
+
+
+class TestLocateShortCircuit:
+    """Locate results are consumed lazily and memoized per frame."""
+
+    @pytest.fixture(autouse=True)
+    def _no_disk_writes(self):
+        with patch('optics_framework.common.utils.save_screenshot'):
+            yield
+
+    def test_later_strategies_not_run_after_success(self, action_keyword, mock_dependencies):
+        consumed = []
+
+        def results(*args, **kwargs):
+            for value in [(1, 2), (3, 4)]:
+                consumed.append(value)
+                yield LocateResult(value, MagicMock())
+
+        with patch.object(action_keyword.strategy_manager, 'locate', side_effect=results):
+            action_keyword.press_element("button")
+        assert consumed == [(1, 2)]
+        mock_dependencies['driver'].press_coordinates.assert_called_once_with(1, 2, None)
+
+    def test_detect_and_press_locates_once_when_element_on_screen(self, action_keyword, mock_dependencies):
+        with patch.object(
+            action_keyword.strategy_manager, 'locate', return_value=[LocateResult((5, 6), MagicMock())]
+        ) as mock_locate, patch.object(action_keyword.verifier, 'validate_screen') as mock_validate:
+            action_keyword.detect_and_press("button")
+        mock_locate.assert_called_once()
+        mock_validate.assert_not_called()
+        mock_dependencies['driver'].press_coordinates.assert_called_once_with(5, 6, None)
+        assert action_keyword._located_memo is None
+
+    def test_detect_and_press_falls_back_to_detection(self, action_keyword, mock_dependencies):
+        with patch.object(
+            action_keyword.strategy_manager, 'locate',
+            side_effect=[OpticsError(Code.E0201, message="not found"), [LocateResult((7, 8), MagicMock())]],
+        ), patch.object(action_keyword.verifier, 'validate_screen', return_value=True) as mock_validate:
+            action_keyword.detect_and_press("button")
+        mock_validate.assert_called_once()
+        mock_dependencies['driver'].press_coordinates.assert_called_once_with(7, 8, None)
+
+
+class TestPressElements:
+    """press_elements locates every target on one frame before pressing any of them."""
+
+    @pytest.fixture(autouse=True)
+    def _no_disk_writes(self):
+        with patch('optics_framework.common.utils.save_screenshot'):
+            yield
+
+    def test_locates_all_then_presses_in_order(self, action_keyword, mock_dependencies):
+        handle = MagicMock()
+        located = {"Wi-Fi": (1, 2), "//switch": handle}
+        calls = []
+
+        def locate(element, **kwargs):
+            calls.append(("locate", element))
+            return [LocateResult(located[element], MagicMock())]
+
+        driver = mock_dependencies['driver']
+        driver.press_coordinates.side_effect = lambda *a: calls.append(("press", a[:2]))
+        with patch.object(action_keyword.strategy_manager, 'locate', side_effect=locate):
+            action_keyword.press_elements("Wi-Fi | //switch", event_name="evt")
+
+        assert calls == [("locate", "Wi-Fi"), ("locate", "//switch"), ("press", (1, 2))]
+        driver.press_coordinates.assert_called_once_with(1, 2, "evt")
+        driver.press_element.assert_called_once_with(handle, 1, None)
+
+    def test_missing_element_presses_nothing(self, action_keyword, mock_dependencies):
+        with patch.object(
+            action_keyword.strategy_manager, 'locate',
+            side_effect=[[LocateResult((1, 2), MagicMock())], OpticsError(Code.E0201, message="not found")],
+        ):
+            with pytest.raises(OpticsError) as exc_info:
+                action_keyword.press_elements("Wi-Fi|Bluetooth")
+
+        assert exc_info.value.code == Code.E0201
+        mock_dependencies['driver'].press_coordinates.assert_not_called()
+
+    def test_vision_locates_share_one_capture(self, action_keyword, mock_dependencies):
+        source = mock_dependencies['element_source']
+        manager = action_keyword.strategy_manager
+
+        def locate(element, **kwargs):
+            manager.capture_for_locate(source)
+            return [LocateResult((1, 2), MagicMock())]
+
+        source.capture.reset_mock()
+        with patch.object(manager, 'locate', side_effect=locate):
+            action_keyword.press_elements("A|B|C")
+
+        source.capture.assert_called_once()
+        assert manager._shared_frames is None
+
+
+class TestBackgroundScreenshotSave:
+    """Debug screenshots are written off the keyword thread."""
+
+    @patch('optics_framework.common.utils.save_screenshot')
+    def test_keyword_screenshot_saved_in_background(self, mock_save_screenshot, action_keyword):
+        action_keyword.press_by_coordinates("10", "20")
+        _screenshot_writer.flush()
+        mock_save_screenshot.assert_called_once()
+        assert mock_save_screenshot.call_args.args[1] == "press_by_coordinates"
+
+    def test_overflow_drops_oldest_pending_write(self):
+        writer = _ScreenshotWriter(max_workers=1, max_pending=1)
+        started, release = threading.Event(), threading.Event()
+        written = []
+
+        def slow_save(img, name, **kwargs):
+            started.set()
+            release.wait(timeout=5)
+            written.append(name)
+
+        with patch('optics_framework.common.utils.save_screenshot', side_effect=slow_save):
+            writer.submit(None, "running")
+            assert started.wait(timeout=5)
+            writer.submit(None, "dropped")
+            writer.submit(None, "kept")
+            release.set()
+            writer.flush()
+            writer._pool.shutdown(wait=True)
+        assert written == ["running", "kept"]
+
+
 class TestSelectDropdownOption:
     """select_dropdown_option must open the dropdown then select the option (not a no-op)."""
 
@@ -412,8 +589,21 @@ class TestSelectDropdownOption:
 class TestSwipeUntilElementAppears:
     """Tests for OpticsError(E0201) handling in swipe_until_element_appears."""
 
-    @patch('optics_framework.api.action_keyword.time.sleep', return_value=None)
-    @patch('optics_framework.api.action_keyword.time.time')
+    @pytest.fixture(autouse=True)
+    def _no_screenshot_cache(self, action_keyword):
+        # The screenshot cache also reads time.monotonic; keep it out of the patched clock.
+        action_keyword.screenshot_ttl = 0
+
+    @pytest.fixture(autouse=True)
+    def mock_sleep(self):
+        with patch('optics_framework.api.action_keyword.time.sleep', return_value=None) as sleep:
+            yield sleep
+
+    @pytest.fixture(autouse=True)
+    def mock_time(self):
+        with patch('optics_framework.api.action_keyword.time.monotonic') as monotonic:
+            yield monotonic
+
     def test_e0201_continues_loop_until_found(self, mock_time, mock_sleep, action_keyword):
         """E0201 is caught, loop continues, element found on second call."""
         mock_time.side_effect = [0, 0, 3, 6, 9]
@@ -432,8 +622,6 @@ class TestSwipeUntilElementAppears:
         assert call_count == 2
         action_keyword.driver.swipe_percentage.assert_called_once_with(10, 50, "down", 25, None)
 
-    @patch('optics_framework.api.action_keyword.time.sleep', return_value=None)
-    @patch('optics_framework.api.action_keyword.time.time')
     def test_non_e0201_is_reraised(self, mock_time, mock_sleep, action_keyword):
         """Non-E0201 OpticsError is re-raised immediately."""
         mock_time.side_effect = [0, 0]
@@ -448,8 +636,6 @@ class TestSwipeUntilElementAppears:
         assert exc_info.value.code == Code.E0303
         action_keyword.driver.swipe_percentage.assert_not_called()
 
-    @patch('optics_framework.api.action_keyword.time.sleep', return_value=None)
-    @patch('optics_framework.api.action_keyword.time.time')
     def test_element_found_stops_loop(self, mock_time, mock_sleep, action_keyword):
         """Element found on first call, no swipe performed."""
         mock_time.side_effect = [0, 0]
@@ -459,8 +645,6 @@ class TestSwipeUntilElementAppears:
 
         action_keyword.driver.swipe_percentage.assert_not_called()
 
-    @patch('optics_framework.api.action_keyword.time.sleep', return_value=None)
-    @patch('optics_framework.api.action_keyword.time.time')
     def test_timeout_stops_loop(self, mock_time, mock_sleep, action_keyword):
         """Element never found, loop exits after timeout and raises."""
         mock_time.side_effect = [0, 0, 3, 6, 9, 12]
@@ -474,3 +658,58 @@ class TestSwipeUntilElementAppears:
 
         assert exc_info.value.code == Code.E0201
         assert action_keyword.driver.swipe_percentage.call_count == 4
+
+    def test_unchanged_page_source_skips_presence_check(self, mock_time, mock_sleep, action_keyword):
+        """A swipe that leaves the page unchanged is retried without another presence check."""
+        mock_time.side_effect = [0, 0, 1, 2, 3]
+        not_found = OpticsError(Code.E0201, message="Element not found")
+        presence = MagicMock(side_effect=[not_found, not_found, True])
+
+        with patch.object(action_keyword.verifier, 'assert_presence', presence), \
+                patch.object(action_keyword, '_safe_pagesource_hash', side_effect=["a", "a", "b"]):
+            action_keyword.swipe_until_element_appears("element", "down", "10")
+
+        assert action_keyword.driver.swipe_percentage.call_count == 3
+        assert [c.kwargs["timeout_str"] for c in presence.call_args_list] == ["3", "1", "1"]
+        mock_sleep.assert_called_once_with(0.25)
+
+    def test_unchanged_page_source_still_rechecks_image_target(self, mock_time, mock_sleep, action_keyword):
+        """An image can scroll into view without the page source changing; it is still found."""
+        mock_time.side_effect = [0] + list(range(10))
+        swipe = action_keyword.driver.swipe_percentage
+        not_found = OpticsError(Code.E0201, message="Element not found")
+
+        def presence(*args, **kwargs):
+            if swipe.call_count < 3:
+                raise not_found
+            return True
+
+        with patch.object(action_keyword.verifier, 'assert_presence', side_effect=presence), \
+                patch.object(action_keyword, '_safe_pagesource_hash', return_value="same"):
+            action_keyword.swipe_until_element_appears("target.png", "down", "10")
+
+        assert swipe.call_count == 3
+
+    def test_unchanged_page_source_keeps_skipping_xpath_target(self, mock_time, mock_sleep, action_keyword):
+        """Page-source-only locators cannot appear while the source is unchanged."""
+        mock_time.side_effect = [0, 0, 1, 2, 3, 4, 20]
+        presence = MagicMock(side_effect=OpticsError(Code.E0201, message="Element not found"))
+
+        with patch.object(action_keyword.verifier, 'assert_presence', presence), \
+                patch.object(action_keyword, '_safe_pagesource_hash', return_value="same"):
+            with pytest.raises(OpticsError):
+                action_keyword.swipe_until_element_appears("//android.widget.Button", "down", "10")
+
+        assert action_keyword.driver.swipe_percentage.call_count == 5
+        assert presence.call_count == 2
+
+    def test_batch_swipes_sends_one_batched_gesture_per_check(self, mock_time, mock_sleep, action_keyword):
+        """batch_swipes > 1 hands the whole batch to the driver between presence checks."""
+        mock_time.side_effect = [0, 0, 3]
+        not_found = OpticsError(Code.E0201, message="Element not found")
+
+        with patch.object(action_keyword.verifier, 'assert_presence', side_effect=[not_found, True]):
+            action_keyword.swipe_until_element_appears("element", "up", "10", "evt", batch_swipes="3")
+
+        action_keyword.driver.swipe_percentage_batch.assert_called_once_with(10, 50, "up", 25, 3, "evt")
+        action_keyword.driver.swipe_percentage.assert_not_called()
@@ -9,6 +9,8 @@ Scaling is gated to Appium sources (their window and element coordinates share o
 space), so the fixtures here declare REQUIRED_DRIVER_TYPE = "appium"; a non-Appium
 regression guard lives in test_non_appium_annotation_is_noop.
 """
+from unittest.mock import MagicMock, PropertyMock
+
 import numpy as np
 
 from optics_framework.common import utils
@@ -120,3 +122,11 @@ class TestScaleBboxesForScreenshot:
             [((10, 10), (20, 20))], src, _pixel_screenshot(width=300, height=200)
         )
         assert result == [((110, 10), (120, 20))]
+
+
+def test_webelement_bbox_prefers_single_rect_call():
+    element = MagicMock()
+    element.rect = {"x": 10, "y": 20, "width": 30, "height": 40}
+    type(element).location = PropertyMock(side_effect=AssertionError("location fetched"))
+
+    assert utils.bbox_from_webelement_like(element) == ((10, 20), (40, 60))
@@ -0,0 +1,19 @@
+"""Unit tests for utils.compare_text and its pre-normalized variant."""
+import pytest
+
+from optics_framework.common import utils
+
+
+@pytest.mark.parametrize(
+    "given, target, expected",
+    [
+        ("  Login ", "login", True),       # exact after normalization
+        ("Sign in to continue", "SIGN IN", True),  # partial
+        ("Setings", "Settings", True),     # fuzzy
+        ("Cancel", "Login", False),
+        ("", "Login", False),
+    ],
+)
+def test_compare_text(given, target, expected):
+    assert utils.compare_text(given, target) is expected
+    assert utils.compare_normalized_text(given.strip().lower(), target.strip().lower()) is expected
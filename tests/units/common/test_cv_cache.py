@@ -0,0 +1,43 @@
+"""Unit tests for the persistent content-addressed vision cache (common/cv_cache.py)."""
+from optics_framework.common.cv_cache import CVCache, get_cv_cache
+
+
+def test_put_then_get_round_trips_json_payload(tmp_path):
+    cache = CVCache(str(tmp_path / "cache.sqlite3"))
+    cache.put("k", [[[[0, 0], [4, 0]], "Login", 91.0]])
+
+    assert cache.get("k") == [[[[0, 0], [4, 0]], "Login", 91.0]]
+    assert cache.get("missing") is None
+
+
+def test_entries_survive_reopen(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    first = CVCache(path)
+    first.put("k", {"a": 1})
+    first.close()
+
+    assert CVCache(path).get("k") == {"a": 1}
+
+
+def test_least_recently_used_entries_evicted_past_size_limit(tmp_path):
+    cache = CVCache(str(tmp_path / "cache.sqlite3"), size_limit=30)
+    cache.put("old", "x" * 10)
+    cache.put("recent", "y" * 10)
+    cache.get("old")
+    cache.put("new", "z" * 10)
+
+    assert cache.get("recent") is None
+    assert cache.get("old") == "x" * 10
+    assert cache.get("new") == "z" * 10
+
+
+def test_unserialisable_payload_is_ignored(tmp_path):
+    cache = CVCache(str(tmp_path / "cache.sqlite3"))
+    cache.put("k", object())
+
+    assert cache.get("k") is None
+
+
+def test_get_cv_cache_shares_one_instance_per_path(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    assert get_cv_cache(path) is get_cv_cache(path)
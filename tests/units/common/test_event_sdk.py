@@ -0,0 +1,26 @@
+"""Unit tests for EventSDK batch delivery."""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from optics_framework.common.eventSDK import EventSDK
+
+
+def _sdk(tmp_path):
+    attrs = tmp_path / "event_attributes.json"
+    attrs.write_text('{"eventUrl": "http://events.test", "testParameters_bearer": "token"}')
+    config_handler = SimpleNamespace(config=SimpleNamespace(event_attributes_json=str(attrs)))
+    return EventSDK(config_handler)
+
+
+def test_batches_reuse_one_http_session(tmp_path, fake_response):
+    sdk = _sdk(tmp_path)
+    sdk._http = MagicMock()
+    sdk._http.post.return_value = fake_response(json_data={}, text="accepted")
+    sdk.all_events = [{"eventName": f"e{i}"} for i in range(12)]
+
+    sdk.send_events_after_execution()
+
+    assert sdk.all_events == []
+    assert sdk._http.post.call_count == 3
+    url = sdk._http.post.call_args.args[0]
+    assert url == "http://events.test/v1/event/batchevent"
@@ -0,0 +1,52 @@
+"""Unit tests for EventManager publishing and dispatch."""
+import asyncio
+
+from optics_framework.common.events import Event, EventManager, EventStatus, EventSubscriber
+
+
+class _Recorder(EventSubscriber):
+    def __init__(self):
+        self.names = []
+
+    async def on_event(self, event: Event) -> None:
+        self.names.append(event.name)
+
+
+def _event(name: str) -> Event:
+    return Event(entity_type="keyword", entity_id=name, name=name, status=EventStatus.PASS)
+
+
+def test_queued_burst_is_dispatched_in_order():
+    async def scenario():
+        manager = EventManager()
+        recorder = _Recorder()
+        manager.subscribe("recorder", recorder)
+        for i in range(5):
+            await manager.publish_event(_event(f"e{i}"))
+        assert manager.event_queue.qsize() == 5
+        manager.start()
+        await asyncio.wait_for(manager.event_queue.join(), timeout=1)
+        manager.stop()
+        return recorder.names
+
+    assert asyncio.run(scenario()) == ["e0", "e1", "e2", "e3", "e4"]
+
+
+def test_failing_subscriber_does_not_block_others():
+    class _Broken(EventSubscriber):
+        async def on_event(self, event: Event) -> None:
+            raise ValueError("boom")
+
+    async def scenario():
+        manager = EventManager()
+        recorder = _Recorder()
+        manager.subscribe("broken", _Broken())
+        manager.subscribe("recorder", recorder)
+        manager.start()
+        await manager.publish_event(_event("a"))
+        await manager.publish_event(_event("b"))
+        await asyncio.wait_for(manager.event_queue.join(), timeout=1)
+        manager.stop()
+        return recorder.names
+
+    assert asyncio.run(scenario()) == ["a", "b"]
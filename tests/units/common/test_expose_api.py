@@ -104,6 +104,17 @@ def test_discover_keywords_finds_real_api_keywords():
     assert not any(s.startswith("_") or s.startswith("test") for s in slugs)
 
 
+def test_discover_keywords_reuses_catalog_but_returns_fresh_list():
+    first = expose_api.discover_keywords()
+    first.clear()
+    second = expose_api.discover_keywords()
+    assert second
+    assert second is not expose_api.discover_keywords()
+    with patch.object(expose_api.pkgutil, "iter_modules") as iter_modules:
+        expose_api.discover_keywords()
+    iter_modules.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # _make_dependency_entry
 # ---------------------------------------------------------------------------
@@ -437,7 +448,7 @@ def test_fallback_reraises_control_flow_exception():
 
 def _fake_session_with_queue():
     session = MagicMock()
-    session.event_queue.put = AsyncMock()
+    session.event_queue.put_nowait = MagicMock()
     return session
 
 
@@ -447,7 +458,7 @@ def test_handle_execution_failure_optics_error_maps_status():
     with pytest.raises(HTTPException) as exc_info:
         _run(expose_api._handle_execution_failure(err, session, "eid", "X"))
     assert exc_info.value.status_code == 404  # E0402 default_status
-    session.event_queue.put.assert_awaited_once()
+    session.event_queue.put_nowait.assert_called_once()
 
 
 def test_handle_execution_failure_generic_error_is_500():
@@ -463,8 +474,10 @@ def test_handle_execution_failure_generic_error_is_500():
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
+    # The app is a module-level singleton and tests patch its collaborators,
+    # not the client, so one client (and its connection pool) serves them all.
     return TestClient(expose_api.app)
 
 
@@ -506,7 +519,7 @@ def test_execute_keyword_wrong_mode_returns_400(client):
 
 def _fake_action_session():
     session = MagicMock()
-    session.event_queue.put = AsyncMock()
+    session.event_queue.put_nowait = MagicMock()
     session.request_template_overrides = {}
     session.optics.build = MagicMock(return_value=MagicMock())
     return session
@@ -535,7 +548,7 @@ def test_execute_keyword_unknown_keyword_returns_404(client):
     # Unknown keyword -> OpticsError(E0402) -> HTTP 404.
     assert resp.status_code == 404
     # A FAIL event was queued before the error surfaced.
-    session.event_queue.put.assert_awaited()
+    session.event_queue.put_nowait.assert_called()
 
 
 def test_execute_keyword_success(client):
@@ -4,6 +4,8 @@ Enablement and LLM provider/model are per-session settings that fall back to
 service-level env-var defaults. These cover the env-only defaults and the
 per-session-overrides-service-default precedence, per field.
 """
+import pytest
+
 from optics_framework.common.config_handler import DependencyConfig
 from optics_framework.common.expose_api import (
     ENV_AI_SELF_HEAL,
@@ -34,20 +36,20 @@ def test_env_defaults_carry_provider_and_model(monkeypatch):
     assert _env_self_heal_defaults() == (True, "custom_llm", "custom-model-v1")
 
 
-def test_truthy_variants_all_enable(monkeypatch):
+@pytest.mark.parametrize("value", ["1", "TRUE", "Yes", "on"])
+def test_truthy_variants_all_enable(monkeypatch, value):
     _clear_env(monkeypatch)
-    for value in ("1", "TRUE", "Yes", "on"):
-        monkeypatch.setenv(ENV_AI_SELF_HEAL, value)
-        enabled, _, _ = _env_self_heal_defaults()
-        assert enabled is True, f"{value!r} should enable self-heal"
+    monkeypatch.setenv(ENV_AI_SELF_HEAL, value)
+    enabled, _, _ = _env_self_heal_defaults()
+    assert enabled is True, f"{value!r} should enable self-heal"
 
 
-def test_falsy_or_garbage_values_stay_disabled(monkeypatch):
+@pytest.mark.parametrize("value", ["false", "0", "no", "", "nonsense"])
+def test_falsy_or_garbage_values_stay_disabled(monkeypatch, value):
     _clear_env(monkeypatch)
-    for value in ("false", "0", "no", "", "nonsense"):
-        monkeypatch.setenv(ENV_AI_SELF_HEAL, value)
-        enabled, _, _ = _env_self_heal_defaults()
-        assert enabled is False
+    monkeypatch.setenv(ENV_AI_SELF_HEAL, value)
+    enabled, _, _ = _env_self_heal_defaults()
+    assert enabled is False
 
 
 # --- Resolution: env default with no per-session override ----------------------
@@ -0,0 +1,20 @@
+"""Unit tests for SensitiveDataFormatter masking."""
+import pytest
+
+from optics_framework.common.logging_config import SensitiveDataFormatter
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ("Entering @:secret123", "Entering ****"),
+        ("user=@:alice, pass=@:hunter2", "user=****, pass=****"),
+        ("(value @:token)", "(value ****)"),
+        ("[@:key]", "[****]"),
+        ("no secrets here", "no secrets here"),
+        ("email a@b.com", "email a@b.com"),
+        ("", ""),
+    ],
+)
+def test_sanitize_masks_sensitive_values(message, expected):
+    assert SensitiveDataFormatter()._sanitize(message) == expected
@@ -0,0 +1,39 @@
+"""Unit tests for OpticsBuilder instance reuse."""
+import types
+from unittest.mock import patch
+
+from optics_framework.common import optics_builder
+from optics_framework.common.optics_builder import OpticsBuilder
+
+
+def _builder() -> OpticsBuilder:
+    session = types.SimpleNamespace(event_sdk=None, config=types.SimpleNamespace(project_path=None))
+    return OpticsBuilder(session)
+
+
+class _Api:
+    def __init__(self, builder):
+        self.builder = builder
+
+
+def test_build_reuses_instance_per_class():
+    builder = _builder()
+    first = builder.build(_Api)
+    assert builder.build(_Api) is first
+    assert first.builder is builder
+
+
+def test_unconfigured_detection_resolved_once():
+    builder = _builder()
+    with patch.object(builder, "instantiate_text_detection", wraps=builder.instantiate_text_detection) as inst:
+        assert builder.get_text_detection() is None
+        assert builder.get_text_detection() is None
+    assert inst.call_count == 1
+
+
+def test_driver_instantiated_once():
+    builder = _builder()
+    builder.add_driver("appium")
+    with patch.object(optics_builder.DeviceFactory, "get_driver", return_value=object()) as factory:
+        assert builder.get_driver() is builder.get_driver()
+    factory.assert_called_once()
@@ -0,0 +1,26 @@
+"""Unit tests for the live result tree summary."""
+from unittest.mock import MagicMock
+
+from optics_framework.common.runner.printers import TreeResultPrinter
+from optics_framework.common.runner.printers import TestCaseResult as _TestCaseResult
+
+
+def _tc(name, status):
+    return _TestCaseResult(id=name, name=name, elapsed="0.00s", status=status)
+
+
+def test_summary_counts_statuses_in_one_render():
+    provider = MagicMock()
+    provider.get_terminal_width.return_value = 80
+    printer = TreeResultPrinter(provider)
+    printer.test_state = {
+        "a": _tc("a", "PASS"), "b": _tc("b", "FAIL"), "c": _tc("c", "RUNNING"), "d": _tc("d", "PASS"),
+    }
+    printer.start_run(len(printer.test_state))
+
+    group = printer._render_tree()
+
+    summary = group.renderables[-1]
+    assert summary.renderable == "Total Test Cases: 4 | Passed: 2 | Failed: 1"
+    assert summary.style == "red"
+    assert printer.progress.tasks[0].completed == 3
@@ -0,0 +1,57 @@
+"""Unit tests for SessionManager create/terminate bookkeeping."""
+import threading
+from unittest.mock import MagicMock, patch
+
+from optics_framework.common import session_manager
+from optics_framework.common.session_manager import SessionManager
+
+
+def _create(manager):
+    with patch.object(session_manager, "Session") as session_cls:
+        session_cls.return_value = MagicMock(inline_templates={}, _inline_templates_dir=None)
+        return manager.create_session(MagicMock(), None, None, None, None)
+
+
+def test_terminate_unknown_session_is_noop():
+    manager = SessionManager()
+    manager.terminate_session("missing")
+    assert manager.get_session("missing") is None
+
+
+def test_concurrent_terminate_tears_down_once():
+    manager = SessionManager()
+    session_id = _create(manager)
+    session = manager.get_session(session_id)
+
+    barrier = threading.Barrier(8)
+
+    def terminate():
+        barrier.wait()
+        manager.terminate_session(session_id)
+
+    threads = [threading.Thread(target=terminate) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    session.driver.terminate.assert_called_once()
+    assert manager.get_session(session_id) is None
+
+
+
+def test_slow_teardown_does_not_block_other_sessions():
+    manager = SessionManager()
+    slow_id, other_id = _create(manager), _create(manager)
+    release = threading.Event()
+    manager.get_session(slow_id).driver.terminate.side_effect = lambda: release.wait(5)
+
+    worker = threading.Thread(target=manager.terminate_session, args=(slow_id,))
+    worker.start()
+    try:
+        manager.terminate_session(other_id)
+        assert manager.get_session(other_id) is None
+        assert worker.is_alive()
+    finally:
+        release.set()
+        worker.join()
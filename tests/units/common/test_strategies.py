@@ -22,6 +22,7 @@ from optics_framework.common.error import Code, OpticsError
 from optics_framework.common.strategies import (
     StrategyManager,
     TextDetectionStrategy,
+    TextElementStrategy,
     LocateResult,
 )
 from optics_framework.engines.elementsources.appium_screenshot import AppiumScreenshot
@@ -65,6 +66,49 @@ class TestDetermineElementTypeWithTextOnly:
         assert utils.determine_element_type("text_only:foo") == "Text"
 
 
+class TestDetermineElementTypeClassification:
+    """CSS / fallback classification rules and memoization of determine_element_type()."""
+
+    @pytest.mark.parametrize(
+        "element, expected",
+        [
+            ("#login", "CSS"),
+            ("#-x", "CSS"),
+            ("#91", "Text"),
+            (".btn-primary", "CSS"),
+            ("input[name='q']", "CSS"),
+            ("Button#submit", "CSS"),
+            ("h2.title", "CSS"),
+            ("a]b[", "CSS"),
+            ("header", "Text"),
+            ("Sign in", "Text"),
+        ],
+    )
+    def test_classification(self, element, expected):
+        assert utils.determine_element_type(element) == expected
+
+    def test_repeat_lookup_is_cached(self):
+        utils.determine_element_type.cache_clear()
+        utils.determine_element_type("//android.widget.Button")
+        utils.determine_element_type("//android.widget.Button")
+        assert utils.determine_element_type.cache_info().hits == 1
+
+
+class TestComputeFrameHash:
+    """compute_frame_hash() keys the screenshot/OCR/feature caches by frame content."""
+
+    def test_equal_content_equal_hash(self):
+        frame = np.arange(60, dtype=np.uint8).reshape(4, 5, 3)
+        assert utils.compute_frame_hash(frame) == utils.compute_frame_hash(frame.copy())
+
+    def test_non_contiguous_view_hashes_its_pixels(self):
+        frame = np.arange(60, dtype=np.uint8).reshape(4, 5, 3)
+        view = frame[:, 1:3]
+        assert not view.flags["C_CONTIGUOUS"]
+        assert utils.compute_frame_hash(view) == utils.compute_frame_hash(view.copy())
+        assert utils.compute_frame_hash(view) != utils.compute_frame_hash(frame)
+
+
 # --- StrategyManager locate() with TEXT_ONLY ---
 
 
@@ -363,6 +407,15 @@ class TestStrategyManagerAssertVisibility:
         assert result is True
         assert seen_method_names == ["assert_elements"]
 
+    def test_strategy_error_falls_through_to_next_strategy(self, strategy_manager):
+        """A strategy that raises is reported as a miss and the next strategy still runs."""
+        with patch.object(TextElementStrategy, "assert_elements", side_effect=RuntimeError("driver gone")), \
+                patch.object(TextDetectionStrategy, "assert_elements", return_value=(True, "ts", None)):
+            result, timestamp, _ = strategy_manager.assert_presence(["Submit"], "Text", timeout=3, rule="any")
+
+        assert result is True
+        assert timestamp == "ts"
+
     def test_assert_elements_visible_default_falls_back_to_assert_elements(self, strategy_manager):
         """Strategies that don't override assert_elements_visible (e.g. vision-based ones)
         default to assert_elements, since anything they find is inherently on-screen."""
@@ -515,6 +568,22 @@ class TestTryStrategyLocateAoiFallthrough:
         assert result is None
 
 
+class TestValidateAoi:
+    """AOI params are all-or-nothing."""
+
+    def test_no_aoi(self):
+        assert _sm(MagicMock())._validate_aoi(None, None, None, None) is False
+
+    def test_full_aoi(self):
+        assert _sm(MagicMock())._validate_aoi(0, 0, 100, 100) is True
+
+    @pytest.mark.parametrize("params", [(0, None, None, None), (10, 10, 50, None)])
+    def test_partial_aoi_raises_e0205(self, params):
+        with pytest.raises(OpticsError) as exc_info:
+            _sm(MagicMock())._validate_aoi(*params)
+        assert exc_info.value.code == Code.E0205
+
+
 class TestImageDetectionStrategy:
     """ImageDetectionStrategy locates an image element via image_detection."""
 
@@ -539,6 +608,52 @@ class TestImageDetectionStrategy:
         assert exc_info.value.code == Code.E0201
 
 
+class _BatchingTextEngine:
+    supports_batched_detection = True
+
+    def __init__(self):
+        self.batches = []
+        self.singles = 0
+
+    def detect_text_batch(self, frames):
+        self.batches.append(len(frames))
+        return [("text", []) for _ in frames]
+
+    def detect_text(self, frame):
+        self.singles += 1
+        return "text", []
+
+
+class TestTextDetectionFrames:
+    """Polling ticks with several frames go through one batched OCR call when supported."""
+
+    def _frames(self, n):
+        return [(np.zeros((4, 4, 3), dtype=np.uint8), f"ts{i}") for i in range(n)]
+
+    def test_batching_engine_gets_one_call_per_tick(self):
+        engine = _BatchingTextEngine()
+        strategy = TextDetectionStrategy(MagicMock(), InstanceFallback([engine]), None)
+        out = list(strategy._detect_text_in_frames(self._frames(3)))
+        assert engine.batches == [3] and engine.singles == 0
+        assert [ts for _, ts, _ in out] == ["ts0", "ts1", "ts2"]
+
+    def test_mixed_frame_shapes_fall_back_to_lazy_detection(self):
+        engine = _BatchingTextEngine()
+        strategy = TextDetectionStrategy(MagicMock(), InstanceFallback([engine]), None)
+        frames = self._frames(2) + [(np.zeros((4, 6, 3), dtype=np.uint8), "ts2")]
+        out = list(strategy._detect_text_in_frames(frames))
+        assert engine.batches == [] and engine.singles == 3
+        assert [ts for _, ts, _ in out] == ["ts0", "ts1", "ts2"]
+
+    def test_non_batching_engine_is_lazy(self):
+        engine = _BatchingTextEngine()
+        engine.supports_batched_detection = False
+        strategy = TextDetectionStrategy(MagicMock(), InstanceFallback([engine]), None)
+        frames_iter = strategy._detect_text_in_frames(self._frames(3))
+        next(frames_iter)
+        assert engine.singles == 1 and engine.batches == []
+
+
 class TestAssertPresenceContract:
     """assert_presence input validation."""
 
@@ -553,18 +668,18 @@ class TestAllocTimeForStrategy:
     """_alloc_time_for_strategy splits the remaining budget across strategies."""
 
     def test_even_division_rounds_up(self, monkeypatch):
-        monkeypatch.setattr(time, "time", lambda: 1000.0)
+        monkeypatch.setattr(time, "monotonic", lambda: 1000.0)
         alloc, remaining, n = _sm(MagicMock())._alloc_time_for_strategy(1010.0, 0, [1, 2, 3])
         assert alloc == 4  # ceil(10 / 3)
         assert n == 3
 
     def test_no_time_left_returns_none(self, monkeypatch):
-        monkeypatch.setattr(time, "time", lambda: 1000.0)
+        monkeypatch.setattr(time, "monotonic", lambda: 1000.0)
         # deadline already passed
         assert _sm(MagicMock())._alloc_time_for_strategy(999.0, 0, [1, 2]) is None
 
     def test_last_strategy_gets_remainder_even_if_sub_second(self, monkeypatch):
-        monkeypatch.setattr(time, "time", lambda: 1000.0)
+        monkeypatch.setattr(time, "monotonic", lambda: 1000.0)
         # 0.4s left, last strategy (idx 1 of 2): alloc rounds to 0 but the last one still runs.
         result = _sm(MagicMock())._alloc_time_for_strategy(1000.4, 1, [1, 2])
         assert result is not None
@@ -20,6 +20,7 @@ built via ``__new__`` and wired with the minimal collaborators (real ``ElementDa
 a real ``NullResultPrinter``, and a tiny fake event manager) so the assertions stay
 behaviour-focused rather than call-order-focused.
 """
+import threading
 import time
 from types import SimpleNamespace
 
@@ -42,6 +43,7 @@ from optics_framework.common.runner.printers import (
 # classes and emit PytestCollectionWarning.
 from optics_framework.common.runner.printers import TestCaseResult as _TestCaseResult
 from optics_framework.common.runner.test_runnner import TestRunner as _TestRunner
+from optics_framework.common.runner.keyword_register import keyword_slug
 
 
 # --------------------------------------------------------------------------- #
@@ -246,6 +248,12 @@ class TestFallbackSuccess:
         assert await _run_fallback(runner, method, [["only"]]) is True
         assert method.calls == [(("only",), {})]
 
+    async def test_keyword_runs_off_the_event_loop_thread(self):
+        runner = _make_runner()
+        threads = []
+        assert await _run_fallback(runner, lambda: threads.append(threading.get_ident()), []) is True
+        assert threads and threads[0] != threading.get_ident()
+
     async def test_advances_to_later_candidate_on_x0201(self):
         runner = _make_runner()
         # succeeds only when called with the second value
@@ -413,3 +421,24 @@ class TestExecuteKeywordNameResolution:
         assert ok is False
         assert called == []                 # never dispatched — element unresolved
         assert kw_result.status == "FAIL"
+
+
+def test_keyword_slug_normalises_display_names():
+    assert keyword_slug("  Press   Element ") == "press_element"
+    assert keyword_slug("PRESS ELEMENT") == "press_element"
+
+
+async def test_run_all_returns_pass_and_not_passed_counts():
+    runner = _make_runner()
+    runner.test_cases = SimpleNamespace(
+        name="a", next=SimpleNamespace(
+            name="b", next=SimpleNamespace(name="c", next=None)))
+    statuses = {"a": "PASS", "b": "FAIL", "c": "PASS"}
+
+    async def execute_test_case(name):
+        return SimpleNamespace(status=statuses[name])
+
+    runner.execute_test_case = execute_test_case
+    runner._capture_end_of_run_artifacts = lambda: None
+
+    assert await runner.run_all() == (2, 1)
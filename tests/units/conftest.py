@@ -9,6 +9,7 @@ from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
+import requests
 
 from optics_framework.common.driver_interface import DriverInterface
 from optics_framework.common.models import ElementData
@@ -38,7 +39,7 @@ def mock_runner():
 
 
 class _FakeResponse:
-    """A minimal stand-in for a ``requests.Response`` used by invoke_api tests."""
+    """A minimal stand-in for a ``requests.Response`` used by HTTP client tests."""
 
     def __init__(self, json_data=None, status_code=200, text=None, content_type="application/json"):
         self._json_data = json_data
@@ -48,6 +49,10 @@ class _FakeResponse:
         self.text = text if text is not None else (str(json_data) if json_data is not None else "")
         self.content = self.text.encode()
 
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} {self.reason}", response=self)
+
     def json(self):
         if self._json_data is None:
             raise json.JSONDecodeError("Expecting value", self.text, 0)
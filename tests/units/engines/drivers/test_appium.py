@@ -0,0 +1,72 @@
+"""Unit tests for the Appium driver's platform guards and cached lookups."""
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from optics_framework.engines.drivers import appium as appium_module
+from optics_framework.engines.drivers.appium import Appium
+
+
+def _appium(platform_name="Android"):
+    return Appium(
+        config={"capabilities": {"platformName": platform_name}},
+        event_sdk=MagicMock(),
+    )
+
+
+def test_invalidate_ui_cache_is_unguarded_on_tv():
+    appium = _appium("TizenTV")
+    appium.ui_helper = MagicMock()
+    assert appium._active_platform() == "tizentv"
+
+    appium.invalidate_ui_cache()
+
+    appium.ui_helper.invalidate_page_source.assert_called_once()
+    assert not hasattr(Appium.invalidate_ui_cache, "_supported_platforms")
+
+
+def test_click_element_stays_mobile_only():
+    assert Appium.click_element._supported_platforms == {"android", "ios"}
+
+
+PORTRAIT = {"width": 1080, "height": 2400}
+LANDSCAPE = {"width": 2400, "height": 1080}
+
+
+def _session(session_id="s1", *sizes):
+    appium = _appium()
+    appium.driver = MagicMock()
+    appium.driver.session_id = session_id
+    appium.driver.get_window_size.side_effect = list(sizes)
+    return appium
+
+
+def test_window_size_is_reused_within_a_session():
+    appium = _session("s1", PORTRAIT)
+    assert appium._window_size() == PORTRAIT
+    assert appium._window_size() == PORTRAIT
+    appium.driver.get_window_size.assert_called_once()
+
+
+def test_window_size_is_refetched_for_a_new_session():
+    appium = _session("s1", PORTRAIT, LANDSCAPE)
+    appium._window_size()
+    appium.driver.session_id = "s2"
+    assert appium._window_size() == LANDSCAPE
+    assert appium.driver.get_window_size.call_count == 2
+
+
+def test_window_size_expires_after_ttl():
+    appium = _session("s1", PORTRAIT, LANDSCAPE)
+    with patch.object(appium_module.time, "monotonic", side_effect=[0.0, appium_module._WINDOW_SIZE_TTL_S + 1]):
+        appium._window_size()
+        assert appium._window_size() == LANDSCAPE
+
+
+def test_rotated_screenshot_forces_refetch():
+    appium = _session("s1", PORTRAIT, LANDSCAPE)
+    appium._window_size()
+    landscape_frame = np.zeros((540, 1200, 3), dtype=np.uint8)
+
+    assert appium.pixel_2_appium(600, 270, landscape_frame) == (1200, 540)
+    assert appium.driver.get_window_size.call_count == 2
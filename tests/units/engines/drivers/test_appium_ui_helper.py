@@ -0,0 +1,56 @@
+"""Unit tests for UIHelper page-source reuse."""
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from optics_framework.common import utils
+from optics_framework.engines.drivers.appium_UI_helper import UIHelper
+
+XML = '<hierarchy><android.widget.TextView text="Login"/></hierarchy>'
+
+
+@pytest.fixture
+def helper():
+    appium = MagicMock()
+    page_source = PropertyMock(return_value=XML)
+    type(appium.driver).page_source = page_source
+    with patch("optics_framework.engines.drivers.appium_UI_helper.utils.save_page_source"):
+        yield UIHelper(appium), page_source
+
+
+def test_page_source_reused_within_ttl(helper):
+    ui_helper, page_source = helper
+    ui_helper.get_page_source()
+    ui_helper.get_page_source()
+    assert page_source.call_count == 1
+    assert ui_helper.tree is not None
+
+
+def test_invalidate_forces_refetch(helper):
+    ui_helper, page_source = helper
+    ui_helper.get_page_source()
+    ui_helper.invalidate_page_source()
+    ui_helper.get_page_source()
+    assert page_source.call_count == 2
+
+
+def test_zero_ttl_always_refetches(helper):
+    ui_helper, page_source = helper
+    ui_helper.page_source_ttl = 0
+    ui_helper.get_page_source()
+    ui_helper.get_page_source()
+    assert page_source.call_count == 2
+
+
+def test_interactive_elements_reuse_parsed_snapshot(helper):
+    ui_helper, page_source = helper
+    page_source.return_value = (
+        '<hierarchy><android.widget.Button text="OK" bounds="[0,0][10,10]"/></hierarchy>'
+    )
+    with patch(
+        "optics_framework.engines.drivers.appium_UI_helper.utils.parse_page_source_xml",
+        wraps=utils.parse_page_source_xml,
+    ) as parse:
+        elements = ui_helper.get_interactive_elements()
+    assert parse.call_count == 1
+    assert [e["text"] for e in elements] == ["OK"]
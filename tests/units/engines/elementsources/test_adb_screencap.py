@@ -0,0 +1,79 @@
+"""Unit tests for AdbScreencap (adb exec-out screencap with Appium fallback)."""
+import base64
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import cv2
+import numpy as np
+import pytest
+
+from optics_framework.engines.elementsources import adb_screencap
+from optics_framework.engines.elementsources.adb_screencap import AdbScreencap
+
+PNG = cv2.imencode(".png", np.zeros((4, 3, 3), dtype=np.uint8))[1].tobytes()
+
+
+@pytest.fixture
+def source():
+    driver = MagicMock()
+    driver._get_android_device_serial.return_value = "emulator-5554"
+    driver.driver.get_screenshot_as_base64.return_value = base64.b64encode(PNG).decode()
+    return AdbScreencap(driver=driver)
+
+
+def _completed(stdout=PNG, returncode=0):
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=stdout, stderr=b"")
+
+
+def test_capture_streams_png_from_adb(source):
+    with patch.object(adb_screencap.subprocess, "run", return_value=_completed()) as run:
+        frame = source.capture()
+
+    assert run.call_args.args[0] == ["adb", "-s", "emulator-5554", "exec-out", "screencap", "-p"]
+    assert frame.shape == (4, 3, 3)
+    source.driver.driver.get_screenshot_as_base64.assert_not_called()
+
+
+def test_falls_back_to_appium_when_screencap_fails(source):
+    with patch.object(adb_screencap.subprocess, "run",
+                      return_value=_completed(stdout=b"error: device offline", returncode=1)):
+        assert source.capture_screenshot_bytes() == PNG
+
+    source.driver.driver.get_screenshot_as_base64.assert_called_once()
+
+
+def test_missing_adb_is_not_retried(source):
+    with patch.object(adb_screencap.subprocess, "run", side_effect=FileNotFoundError) as run:
+        source.capture_screenshot_bytes()
+        source.capture_screenshot_bytes()
+
+    run.assert_called_once()
+    assert source.driver.driver.get_screenshot_as_base64.call_count == 2
+
+
+def test_timeout_disables_adb_for_the_session(source):
+    timeout = subprocess.TimeoutExpired(cmd="adb", timeout=adb_screencap._SCREENCAP_TIMEOUT_S)
+    with patch.object(adb_screencap.subprocess, "run", side_effect=timeout) as run:
+        assert source.capture_screenshot_bytes() == PNG
+        assert source.capture_screenshot_bytes() == PNG
+
+    run.assert_called_once()
+    assert source.driver.driver.get_screenshot_as_base64.call_count == 2
+
+
+def test_repeated_screencap_failures_disable_adb(source):
+    failed = _completed(stdout=b"error: device unauthorized", returncode=1)
+    with patch.object(adb_screencap.subprocess, "run", return_value=failed) as run:
+        for _ in range(4):
+            source.capture_screenshot_bytes()
+
+    assert run.call_count == adb_screencap._MAX_CONSECUTIVE_FAILURES
+
+
+def test_success_resets_failure_count(source):
+    failed = _completed(stdout=b"error: device offline", returncode=1)
+    with patch.object(adb_screencap.subprocess, "run", side_effect=[failed, _completed(), failed, _completed()]) as run:
+        for _ in range(4):
+            source.capture_screenshot_bytes()
+
+    assert run.call_count == 4
@@ -0,0 +1,106 @@
+"""Unit tests for AppiumPageSource page-source parsing and text search."""
+import itertools
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from optics_framework.engines.elementsources import appium_page_source
+from optics_framework.engines.elementsources.appium_page_source import AppiumPageSource
+
+XML = (
+    '<hierarchy>'
+    '<android.widget.TextView text="Login" resource-id="com.app:id/title"/>'
+    '<android.widget.Button content-desc="Cancel"/>'
+    '</hierarchy>'
+)
+
+
+@pytest.fixture
+def source():
+    driver = MagicMock()
+    driver.driver.page_source = XML
+    return AppiumPageSource(driver=driver)
+
+
+def test_identical_page_source_is_parsed_once(source):
+    with patch.object(appium_page_source.etree, "fromstring",
+                      wraps=appium_page_source.etree.fromstring) as fromstring:
+        source.get_page_source()
+        first_root = source.root
+        source.get_page_source()
+
+    fromstring.assert_called_once()
+    assert source.root is first_root
+    assert source.root.tag == "hierarchy"
+
+
+def test_changed_page_source_is_reparsed(source):
+    source.get_page_source()
+    source.driver.driver.page_source = XML.replace("Login", "Logout")
+    source.get_page_source()
+
+    assert source.ui_text_search(["Logout"])
+    assert not source.ui_text_search(["Login"])
+
+
+def test_parse_cache_is_bounded(source):
+    for i in range(appium_page_source._PARSE_CACHE_ENTRIES + 2):
+        source.driver.driver.page_source = XML.replace("Login", f"Login{i}")
+        source.get_page_source()
+
+    assert len(source._parse_cache) == appium_page_source._PARSE_CACHE_ENTRIES
+
+
+@pytest.mark.parametrize("texts, rule, expected", [
+    (["login"], "any", True),                    # case-insensitive exact
+    (["title"], "any", True),                    # substring of resource-id
+    (["Cancle"], "any", True),                   # fuzzy match on content-desc
+    (["Missing", "Cancel"], "any", True),
+    (["Login", "Cancel"], "all", True),
+    (["Login", "Missing"], "all", False),
+    (["Missing"], "any", False),
+])
+def test_ui_text_search_rules(source, texts, rule, expected):
+    source.get_page_source()
+    assert source.ui_text_search(texts, rule) is expected
+
+
+
+def test_assert_elements_backs_off_between_polls(source):
+    clock = itertools.count()
+    with patch.object(appium_page_source.time, "monotonic", side_effect=lambda: next(clock) * 0.01), \
+            patch.object(appium_page_source.time, "sleep") as sleep:
+        with pytest.raises(TimeoutError):
+            source.assert_elements(["Missing"], timeout=1)
+
+    delays = [c.args[0] for c in sleep.call_args_list]
+    assert delays[:5] == [0.05, 0.1, 0.2, 0.4, 0.5]
+
+
+def test_assert_elements_classifies_each_element_once(source):
+    with patch.object(appium_page_source.utils, "determine_element_type", wraps=appium_page_source.utils.determine_element_type) as classify:
+        assert source.assert_elements(["Login", "//android.widget.Button"], timeout=1, rule="all")[0] is True
+    assert classify.call_count == 2
+
+
+def test_page_source_parsed_without_blank_text(source):
+    source.driver.driver.page_source = '<hierarchy>\n  <node text="A"/>\n  <!-- c -->\n  <node text="B"/>\n</hierarchy>'
+    source.get_page_source()
+    nodes = list(source.root)
+    assert [n.get("text") for n in nodes] == ["A", "B"]
+    assert source.root.text is None and all(n.tail is None for n in nodes)
+
+
+def test_assert_elements_matches_xpaths_on_fetched_tree(source):
+    ok, _ = source.assert_elements(
+        ["//android.widget.Button", "//*[@resource-id='com.app:id/title']"], timeout=1, rule="all"
+    )
+    assert ok is True
+    source.driver.ui_helper.find_xpath.assert_not_called()
+
+
+def test_assert_elements_falls_back_to_fuzzy_xpath_match(source):
+    source.driver.ui_helper.find_xpath.return_value = ("//android.widget.Button[1]", "ts")
+    ok, _ = source.assert_elements(["//android.widget.Buton"], timeout=1)
+    assert ok is True
+    source.driver.ui_helper.find_xpath.assert_called_once_with("//android.widget.Buton")
@@ -0,0 +1,31 @@
+"""Unit tests for the EasyOCR backend's batched detection, with ``easyocr`` stubbed via ``sys.modules``."""
+import importlib
+import sys
+import types
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+MODULE = "optics_framework.engines.vision_models.ocr_models.easyocr"
+BBOX = [[10, 5], [30, 5], [30, 15], [10, 15]]
+
+
+@pytest.fixture
+def helper(monkeypatch):
+    stub = types.ModuleType("easyocr")
+    stub.Reader = MagicMock(name="Reader")
+    monkeypatch.setitem(sys.modules, "easyocr", stub)
+    sys.modules.pop(MODULE, None)
+    module = importlib.import_module(MODULE)
+    yield module.EasyOCRHelper({"execution_output_path": ""})
+    sys.modules.pop(MODULE, None)
+
+
+def test_blank_frame_does_not_fail_the_batch(helper):
+    helper.reader.readtext_batched.return_value = [[(BBOX, "Login", 0.9)], []]
+    frames = [np.zeros((40, 60, 3), dtype=np.uint8)] * 2
+
+    detections = helper.detect_text_batch(frames)
+
+    assert detections == [("Login", [(BBOX, "Login", 0.9)]), ("", [])]
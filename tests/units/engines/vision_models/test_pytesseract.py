@@ -0,0 +1,74 @@
+"""Unit tests for the Pytesseract OCR backend's per-frame result cache."""
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytesseract")
+
+from optics_framework.engines.vision_models.ocr_models import pytesseract as ocr_module
+from optics_framework.engines.vision_models.ocr_models.pytesseract import PytesseractHelper
+
+
+def _tesseract_data(*words):
+    """Minimal image_to_data DICT output with one box per word."""
+    return {
+        "text": list(words),
+        "left": [10 * i for i in range(len(words))],
+        "top": [5] * len(words),
+        "width": [8] * len(words),
+        "height": [4] * len(words),
+        "conf": ["90"] * len(words),
+    }
+
+
+@pytest.fixture
+def helper(tmp_path):
+    return PytesseractHelper({"execution_output_path": str(tmp_path)})
+
+
+def _frame(value=0):
+    return np.full((40, 60, 3), value, dtype=np.uint8)
+
+
+def test_same_frame_runs_tesseract_once(helper):
+    frame = _frame()
+    with patch.object(ocr_module.pytesseract, "image_to_data",
+                      return_value=_tesseract_data("Login", "Cancel")) as image_to_data:
+        assert helper.find_element(frame, "login")[0] is True
+        assert helper.find_element(frame, "cancel")[0] is True
+
+    image_to_data.assert_called_once()
+
+
+def test_find_element_does_not_mutate_caller_frame(helper):
+    frame = _frame()
+    with patch.object(ocr_module.pytesseract, "image_to_data", return_value=_tesseract_data("Login")):
+        helper.find_element(frame, "Login")
+
+    assert not frame.any()
+
+
+def test_cache_evicts_oldest_frame(helper):
+    with patch.object(ocr_module.pytesseract, "image_to_data",
+                      return_value=_tesseract_data("Login")) as image_to_data:
+        for value in range(ocr_module._OCR_CACHE_FRAMES + 1):
+            helper.detect_text(_frame(value))
+        helper.detect_text(_frame(0))
+
+    assert image_to_data.call_count == ocr_module._OCR_CACHE_FRAMES + 2
+
+
+def test_persistent_cache_reused_by_new_instance(tmp_path):
+    config = {
+        "execution_output_path": str(tmp_path),
+        "capabilities": {"persistent_cache": True, "cache_path": str(tmp_path / "cv.sqlite3")},
+    }
+    frame = _frame()
+    with patch.object(ocr_module.pytesseract, "image_to_data",
+                      return_value=_tesseract_data("Login")) as image_to_data:
+        PytesseractHelper(config).detect_text(frame)
+        _, results = PytesseractHelper(config).detect_text(frame)
+
+    image_to_data.assert_called_once()
+    assert results == [([(0, 5), (8, 5), (8, 9), (0, 9)], "Login", 90.0)]
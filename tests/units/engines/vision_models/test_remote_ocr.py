@@ -0,0 +1,19 @@
+"""Unit tests for the remote OCR client's pooled HTTP session."""
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from optics_framework.engines.vision_models.ocr_models.remote_ocr import RemoteOCR
+
+
+def test_detect_text_reuses_one_http_session(fake_response):
+    ocr = RemoteOCR({"url": "http://ocr.local", "capabilities": {}})
+    ocr._http = MagicMock()
+    ocr._http.post.return_value = fake_response(json_data={"results": []})
+
+    frame = np.zeros((4, 4, 3), dtype=np.uint8)
+    ocr.detect_text(frame)
+    ocr.detect_text(frame)
+
+    assert ocr._http.post.call_count == 2
+    assert ocr._http.post.call_args.args[0] == "http://ocr.local/detect-text"
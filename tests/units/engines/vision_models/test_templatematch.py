@@ -0,0 +1,55 @@
+"""Unit tests for the SIFT-based templatematch image backend."""
+from unittest.mock import MagicMock, patch
+
+import cv2
+import numpy as np
+import pytest
+
+from optics_framework.engines.vision_models.image_models import templatematch
+from optics_framework.engines.vision_models.image_models.templatematch import TemplateMatchingHelper
+
+
+@pytest.fixture
+def scene(tmp_path):
+    """Textured frame plus a template cut out of it at a known position."""
+    rng = np.random.default_rng(0)
+    frame = cv2.GaussianBlur(rng.integers(0, 255, (600, 400, 3), dtype=np.uint8), (5, 5), 0)
+    template_file = tmp_path / "button.png"
+    cv2.imwrite(str(template_file), frame[200:320, 100:260])
+    templates = MagicMock()
+    templates.get_template_path.return_value = str(template_file)
+    return frame, TemplateMatchingHelper({"templates": templates})
+
+
+def test_find_element_locates_template(scene):
+    frame, helper = scene
+    found, (x, y), (top_left, bottom_right) = helper.find_element(frame, "button.png")
+
+    assert found is True
+    assert abs(x - 180) <= 2 and abs(y - 260) <= 2
+    assert abs(int(top_left[0]) - 100) <= 2 and abs(int(bottom_right[1]) - 320) <= 2
+
+
+def test_template_is_loaded_once_per_path(scene):
+    frame, helper = scene
+    with patch.object(templatematch, "load_template", wraps=templatematch.load_template) as load:
+        helper.find_element(frame, "button.png")
+        helper.find_element(frame, "button.png", index=1)
+
+    load.assert_called_once()
+
+
+def test_frame_is_described_once_across_lookups(scene):
+    frame, helper = scene
+    with patch.object(templatematch.cv2, "cvtColor", wraps=cv2.cvtColor) as to_gray:
+        helper.find_element(frame, "button.png")
+        helper.find_element(frame.copy(), "button.png", index=1)
+
+    # One conversion for the template, one for the frame; the second lookup hits both caches.
+    assert to_gray.call_count == 2
+
+
+def test_index_beyond_inliers_raises(scene):
+    frame, helper = scene
+    with pytest.raises(IndexError):
+        helper.find_element(frame, "button.png", index=100000)
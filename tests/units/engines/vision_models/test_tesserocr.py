@@ -0,0 +1,101 @@
+"""Unit tests for the tesserocr OCR backend, with ``tesserocr`` stubbed via ``sys.modules``."""
+import importlib
+import sys
+import types
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from optics_framework.common.error import Code, OpticsError
+from optics_framework.common.factories import TextFactory
+
+MODULE = "optics_framework.engines.vision_models.ocr_models.tesserocr"
+
+
+class _Word:
+    def __init__(self, text, box, conf=91.0):
+        self._text, self._box, self._conf = text, box, conf
+
+    def GetUTF8Text(self, level):
+        return self._text
+
+    def BoundingBox(self, level):
+        return self._box
+
+    def Confidence(self, level):
+        return self._conf
+
+
+WORDS = [
+    _Word("Login", (10, 5, 30, 15)),
+    _Word("Cancel", (40, 5, 58, 15)),
+    _Word("   ", (0, 0, 1, 1)),  # blank words are dropped
+]
+
+
+@pytest.fixture
+def stub_tesserocr(monkeypatch):
+    stub = types.ModuleType("tesserocr")
+    stub.PyTessBaseAPI = MagicMock(name="PyTessBaseAPI")
+    stub.PSM = types.SimpleNamespace(SINGLE_BLOCK=6)
+    stub.RIL = types.SimpleNamespace(WORD=3)
+    stub.iterate_level = MagicMock(side_effect=lambda iterator, level: iter(WORDS))
+    monkeypatch.setitem(sys.modules, "tesserocr", stub)
+    sys.modules.pop(MODULE, None)
+    yield stub
+    sys.modules.pop(MODULE, None)
+
+
+@pytest.fixture
+def helper(stub_tesserocr, tmp_path):
+    module = importlib.import_module(MODULE)
+    with patch.object(module.utils, "save_screenshot"):
+        yield module.TesserocrHelper({"execution_output_path": str(tmp_path)})
+
+
+def _frame(value=0):
+    return np.full((40, 60, 3), value, dtype=np.uint8)
+
+
+def test_detect_text_returns_binary_image_and_word_boxes(helper):
+    binary_image, detected = helper.detect_text(_frame())
+
+    assert binary_image.shape == (40, 60)
+    assert detected == [
+        ([(10, 5), (30, 5), (30, 15), (10, 15)], "Login", 91.0),
+        ([(40, 5), (58, 5), (58, 15), (40, 15)], "Cancel", 91.0),
+    ]
+
+
+def test_find_element_hit_returns_center_and_bbox(helper):
+    found, center, bbox = helper.find_element(_frame(), "login")
+
+    assert found is True
+    assert center == (20, 10)
+    assert bbox == ((10, 5), (30, 15))
+
+
+@pytest.mark.parametrize("text, index", [("Submit", None), ("Login", 1)])
+def test_find_element_miss(helper, text, index):
+    assert helper.find_element(_frame(), text, index=index) == (False, (None, None), None)
+
+
+def test_identical_frame_reuses_cached_result(helper, stub_tesserocr):
+    helper.find_element(_frame(), "Login")
+    helper.find_element(_frame(), "Cancel")
+    assert helper._api.Recognize.call_count == 1
+
+    helper.detect_text(_frame(255))
+    assert helper._api.Recognize.call_count == 2
+
+
+def test_missing_tesserocr_is_reported_as_unknown_module(monkeypatch):
+    monkeypatch.setitem(sys.modules, "tesserocr", None)
+    sys.modules.pop(MODULE, None)
+
+    with pytest.raises(ModuleNotFoundError):
+        importlib.import_module(MODULE)
+    with pytest.raises(OpticsError) as exc_info:
+        TextFactory._load_module("tesserocr", TextFactory.DEFAULT_PACKAGE)
+    assert exc_info.value.code == Code.E0601